@@ -0,0 +1,564 @@
+#!/usr/bin/env python3
+"""
+Pruebas de rendimiento de los solucionadores
+Compara el nucleo vectorizado de Gauss-Jordan con la eliminacion fila a fila original
+el costo de cada nivel de registro de pasos y el metodo por bloques
+"""
+
+import time
+import numpy as np
+from gauss_jordan import GaussJordan, METODO_BLOQUES, METODO_EXACTO, METODO_MODULAR
+from gauss_jordan_lotes import GaussJordanLotes
+from gauss_jordan_disperso import GaussJordanDisperso, MatrizCSR
+from gauss_jordan_gf2 import GaussJordanGF2, empaquetar_bits
+from gauss_jordan_incremental import SesionGaussJordan
+from gauss_elimination_mejorado import GaussEliminationMejorado
+from gauss_elimination_banda import BandedMatrix, GaussEliminationBanda
+from espacio_trabajo import EspacioTrabajo
+from independencia_lineal import IndependenciaIncremental, IndependenciaLineal, IndependenciaLotes
+from modular_exacto import rango_modular
+from registro_pasos import NIVELES_REGISTRO, REGISTRO_NINGUNO
+
+
+def eliminacion_fila_a_fila(matriz: np.ndarray, vector: np.ndarray) -> np.ndarray:
+    """Reduccion de Gauss-Jordan con el bucle original (una resta por fila)."""
+    m, n = matriz.shape
+    aumentada = np.column_stack((matriz.astype(float), vector.astype(float)))
+
+    fila_actual = 0
+    for col in range(n):
+        max_val = 0
+        fila_pivote = -1
+        for i in range(fila_actual, m):
+            if abs(aumentada[i, col]) > max_val:
+                max_val = abs(aumentada[i, col])
+                fila_pivote = i
+        if max_val <= 1e-10:
+            continue
+
+        if fila_pivote != fila_actual:
+            aumentada[[fila_actual, fila_pivote]] = aumentada[[fila_pivote, fila_actual]]
+
+        pivote = aumentada[fila_actual, col]
+        if abs(pivote - 1.0) > 1e-10:
+            aumentada[fila_actual] = aumentada[fila_actual] / pivote
+
+        for i in range(m):
+            if i != fila_actual and abs(aumentada[i, col]) > 1e-10:
+                factor = aumentada[i, col]
+                aumentada[i] = aumentada[i] - factor * aumentada[fila_actual]
+
+        fila_actual += 1
+        if fila_actual >= m:
+            break
+
+    return aumentada
+
+
+def medir(funcion, repeticiones: int = 3) -> float:
+    """Devuelve el mejor tiempo (en segundos) de varias ejecuciones."""
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def benchmark_eliminacion(tamanos=(50, 100, 200, 400)):
+    """Compara el bucle fila a fila con la actualizacion de rango 1."""
+    print("=" * 60)
+    print("GAUSS-JORDAN: BUCLE FILA A FILA vs ACTUALIZACION DE RANGO 1")
+    print("=" * 60)
+    print(f"{'n':>6} {'bucle (s)':>12} {'rango 1 (s)':>12} {'aceleracion':>12}")
+
+    generador = np.random.default_rng(0)
+    for n in tamanos:
+        matriz = generador.standard_normal((n, n))
+        vector = generador.standard_normal(n)
+
+        t_bucle = medir(lambda: eliminacion_fila_a_fila(matriz, vector))
+        t_vectorizado = medir(lambda: GaussJordan(REGISTRO_NINGUNO).resolver(matriz, vector))
+
+        print(f"{n:>6} {t_bucle:>12.4f} {t_vectorizado:>12.4f} {t_bucle / t_vectorizado:>11.1f}x")
+    print()
+
+
+def benchmark_registro(n: int = 150):
+    """Tiempo de resolucion y memoria de pasos para cada nivel de registro."""
+    print("=" * 60)
+    print(f"NIVELES DE REGISTRO DE PASOS (sistema {n}x{n})")
+    print("=" * 60)
+    print(f"{'nivel':>12} {'tiempo (s)':>12} {'pasos (MB)':>12} {'copias (MB)':>12}")
+
+    generador = np.random.default_rng(0)
+    matriz = generador.standard_normal((n, n))
+    vector = generador.standard_normal(n)
+
+    for nivel in NIVELES_REGISTRO:
+        solver = GaussJordan(nivel)
+        tiempo = medir(lambda: solver.resolver(matriz, vector))
+        memoria = solver.pasos.memoria_bytes() / 2**20
+        copias = len(solver.pasos) * (n * (n + 1) * 8) / 2**20  # Copia completa por paso
+        print(f"{nivel:>12} {tiempo:>12.4f} {memoria:>12.2f} {copias:>12.2f}")
+    print()
+
+
+def benchmark_bloques(tamanos=(200, 400, 800, 1200), tam_bloque: int = 64):
+    """Barrido de tamanos: metodo estandar (rango 1) frente al metodo por bloques (BLAS-3)."""
+    print("=" * 60)
+    print(f"GAUSS-JORDAN: ESTANDAR vs BLOQUES (panel de {tam_bloque} columnas)")
+    print("=" * 60)
+    print(f"{'n':>6} {'estandar (s)':>13} {'bloques (s)':>12} {'aceleracion':>12}")
+
+    generador = np.random.default_rng(0)
+    for n in tamanos:
+        matriz = generador.standard_normal((n, n))
+        vector = generador.standard_normal(n)
+
+        estandar = GaussJordan(REGISTRO_NINGUNO)
+        bloques = GaussJordan(REGISTRO_NINGUNO, metodo=METODO_BLOQUES, tam_bloque=tam_bloque)
+        t_estandar = medir(lambda: estandar.resolver(matriz, vector), repeticiones=2)
+        t_bloques = medir(lambda: bloques.resolver(matriz, vector), repeticiones=2)
+
+        print(f"{n:>6} {t_estandar:>13.4f} {t_bloques:>12.4f} {t_estandar / t_bloques:>11.1f}x")
+    print()
+
+
+def benchmark_multiples_lados(n: int = 200, k: int = 100):
+    """Una sola reduccion con k lados derechos frente a k resoluciones separadas."""
+    print("=" * 60)
+    print(f"MULTIPLES LADOS DERECHOS ({n}x{n}, k = {k})")
+    print("=" * 60)
+
+    generador = np.random.default_rng(0)
+    matriz = generador.standard_normal((n, n))
+    lados = generador.standard_normal((n, k))
+    solver = GaussJordan(REGISTRO_NINGUNO)
+
+    t_separado = medir(lambda: [solver.resolver(matriz, lados[:, j]) for j in range(k)], repeticiones=1)
+    t_bloque = medir(lambda: solver.resolver(matriz, lados))
+
+    print(f"k resoluciones: {t_separado:.4f} s")
+    print(f"una pasada:     {t_bloque:.4f} s  ({t_separado / t_bloque:.1f}x)")
+    print()
+
+
+def benchmark_factorizacion(n: int = 150, k: int = 30):
+    """Factorizar una vez y resolver k vectores frente a k llamadas completas a solve."""
+    print("=" * 60)
+    print(f"FACTORIZACION REUTILIZABLE ({n}x{n}, k = {k})")
+    print("=" * 60)
+
+    generador = np.random.default_rng(0)
+    matriz = generador.standard_normal((n, n))
+    lados = generador.standard_normal((k, n))
+    solver = GaussEliminationMejorado(REGISTRO_NINGUNO)
+
+    t_solve = medir(lambda: [solver.solve(matriz, b) for b in lados], repeticiones=1)
+    t_factorizar = medir(lambda: solver.factorizar(matriz), repeticiones=1)
+    factorizacion = solver.factorizar(matriz)
+    t_resolver = medir(lambda: [factorizacion.resolver(b) for b in lados])
+
+    print(f"k llamadas a solve:        {t_solve:.4f} s")
+    print(f"factorizar + k resolver:   {t_factorizar + t_resolver:.4f} s "
+          f"(por vector: {t_resolver / k * 1e3:.2f} ms)")
+    print()
+
+
+def benchmark_precision_mixta(tamanos=(200, 500, 1000)):
+    """Factorizacion float32 con refinamiento frente a solve en float64."""
+    print("=" * 60)
+    print("PRECISION MIXTA (FLOAT32 + REFINAMIENTO) FRENTE A FLOAT64")
+    print("=" * 60)
+    print(f"{'n':>6} {'float64 (s)':>12} {'mixta (s)':>10} {'iteraciones':>12} {'error float64':>14} {'error mixta':>12}")
+
+    generador = np.random.default_rng(0)
+    solver = GaussEliminationMejorado(REGISTRO_NINGUNO)
+    for n in tamanos:
+        matriz = generador.standard_normal((n, n)) + np.sqrt(n) * np.eye(n)
+        x = generador.standard_normal(n)
+        vector = matriz @ x
+        t_doble = medir(lambda: solver.solve(matriz, vector), repeticiones=1)
+        t_mixta = medir(lambda: solver.solve_mixed_precision(matriz, vector), repeticiones=1)
+        error_doble = np.max(np.abs(solver.solve(matriz, vector)[0] - x))
+        error_mixta = np.max(np.abs(solver.solve_mixed_precision(matriz, vector)[0] - x))
+        print(f"{n:>6} {t_doble:>12.4f} {t_mixta:>10.4f} {solver.refinement_iterations:>12} "
+              f"{error_doble:>14.2e} {error_mixta:>12.2e}")
+    print()
+
+
+def benchmark_lotes(N: int = 20000, n: int = 6, muestra: int = 2000):
+    """Lote de N sistemas pequenos frente a un bucle de llamadas a GaussJordan.resolver."""
+    print("=" * 60)
+    print(f"LOTE DE {N} SISTEMAS {n}x{n}")
+    print("=" * 60)
+
+    generador = np.random.default_rng(0)
+    matrices = generador.standard_normal((N, n, n))
+    vectores = generador.standard_normal((N, n))
+    solver = GaussJordan(REGISTRO_NINGUNO)
+
+    # El bucle se mide sobre una muestra y se extrapola al lote completo
+    t_bucle = medir(lambda: [solver.resolver(matrices[k], vectores[k]) for k in range(muestra)],
+                    repeticiones=1) * N / muestra
+    t_lote = medir(lambda: GaussJordanLotes().resolver(matrices, vectores))
+
+    print(f"bucle (estimado): {t_bucle:.4f} s ({t_bucle / N * 1e6:.1f} us por sistema)")
+    print(f"lote:             {t_lote:.4f} s ({t_lote / N * 1e6:.1f} us por sistema, {t_bucle / t_lote:.1f}x)")
+    print()
+
+
+def benchmark_disperso(tamanos=(500, 1000, 2000), conexiones: int = 3):
+    """Matrices tipo red (pocos no nulos por fila): motor disperso frente al denso."""
+    print("=" * 60)
+    print(f"MATRICES DISPERSAS (red con {conexiones} conexiones por nodo)")
+    print("=" * 60)
+    print(f"{'n':>6} {'no nulos':>10} {'denso (s)':>12} {'disperso (s)':>13} {'aceleracion':>12}")
+
+    generador = np.random.default_rng(0)
+    for n in tamanos:
+        origen = np.repeat(np.arange(n), conexiones)
+        destino = generador.integers(0, n, size=n * conexiones)
+        filas = np.concatenate([np.arange(n), origen])
+        columnas = np.concatenate([np.arange(n), destino])
+        valores = np.concatenate([np.full(n, conexiones + 1.0), np.full(n * conexiones, -1.0)])
+        matriz = MatrizCSR.desde_coo(filas, columnas, valores, (n, n))
+        densa = matriz.a_densa()
+        vector = generador.standard_normal(n)
+
+        t_denso = medir(lambda: GaussJordan(REGISTRO_NINGUNO).resolver(densa, vector), repeticiones=1)
+        t_disperso = medir(lambda: GaussJordanDisperso().resolver(matriz, vector), repeticiones=1)
+
+        print(f"{n:>6} {matriz.nnz:>10} {t_denso:>12.4f} {t_disperso:>13.4f} {t_denso / t_disperso:>11.1f}x")
+    print()
+
+
+def benchmark_estructura(n: int = 400):
+    """Matrices con estructura: eliminacion general frente a la ruta especializada."""
+    print("=" * 60)
+    print(f"DETECCION DE ESTRUCTURA ({n}x{n})")
+    print("=" * 60)
+    print(f"{'estructura':>22} {'general (s)':>12} {'ruta (s)':>10} {'aceleracion':>12}")
+
+    generador = np.random.default_rng(0)
+    aleatoria = generador.standard_normal((n, n))
+    tridiagonal = np.diag(np.full(n, 4.0)) + np.diag(np.ones(n - 1), 1) + np.diag(np.ones(n - 1), -1)
+    vector = generador.standard_normal(n)
+    casos = {
+        'diagonal': np.diag(generador.uniform(1, 2, n)),
+        'triangular superior': np.triu(aleatoria) + n * np.eye(n),
+        'tridiagonal': tridiagonal,
+        'definida positiva': aleatoria @ aleatoria.T + n * np.eye(n),
+    }
+
+    for nombre, matriz in casos.items():
+        general = GaussJordan(REGISTRO_NINGUNO, usar_estructura=False)
+        rapido = GaussJordan(REGISTRO_NINGUNO)
+        t_general = medir(lambda: general.resolver(matriz, vector), repeticiones=2)
+        t_rapido = medir(lambda: rapido.resolver(matriz, vector))
+        print(f"{nombre:>22} {t_general:>12.4f} {t_rapido:>10.4f} {t_general / t_rapido:>11.1f}x")
+    print()
+
+
+def benchmark_banda(tamanos=(10000, 50000), anchos=((1, 1), (2, 2), (4, 3))):
+    """Sistemas de banda grandes (no caben como matriz densa): tiempo y memoria."""
+    print("=" * 60)
+    print("MATRICES DE BANDA")
+    print("=" * 60)
+    print(f"{'n':>7} {'banda':>7} {'tiempo (s)':>11} {'banda (MB)':>11} {'densa (MB)':>11}")
+
+    generador = np.random.default_rng(0)
+    for n in tamanos:
+        for inferior, superior in anchos:
+            diagonales = generador.standard_normal((inferior + superior + 1, n))
+            banda = BandedMatrix(diagonales, inferior, superior)
+            vector = generador.standard_normal(n)
+            solver = GaussEliminationBanda()
+            tiempo = medir(lambda: solver.solve(banda, vector), repeticiones=1)
+
+            print(f"{n:>7} {f'{inferior}+{superior}':>7} {tiempo:>11.4f} "
+                  f"{diagonales.nbytes / 2**20:>11.2f} {n * n * 8 / 2**20:>11.0f}")
+    print()
+
+
+def benchmark_exacto(tamanos=(25, 50, 100, 200)):
+    """Metodos exactos (Bareiss y multimodular) frente al de punto flotante."""
+    print("=" * 60)
+    print("METODOS EXACTOS (BAREISS Y MODULAR) CON ENTEROS EN [-9, 9]")
+    print("=" * 60)
+    print(f"{'n':>6} {'flotante (s)':>13} {'exacto (s)':>11} {'modular (s)':>12} {'rango (s)':>10}")
+
+    generador = np.random.default_rng(0)
+    for n in tamanos:
+        matriz = generador.integers(-9, 10, size=(n, n))
+        vector = generador.integers(-9, 10, size=n)
+        t_flotante = medir(lambda: GaussJordan(REGISTRO_NINGUNO).resolver(matriz, vector))
+        t_exacto = medir(lambda: GaussJordan(REGISTRO_NINGUNO, metodo=METODO_EXACTO).resolver(matriz, vector),
+                         repeticiones=1)
+        t_modular = medir(lambda: GaussJordan(REGISTRO_NINGUNO, metodo=METODO_MODULAR).resolver(matriz, vector),
+                          repeticiones=1)
+        t_rango = medir(lambda: rango_modular(matriz), repeticiones=1)
+        print(f"{n:>6} {t_flotante:>13.4f} {t_exacto:>11.4f} {t_modular:>12.4f} {t_rango:>10.4f}")
+    print()
+
+
+def benchmark_gf2(tamanos=(500, 2000, 5000)):
+    """Gauss-Jordan sobre GF(2) con filas empaquetadas frente a float64."""
+    print("=" * 60)
+    print("SISTEMAS BINARIOS: GF(2) EMPAQUETADO FRENTE A FLOAT64")
+    print("=" * 60)
+    print(f"{'n':>6} {'float64 (s)':>12} {'gf2 (s)':>9} {'memoria float64':>16} {'memoria gf2':>12}")
+
+    generador = np.random.default_rng(0)
+    for n in tamanos:
+        matriz = generador.integers(0, 2, size=(n, n), dtype=np.uint8)
+        vector = generador.integers(0, 2, size=n, dtype=np.uint8)
+        t_gf2 = medir(lambda: GaussJordanGF2().resolver(matriz, vector), repeticiones=1)
+        t_flotante = (medir(lambda: GaussJordan(REGISTRO_NINGUNO).resolver(matriz.astype(float), vector.astype(float)),
+                            repeticiones=1) if n <= 500 else float('nan'))
+        memoria_gf2 = empaquetar_bits(matriz, vector).nbytes
+        print(f"{n:>6} {t_flotante:>12.4f} {t_gf2:>9.4f} {n * (n + 1) * 8 / 2**20:>13.1f} MB "
+              f"{memoria_gf2 / 2**20:>9.2f} MB")
+    print()
+
+
+def benchmark_tipos(tamanos=(400, 800, 1200)):
+    """Gauss-Jordan en float32, float64 y complex128: tiempo y memoria de la matriz aumentada."""
+    print("=" * 60)
+    print("TIPO DE TRABAJO: FLOAT32, FLOAT64 Y COMPLEX128")
+    print("=" * 60)
+    print(f"{'n':>6} {'float32 (s)':>12} {'float64 (s)':>12} {'complex128 (s)':>15} {'memoria float32':>16}")
+
+    generador = np.random.default_rng(0)
+    solver = GaussJordan(REGISTRO_NINGUNO, metodo=METODO_BLOQUES, usar_estructura=False)
+    for n in tamanos:
+        matriz = generador.standard_normal((n, n)) + np.sqrt(n) * np.eye(n)
+        vector = generador.standard_normal(n)
+        complejo = matriz + 1j * generador.standard_normal((n, n))
+        simple, vector_simple = matriz.astype(np.float32), vector.astype(np.float32)
+        t_simple = medir(lambda: solver.resolver(simple, vector_simple), repeticiones=1)
+        t_doble = medir(lambda: solver.resolver(matriz, vector), repeticiones=1)
+        t_complejo = medir(lambda: solver.resolver(complejo, vector), repeticiones=1)
+        print(f"{n:>6} {t_simple:>12.4f} {t_doble:>12.4f} {t_complejo:>15.4f} "
+              f"{n * (n + 1) * 4 / 2**20:>13.1f} MB")
+    print()
+
+
+def benchmark_espacio_trabajo(n: int = 300, repeticiones: int = 20):
+    """Resoluciones repetidas de la misma forma con y sin espacio de trabajo."""
+    print("=" * 60)
+    print("ESPACIO DE TRABAJO REUTILIZABLE")
+    print("=" * 60)
+
+    generador = np.random.default_rng(0)
+    matriz = generador.standard_normal((n, n))
+    vector = generador.standard_normal(n)
+    solver = GaussJordan(REGISTRO_NINGUNO, usar_estructura=False)
+    espacio = EspacioTrabajo()
+    A, b = espacio.entrada(n, n)
+
+    def sobre_la_entrada():
+        A[:] = matriz
+        b[:] = vector
+        solver.resolver(A, b, espacio_trabajo=espacio, sobrescribir_entrada=True)
+
+    t_nuevo = medir(lambda: [solver.resolver(matriz, vector) for _ in range(repeticiones)], repeticiones=1)
+    t_espacio = medir(lambda: [solver.resolver(matriz, vector, espacio_trabajo=espacio)
+                               for _ in range(repeticiones)], repeticiones=1)
+    t_entrada = medir(lambda: [sobre_la_entrada() for _ in range(repeticiones)], repeticiones=1)
+    print(f"{repeticiones} sistemas {n}x{n}")
+    print(f"Reservando en cada llamada:   {t_nuevo:.4f} s")
+    print(f"Con espacio de trabajo:       {t_espacio:.4f} s")
+    print(f"Sobre la entrada (sin copia): {t_entrada:.4f} s")
+    print()
+
+
+def benchmark_permutacion(tamanos=(200, 400, 800)):
+    """Sistemas que exigen un intercambio en cada columna (pivoteo por permutacion)."""
+    print("=" * 60)
+    print("PIVOTEO CON VECTOR DE PERMUTACION")
+    print("=" * 60)
+
+    generador = np.random.default_rng(0)
+    for n in tamanos:
+        # Diagonal dominante en la antidiagonal: cada columna cambia de fila pivote
+        matriz = generador.standard_normal((n, n)) + n * np.fliplr(np.eye(n))
+        vector = generador.standard_normal(n)
+        t_jordan = medir(lambda: GaussJordan(REGISTRO_NINGUNO, usar_estructura=False).resolver(matriz, vector))
+        t_mejorado = medir(lambda: GaussEliminationMejorado(REGISTRO_NINGUNO).solve(matriz, vector))
+        t_factorizar = medir(lambda: GaussEliminationMejorado(REGISTRO_NINGUNO).factorizar(matriz))
+        print(f"n={n:5d}  Gauss-Jordan: {t_jordan:.4f} s  "
+              f"eliminacion: {t_mejorado:.4f} s  factorizar: {t_factorizar:.4f} s")
+    print()
+
+
+def benchmark_incremental(n: int = 200, ecuaciones: int = 20):
+    """Agregar ecuaciones una a una frente a resolver el sistema completo cada vez."""
+    print("=" * 60)
+    print("GAUSS-JORDAN INCREMENTAL")
+    print("=" * 60)
+
+    generador = np.random.default_rng(0)
+    matriz = generador.standard_normal((n + ecuaciones, n))
+    vector = generador.standard_normal(n + ecuaciones)
+    solver = GaussJordan(REGISTRO_NINGUNO, usar_estructura=False)
+    sesion = SesionGaussJordan(n)
+    sesion.resolver(matriz[:n // 2], vector[:n // 2])
+
+    t_completo = medir(lambda: [solver.resolver(matriz[:n // 2 + k + 1], vector[:n // 2 + k + 1])
+                                for k in range(ecuaciones)], repeticiones=1)
+    t_sesion = medir(lambda: [sesion.agregar_ecuacion(matriz[n // 2 + k], vector[n // 2 + k])
+                              for k in range(ecuaciones)], repeticiones=1)
+    print(f"{ecuaciones} ecuaciones agregadas a un sistema de {n // 2}x{n}")
+    print(f"Resolver desde cero cada vez: {t_completo:.4f} s")
+    print(f"Sesion incremental:           {t_sesion:.4f} s  ({t_completo / t_sesion:.0f}x)")
+    print()
+
+
+def benchmark_independencia_incremental(n: int = 100, m: int = 60):
+    """Decidir cada vector al llegar frente a reanalizar todo el conjunto."""
+    print("=" * 60)
+    print("INDEPENDENCIA LINEAL INCREMENTAL")
+    print("=" * 60)
+
+    generador = np.random.default_rng(0)
+    vectores = generador.standard_normal((n, m))
+    vectores[:, 1::3] = vectores[:, 0::3][:, :vectores[:, 1::3].shape[1]] * 2  # Un tercio dependientes
+
+    def reanalizando():
+        for j in range(1, m + 1):
+            IndependenciaLineal().analizar_vectores(vectores[:, :j])
+
+    t_completo = medir(reanalizando, repeticiones=1)
+    t_incremental = medir(lambda: IndependenciaIncremental(n).agregar_vectores(vectores), repeticiones=1)
+    print(f"{m} vectores en R^{n}, uno a uno")
+    print(f"Reanalizando el conjunto: {t_completo:.4f} s")
+    print(f"Incremental:              {t_incremental:.4f} s  ({t_completo / t_incremental:.0f}x)")
+    print()
+
+
+def benchmark_independencia(n: int = 200):
+    """Una sola eliminacion frente a determinante + Gauss-Jordan + rango por SVD."""
+    print("=" * 60)
+    print("ANALISIS DE INDEPENDENCIA EN UNA PASADA")
+    print("=" * 60)
+
+    generador = np.random.default_rng(0)
+    for filas, columnas in ((n, n), (2 * n, n)):
+        vectores = generador.standard_normal((filas, columnas))
+
+        def tres_pasadas():
+            np.linalg.det(vectores) if filas == columnas else None
+            GaussJordan(REGISTRO_NINGUNO).resolver(vectores, np.zeros(filas))
+            np.linalg.matrix_rank(vectores)
+
+        t_antes = medir(tres_pasadas, repeticiones=3)
+        t_unica = medir(lambda: IndependenciaLineal(nivel_registro=REGISTRO_NINGUNO).analizar_vectores(vectores),
+                        repeticiones=3)
+        print(f"{columnas} vectores en R^{filas}")
+        print(f"det + Gauss-Jordan + SVD: {t_antes:.4f} s")
+        print(f"Una eliminacion:          {t_unica:.4f} s  ({t_antes / t_unica:.1f}x)")
+    print()
+
+
+def benchmark_independencia_lotes(N: int = 5000, n: int = 6, m: int = 5):
+    """Un IndependenciaLineal con reporte por conjunto frente a un solo analisis por lotes."""
+    print("=" * 60)
+    print("INDEPENDENCIA LINEAL POR LOTES")
+    print("=" * 60)
+
+    generador = np.random.default_rng(0)
+    vectores = generador.standard_normal((N, n, m))
+    vectores[::2, :, -1] = vectores[::2, :, 0]  # La mitad dependientes
+
+    def uno_por_uno():
+        for k in range(N):
+            analizador = IndependenciaLineal()
+            analizador.analizar_vectores(vectores[k])
+            analizador.obtener_reporte_completo()
+
+    t_individual = medir(uno_por_uno, repeticiones=1)
+    t_lotes = medir(lambda: IndependenciaLotes().analizar(vectores), repeticiones=3)
+    print(f"{N} conjuntos de {m} vectores en R^{n}")
+    print(f"Uno por uno con reporte: {t_individual:.4f} s")
+    print(f"Por lotes:               {t_lotes:.4f} s  ({t_individual / t_lotes:.0f}x)")
+    print()
+
+
+def benchmark_indice_generado(n: int = 50, r: int = 20, consultas: int = 20000):
+    """Pertenencia al subespacio: reanalizar base + vector frente al indice y su forma por lotes."""
+    print("=" * 60)
+    print("INDICE DEL SUBESPACIO GENERADO")
+    print("=" * 60)
+
+    generador = np.random.default_rng(0)
+    analizador = IndependenciaLineal(nivel_registro=REGISTRO_NINGUNO)
+    analizador.analizar_vectores(generador.standard_normal((n, r)))
+    base = analizador.resultado_analisis['vectores_originales']
+    indice = analizador.crear_indice_generado()
+    vectores = base @ generador.standard_normal((r, consultas))
+    vectores[:, ::2] = generador.standard_normal((n, consultas // 2))  # La mitad fuera
+
+    muestra = 200
+    t_reanalisis = medir(lambda: [IndependenciaLineal(nivel_registro=REGISTRO_NINGUNO).analizar_vectores(
+        np.column_stack((base, vectores[:, j]))) for j in range(muestra)], repeticiones=1) / muestra
+    t_indice = medir(lambda: [indice.coeficientes(vectores[:, j]) for j in range(muestra)], repeticiones=3) / muestra
+    t_lotes = medir(lambda: indice.consultar(vectores), repeticiones=3) / consultas
+    print(f"Base de {r} vectores en R^{n}, tiempo por consulta")
+    print(f"Reanalizando base + vector: {t_reanalisis * 1e6:.1f} us")
+    print(f"Indice, una consulta:       {t_indice * 1e6:.1f} us  ({t_reanalisis / t_indice:.0f}x)")
+    print(f"Indice, {consultas} a la vez: {t_lotes * 1e6:.2f} us  ({t_reanalisis / t_lotes:.0f}x)")
+    print()
+
+
+def benchmark_prefiltro(n: int = 100, direcciones: int = 20, m: int = 100):
+    """Conjunto con muchos repetidos y multiplos: eliminar todo frente a prefiltrar."""
+    print("=" * 60)
+    print("PREFILTRO DE VECTORES REPETIDOS Y PARALELOS")
+    print("=" * 60)
+
+    generador = np.random.default_rng(0)
+    base = generador.standard_normal((n, direcciones))
+    vectores = base[:, generador.integers(direcciones, size=m)] * generador.choice([-3.0, -1.0, 0.5, 2.0], size=m)
+    vectores[:, :direcciones] = base
+
+    def sin_prefiltro():
+        GaussEliminationMejorado(REGISTRO_NINGUNO).factorizar(vectores)
+
+    t_eliminando = medir(sin_prefiltro, repeticiones=3)
+    t_prefiltro = medir(lambda: IndependenciaLineal(nivel_registro=REGISTRO_NINGUNO).analizar_vectores(vectores),
+                        repeticiones=3)
+    print(f"{m} vectores en R^{n} con {direcciones} direcciones distintas")
+    print(f"Eliminacion de todos: {t_eliminando:.4f} s")
+    print(f"Con prefiltro:        {t_prefiltro:.4f} s  ({t_eliminando / t_prefiltro:.1f}x)")
+    print()
+
+
+def main():
+    """Ejecuta todas las pruebas de rendimiento."""
+    benchmark_eliminacion()
+    benchmark_registro()
+    benchmark_bloques()
+    benchmark_multiples_lados()
+    benchmark_factorizacion()
+    benchmark_precision_mixta()
+    benchmark_lotes()
+    benchmark_disperso()
+    benchmark_estructura()
+    benchmark_banda()
+    benchmark_exacto()
+    benchmark_gf2()
+    benchmark_tipos()
+    benchmark_espacio_trabajo()
+    benchmark_permutacion()
+    benchmark_incremental()
+    benchmark_independencia_incremental()
+    benchmark_independencia()
+    benchmark_independencia_lotes()
+    benchmark_indice_generado()
+    benchmark_prefiltro()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Cache de eliminaciones
+Guarda resultados ya calculados indexados por el contenido de las matrices
+"""
+
+import hashlib
+import numpy as np
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class CacheEliminaciones:
+    """
+    Cache LRU acotada de resultados de eliminación.
+
+    La clave es un hash del contenido (en su tipo si es real o complejo, si no en
+    float64), el tipo y la forma de cada arreglo y la tolerancia usada, de modo
+    que dos matrices con los mismos valores comparten entrada aunque sean objetos
+    distintos. Cuando se supera el número máximo de entradas o de bytes se
+    descartan las entradas usadas hace más tiempo. Para los cálculos exactos el
+    contenido se toma sin redondear.
+    """
+
+    def __init__(self, max_entradas: int = 128, max_bytes: int = 64 * 2**20):
+        self.max_entradas = max_entradas  # Número máximo de resultados guardados
+        self.max_bytes = max_bytes  # Memoria máxima (aproximada) de los resultados guardados
+        self.aciertos = 0  # Consultas que encontraron un resultado
+        self.fallos = 0  # Consultas sin resultado guardado
+        self.bytes_usados = 0
+        self._entradas = OrderedDict()  # Clave -> (valor, bytes)
+
+    def clave(self, *arreglos: np.ndarray, tolerancia: float, contexto: tuple = (), exacto: bool = False) -> str:
+        """
+        Calcula la clave de contenido para un conjunto de arreglos.
+
+        Args:
+            arreglos: Matrices/vectores de entrada
+            tolerancia: Tolerancia con que se clasifica el resultado
+            contexto: Datos adicionales que distinguen el cálculo (operación, opciones)
+            exacto: Si el resultado depende del valor exacto de los elementos
+                    (enteros grandes, Fraction): no se convierten a float64
+
+        Returns:
+            Resumen hexadecimal de la clave
+        """
+        resumen = hashlib.blake2b(digest_size=20)
+        resumen.update(repr((tolerancia, contexto)).encode())
+        for arreglo in arreglos:
+            datos = np.ascontiguousarray(arreglo)
+            if exacto and datos.dtype.kind == 'O':
+                # Enteros de Python y Fraction: su representación exacta
+                resumen.update(repr((datos.shape, datos.tolist())).encode())
+                continue
+            if not exacto and datos.dtype.kind not in 'fc':  # Enteros, booleanos y objetos se comparan como float64
+                datos = datos.astype(np.float64)
+            resumen.update(repr((datos.shape, datos.dtype.str)).encode())
+            resumen.update(datos.tobytes())
+        return resumen.hexdigest()
+
+    def obtener(self, clave: str) -> Optional[Any]:
+        """Devuelve el resultado guardado para la clave, o None si no existe."""
+        entrada = self._entradas.get(clave)
+        if entrada is None:
+            self.fallos += 1
+            return None
+
+        self._entradas.move_to_end(clave)
+        self.aciertos += 1
+        return entrada[0]
+
+    def guardar(self, clave: str, valor: Any):
+        """Guarda un resultado y descarta los menos usados si se superan los límites."""
+        tamano = self._tamano(valor)
+        if tamano > self.max_bytes:
+            return
+
+        if clave in self._entradas:
+            self.bytes_usados -= self._entradas.pop(clave)[1]
+
+        self._entradas[clave] = (valor, tamano)
+        self.bytes_usados += tamano
+
+        while len(self._entradas) > self.max_entradas or self.bytes_usados > self.max_bytes:
+            _, (_, tamano_descartado) = self._entradas.popitem(last=False)
+            self.bytes_usados -= tamano_descartado
+
+    def limpiar(self):
+        """Elimina todas las entradas y reinicia los contadores."""
+        self._entradas.clear()
+        self.bytes_usados = 0
+        self.aciertos = 0
+        self.fallos = 0
+
+    def estadisticas(self) -> Dict[str, Any]:
+        """Retorna el estado de la cache."""
+        consultas = self.aciertos + self.fallos
+        return {
+            'entradas': len(self._entradas),
+            'bytes': self.bytes_usados,
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'tasa_aciertos': self.aciertos / consultas if consultas else 0.0
+        }
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def __contains__(self, clave: str) -> bool:
+        return clave in self._entradas
+
+    @classmethod
+    def _tamano(cls, valor: Any) -> int:
+        """Estimación de los bytes de un resultado (arreglos y contenedores anidados)."""
+        if isinstance(valor, np.ndarray):
+            return valor.nbytes
+        if isinstance(valor, dict):
+            return sum(cls._tamano(v) for v in valor.values()) + 64
+        if isinstance(valor, (list, tuple, set)):
+            return sum(cls._tamano(v) for v in valor) + 64
+        if hasattr(valor, 'memoria_bytes'):
+            return valor.memoria_bytes()
+        return 64
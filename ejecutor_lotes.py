@@ -0,0 +1,239 @@
+"""
+Ejecutor de lotes heterogeneos
+Agrupa sistemas por tamano: los pequenos se resuelven con el camino vectorizado por
+lotes y los grandes se reparten entre procesos
+"""
+
+import os
+import time
+import multiprocessing
+import numpy as np
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from gauss_jordan import GaussJordan
+from gauss_jordan_lotes import GaussJordanLotes, TIPO_UNICO, TIPO_INCONSISTENTE
+from gauss_elimination_mejorado import GaussEliminationMejorado
+from registro_pasos import REGISTRO_NINGUNO
+
+try:  # Opcional: limita BLAS en caliente aunque NumPy ya este cargado
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
+# Solucionadores disponibles para los sistemas grandes
+SOLUCIONADOR_GAUSS_JORDAN = "gauss_jordan"
+SOLUCIONADOR_GAUSS = "gauss"
+
+SOLUCIONADORES = (SOLUCIONADOR_GAUSS_JORDAN, SOLUCIONADOR_GAUSS)
+
+# Umbral fijo con que GaussEliminationMejorado considera cero un pivote
+TOLERANCIA_GAUSS = 1e-10
+
+# Variables de entorno que fijan los hilos de las distintas implementaciones de BLAS
+VARIABLES_HILOS_BLAS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS",
+                        "BLIS_NUM_THREADS", "VECLIB_MAXIMUM_THREADS", "NUMEXPR_NUM_THREADS")
+
+_limites_trabajador = None  # Mantiene activo el limite de threadpoolctl en cada proceso
+
+
+@contextmanager
+def _entorno_blas(hilos: int):
+    """Fija los hilos de BLAS en el entorno que heredan los procesos creados dentro del bloque."""
+    anteriores = {variable: os.environ.get(variable) for variable in VARIABLES_HILOS_BLAS}
+    os.environ.update({variable: str(hilos) for variable in VARIABLES_HILOS_BLAS})
+    try:
+        yield
+    finally:
+        for variable, valor in anteriores.items():
+            if valor is None:
+                os.environ.pop(variable, None)
+            else:
+                os.environ[variable] = valor
+
+
+def _iniciar_trabajador(hilos: int):
+    """Inicializador de cada proceso: refuerza el limite de hilos de BLAS."""
+    global _limites_trabajador
+    if threadpool_limits is not None:
+        _limites_trabajador = threadpool_limits(limits=hilos, user_api="blas")
+
+
+def _resolver_sistema(matriz: np.ndarray, vector: np.ndarray, solucionador: str,
+                      tolerancia: float) -> Tuple[Optional[np.ndarray], bool, str]:
+    """
+    Resuelve un sistema en un proceso trabajador.
+
+    Returns:
+        Tupla con solucion (None si es inconsistente), es_unica y tipo de sistema;
+        si el solucionador falla, el mensaje de error en lugar del tipo
+    """
+    if solucionador == SOLUCIONADOR_GAUSS:
+        # Tolerancia fija (TOLERANCIA_GAUSS, comprobada al crear el ejecutor).
+        # Con un bloque de una columna el solucionador deja la clasificacion en solution_types
+        solver = GaussEliminationMejorado(REGISTRO_NINGUNO)
+        soluciones, son_unicas, mensaje = solver.solve(matriz, vector.reshape(-1, 1))
+        if not solver.solution_types:
+            return None, False, mensaje
+        tipo = solver.solution_types[0]
+        solucion = None if tipo == TIPO_INCONSISTENTE else soluciones[:, 0]
+        return solucion, bool(son_unicas[0]), tipo
+
+    solver = GaussJordan(REGISTRO_NINGUNO, tolerancia=tolerancia)
+    solucion, es_unica, mensaje = solver.resolver(matriz, vector)
+    return solucion, es_unica, solver.tipo_sistema or mensaje
+
+
+def _resultado_de_error(error: Exception) -> Tuple[None, bool, str]:
+    """Resultado de un sistema cuya resolucion lanzo una excepcion."""
+    return None, False, f"Error en el calculo: {error}"
+
+
+class EjecutorLotes:
+    """
+    Resuelve una coleccion de sistemas de tamanos mezclados.
+
+    Los sistemas cuyo numero de ecuaciones e incognitas no supera max_lote se agrupan
+    por forma y cada grupo se resuelve de una vez con GaussJordanLotes en el proceso
+    principal. El resto se envia a un ProcessPoolExecutor; cada proceso limita BLAS a
+    hilos_blas hilos para que num_procesos x hilos_blas no supere los nucleos.
+    tolerancia se aplica a los lotes y a Gauss-Jordan; el solucionador "gauss" usa
+    un umbral fijo, por lo que con el no se acepta otra tolerancia.
+
+    Los resultados se entregan en el mismo orden que los sistemas de entrada, en
+    cuanto cada uno esta disponible, y al terminar quedan las estadisticas de
+    rendimiento en `estadisticas`.
+    """
+
+    def __init__(self, num_procesos: Optional[int] = None, max_lote: int = 8,
+                 solucionador: str = SOLUCIONADOR_GAUSS_JORDAN, hilos_blas: int = 1,
+                 tolerancia: float = 1e-10):
+        if solucionador not in SOLUCIONADORES:
+            raise ValueError(
+                f"Solucionador desconocido: {solucionador!r}. Opciones: {', '.join(SOLUCIONADORES)}"
+            )
+        if solucionador == SOLUCIONADOR_GAUSS and tolerancia != TOLERANCIA_GAUSS:
+            raise ValueError(
+                f"El solucionador {SOLUCIONADOR_GAUSS!r} usa una tolerancia fija de {TOLERANCIA_GAUSS}; "
+                f"use {SOLUCIONADOR_GAUSS_JORDAN!r} para otra tolerancia"
+            )
+        if num_procesos is None:
+            num_procesos = max(1, (os.cpu_count() or 1) // hilos_blas)
+        self.num_procesos = num_procesos  # Procesos para los sistemas grandes
+        self.max_lote = max_lote  # Tamano maximo (m y n) que va al camino por lotes
+        self.solucionador = solucionador  # Solucionador de los sistemas grandes
+        self.hilos_blas = hilos_blas  # Hilos de BLAS por proceso
+        self.tolerancia = tolerancia  # Valores con modulo menor o igual se consideran cero
+        self.estadisticas = {}  # Rendimiento de la ultima ejecucion
+
+    def ejecutar(self, sistemas: Iterable[Tuple[np.ndarray, np.ndarray]]) -> Iterator[Tuple[Optional[np.ndarray], bool, str]]:
+        """
+        Resuelve todos los sistemas y entrega los resultados en orden.
+
+        Args:
+            sistemas: Pares (matriz, vector) de cualquier tamano
+
+        Returns:
+            Iterador de tuplas (solucion, es_unica, tipo_sistema), una por sistema;
+            la solucion es None en los sistemas inconsistentes. Un sistema que no se
+            puede resolver da (None, False, mensaje de error) sin detener el resto
+        """
+        sistemas = list(sistemas)
+        inicio = time.perf_counter()
+
+        grupos = defaultdict(list)  # Forma -> indices de los sistemas pequenos
+        grandes = []
+        for indice, (matriz, _) in enumerate(sistemas):
+            m, n = np.shape(matriz)
+            if m <= self.max_lote and n <= self.max_lote:
+                grupos[(m, n)].append(indice)
+            else:
+                grandes.append(indice)
+
+        resultados = {}
+        pendientes = {}
+        contexto = multiprocessing.get_context("spawn")  # Procesos nuevos que leen el entorno de BLAS
+        with ProcessPoolExecutor(max_workers=self.num_procesos, mp_context=contexto,
+                                 initializer=_iniciar_trabajador, initargs=(self.hilos_blas,)) as ejecutor:
+            # Los grandes se envian primero para que los procesos trabajen mientras
+            # el proceso principal resuelve los lotes pequenos y entrega resultados.
+            # Los procesos se crean al enviar y heredan entonces el entorno de BLAS,
+            # que se restaura antes de entregar nada al llamador
+            with _entorno_blas(self.hilos_blas):
+                for indice in grandes:
+                    matriz, vector = sistemas[indice]
+                    pendientes[indice] = ejecutor.submit(_resolver_sistema, np.asarray(matriz),
+                                                         np.asarray(vector), self.solucionador,
+                                                         self.tolerancia)
+
+            # Cada grupo pequeno se resuelve al llegar a su primer sistema, de modo
+            # que cada resultado se entrega en cuanto esta listo sin esperar al resto
+            forma_de = {indice: forma for forma, indices in grupos.items() for indice in indices}
+            for indice in range(len(sistemas)):
+                if indice in pendientes:
+                    try:
+                        resultado = pendientes.pop(indice).result()
+                    except Exception as e:
+                        resultado = _resultado_de_error(e)
+                    yield resultado
+                    continue
+                if indice not in resultados:
+                    resultados.update(self._resolver_grupo(sistemas, grupos[forma_de[indice]]))
+                yield resultados.pop(indice)
+
+        segundos = time.perf_counter() - inicio
+        self.estadisticas = {
+            'sistemas': len(sistemas),
+            'en_lotes': len(sistemas) - len(grandes),
+            'en_procesos': len(grandes),
+            'grupos': len(grupos),
+            'segundos': segundos,
+            'sistemas_por_segundo': len(sistemas) / segundos if segundos > 0 else float('inf')
+        }
+
+    def resolver_todos(self, sistemas: Iterable[Tuple[np.ndarray, np.ndarray]]) -> List[Tuple[Optional[np.ndarray], bool, str]]:
+        """Resuelve todos los sistemas y devuelve la lista completa de resultados."""
+        return list(self.ejecutar(sistemas))
+
+    def _resolver_grupo(self, sistemas: List[Tuple[np.ndarray, np.ndarray]],
+                        indices: List[int]) -> Dict[int, Tuple[Optional[np.ndarray], bool, str]]:
+        """
+        Resuelve con GaussJordanLotes los sistemas pequenos que comparten forma.
+
+        Si el lote falla (por ejemplo, un vector de otra longitud), cada sistema se
+        resuelve por separado con Gauss-Jordan: un sistema mal formado da su propia
+        tupla de error, como en los procesos, sin tumbar al resto del grupo.
+        """
+        try:
+            matrices = np.stack([np.asarray(sistemas[i][0]) for i in indices])
+            vectores = np.stack([np.asarray(sistemas[i][1]) for i in indices])
+            soluciones, tipos, _ = GaussJordanLotes(self.tolerancia).resolver(matrices, vectores)
+        except Exception:
+            return {indice: self._resolver_aislado(*sistemas[indice]) for indice in indices}
+
+        return {
+            indice: (None if tipo == TIPO_INCONSISTENTE else solucion, tipo == TIPO_UNICO, str(tipo))
+            for indice, solucion, tipo in zip(indices, soluciones, tipos)
+        }
+
+    def _resolver_aislado(self, matriz: np.ndarray, vector: np.ndarray) -> Tuple[Optional[np.ndarray], bool, str]:
+        """Resuelve un sistema pequeno fuera del lote; los errores quedan en su tupla."""
+        try:
+            return _resolver_sistema(np.asarray(matriz), np.asarray(vector),
+                                     SOLUCIONADOR_GAUSS_JORDAN, self.tolerancia)
+        except Exception as e:
+            return _resultado_de_error(e)
+
+    def obtener_reporte(self) -> str:
+        """Resumen de rendimiento de la ultima ejecucion."""
+        if not self.estadisticas:
+            return "No se ha ejecutado ningun lote."
+
+        e = self.estadisticas
+        return (f"{e['sistemas']} sistemas en {e['segundos']:.3f} s "
+                f"({e['sistemas_por_segundo']:.1f} sistemas/s)\n"
+                f"Camino por lotes: {e['en_lotes']} sistemas en {e['grupos']} grupos\n"
+                f"Procesos: {e['en_procesos']} sistemas con {self.num_procesos} procesos "
+                f"x {self.hilos_blas} hilos de BLAS")
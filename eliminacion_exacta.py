@@ -0,0 +1,163 @@
+"""
+Eliminacion exacta (Bareiss)
+Eliminacion libre de fracciones sobre enteros: sin tolerancias ni errores de redondeo
+"""
+
+import math
+import numpy as np
+from fractions import Fraction
+from typing import List, Optional, Tuple
+
+# Margen para que los productos intermedios quepan en int64
+_BITS_INT64 = 62
+
+
+def es_matriz_entera(matriz: np.ndarray) -> bool:
+    """
+    Indica si todos los elementos son enteros representados exactamente (tipos
+    enteros, o floats finitos con valor entero y modulo menor que 2^53).
+    """
+    matriz = np.asarray(matriz)
+    if matriz.dtype.kind in 'iub':
+        return True
+    if matriz.dtype.kind != 'f':
+        return False
+    return bool(np.all(np.isfinite(matriz)) and np.all(np.abs(matriz) < 2**53)
+                and np.all(matriz == np.round(matriz)))
+
+
+def matriz_entera(matriz: np.ndarray, vector: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Convierte [A | b] a una matriz de enteros de Python con el mismo conjunto solucion.
+
+    Cada elemento se toma exactamente (un float es la fraccion binaria que
+    representa; tambien se aceptan Fraction y enteros) y cada fila se multiplica
+    por el minimo comun multiplo de sus denominadores, lo que no cambia las
+    soluciones ni el rango.
+
+    Args:
+        matriz: Matriz de coeficientes A (m x n)
+        vector: Vector independiente b (m), opcional
+
+    Returns:
+        Arreglo de enteros (dtype object) de m x n, o m x (n+1) con el vector
+    """
+    matriz = np.asarray(matriz)
+    if es_matriz_entera(matriz) and (vector is None or es_matriz_entera(vector)):
+        # Ya son enteros: no hace falta pasar por Fraction
+        if vector is not None:
+            matriz = np.column_stack((matriz, np.asarray(vector)))
+        if matriz.dtype.kind in 'fb':
+            matriz = matriz.astype(np.int64)
+        return matriz.astype(object)
+
+    if vector is not None:
+        columnas = np.empty((matriz.shape[0], matriz.shape[1] + 1), dtype=object)
+        columnas[:, :-1] = matriz
+        columnas[:, -1] = np.asarray(vector)
+        matriz = columnas
+
+    enteros = np.empty(matriz.shape, dtype=object)
+    for i, fila in enumerate(matriz):
+        fracciones = [v if isinstance(v, Fraction) else Fraction(v.item() if hasattr(v, 'item') else v)
+                      for v in fila]
+        escala = math.lcm(*(f.denominator for f in fracciones))
+        enteros[i] = [f.numerator * (escala // f.denominator) for f in fracciones]
+    return enteros
+
+
+def cabe_en_int64(enteros: np.ndarray) -> bool:
+    """
+    Cota de Hadamard: todo menor de la matriz esta acotado por el producto de las
+    normas de sus filas. Si el cuadrado de esa cota cabe en int64, ningun paso de
+    Bareiss (producto de dos menores) se desborda.
+    """
+    if enteros.size == 0:
+        return True
+    normas = sorted((math.log2(max(1, math.isqrt(sum(int(v) * int(v) for v in fila)) + 1))
+                     for fila in enteros), reverse=True)
+    k = min(enteros.shape)
+    return 2 * sum(normas[:k]) + 1 < _BITS_INT64
+
+
+def bareiss(enteros: np.ndarray, n: int, operaciones: Optional[List[str]] = None) -> Tuple[np.ndarray, List[int], int]:
+    """
+    Eliminacion hacia adelante libre de fracciones (Bareiss) recorriendo las n
+    primeras columnas en orden.
+
+    Tras usar la fila r como pivote en la columna c, cada elemento del bloque
+    inferior derecho se actualiza como (p * a - a_ic * a_rj) / p_anterior; la
+    division es exacta porque todos los elementos son menores de la matriz
+    original, asi que nunca aparecen fracciones y el tamano de los enteros crece
+    solo linealmente. Las columnas se recorren en orden y el pivote es la primera
+    fila con elemento no nulo, de modo que las columnas pivote son las mismas que
+    en la forma escalonada reducida.
+
+    Se trabaja en int64 vectorizado cuando la cota de Hadamard lo permite y con
+    enteros de Python (sin limite) en otro caso.
+
+    Args:
+        enteros: Matriz de enteros (se modifica en el lugar si es dtype object)
+        n: Numero de columnas de coeficientes (las demas son lados derechos)
+        operaciones: Lista donde describir intercambios y pivotes (opcional)
+
+    Returns:
+        Tupla con la forma escalonada entera, las columnas pivote y el ultimo
+        pivote (el menor principal de las columnas pivote)
+    """
+    m = enteros.shape[0]
+    A = enteros.astype(np.int64) if cabe_en_int64(enteros) else enteros
+    anterior = 1
+    fila = 0
+    columnas_pivote = []
+
+    for col in range(n):
+        if fila >= m:
+            break
+        no_nulos = np.flatnonzero(A[fila:, col] != 0)
+        if len(no_nulos) == 0:
+            continue
+
+        fila_pivote = fila + int(no_nulos[0])
+        if fila_pivote != fila:
+            A[[fila, fila_pivote]] = A[[fila_pivote, fila]]
+            if operaciones is not None:
+                operaciones.append(f"Intercambiar fila {fila+1} con fila {fila_pivote+1}")
+
+        pivote = A[fila, col]
+        if fila + 1 < m:
+            A[fila + 1:, col + 1:] = (pivote * A[fila + 1:, col + 1:]
+                                      - A[fila + 1:, col:col + 1] * A[fila, col + 1:]) // anterior
+            A[fila + 1:, col] = 0
+        if operaciones is not None:
+            operaciones.append(f"Pivote {pivote} en F{fila+1}, columna {col+1} (division exacta por {anterior})")
+
+        columnas_pivote.append(col)
+        anterior = pivote
+        fila += 1
+
+    if A.dtype != object:
+        A = A.astype(object)  # Convierte a int de Python
+    return A, columnas_pivote, int(anterior)
+
+
+def sustitucion_exacta(escalonada: np.ndarray, columnas_pivote: List[int], n: int,
+                       determinante: int) -> np.ndarray:
+    """
+    Solucion racional exacta (variables libres = 0) de la forma escalonada entera.
+
+    Con d = ultimo pivote, y = d * x es entero (regla de Cramer sobre las columnas
+    pivote), asi que la sustitucion hacia atras se hace con divisiones enteras exactas.
+
+    Returns:
+        Arreglo (dtype object) de Fraction con la solucion
+    """
+    y = np.zeros(n, dtype=object)
+    for i in range(len(columnas_pivote) - 1, -1, -1):
+        col = columnas_pivote[i]
+        suma = determinante * escalonada[i, n] - np.dot(escalonada[i, col + 1:n], y[col + 1:n])
+        y[col] = suma // escalonada[i, col]
+
+    solucion = np.empty(n, dtype=object)
+    solucion[:] = [Fraction(int(v), determinante) for v in y]
+    return solucion
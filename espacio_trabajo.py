@@ -0,0 +1,166 @@
+"""
+Espacio de trabajo reutilizable
+Buffers preasignados para resolver muchos sistemas de la misma forma sin reservar
+memoria en cada llamada
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+from tipos_numericos import matriz_aumentada
+
+
+class EspacioTrabajo:
+    """
+    Buffers de trabajo para GaussJordan.resolver y GaussEliminationMejorado.solve.
+
+    Guarda la matriz aumentada (m x (n + k)), un arreglo del mismo tamano para el
+    producto de las actualizaciones de rango 1, la columna de factores de cada
+    actualizacion (m), el vector de permutacion de filas (m) y la solucion (n, o
+    n x k). Se reservan en la primera resolucion (o al
+    construir el espacio con una forma) y se reutilizan mientras no cambien la
+    forma ni el tipo; `reservas` cuenta cuantas veces se reservaron.
+
+    La solucion devuelta, la matriz reducida y la permutacion de filas del
+    solucionador son vistas de estos buffers: la siguiente resolucion con el
+    mismo espacio las sobrescribe (hay que copiarlas si se necesitan despues).
+    """
+
+    def __init__(self, m: Optional[int] = None, n: Optional[int] = None, k: Optional[int] = None,
+                 dtype: np.dtype = np.float64):
+        self.aumentada = None  # Matriz aumentada [A | B]
+        self.producto = None  # Producto exterior de cada actualizacion de rango 1
+        self.factores = None  # Factor de cada fila en la actualizacion de rango 1
+        self.permutacion = None  # Fila original de cada fila de la matriz reducida
+        self.solucion = None  # Solucion (n) o soluciones (n x k)
+        self.reservas = 0  # Veces que se reservaron los buffers
+        self._forma = None  # (m, n, k, dtype) de los buffers actuales
+        self._identidad = None  # 0..m-1, para reiniciar la permutacion sin reservar memoria
+        if m is not None and n is not None:
+            self.preparar(m, n, k, dtype)
+
+    def preparar(self, m: int, n: int, k: Optional[int] = None, dtype: np.dtype = np.float64):
+        """
+        Reserva los buffers para un sistema m x n, si no estan ya reservados.
+
+        Args:
+            m: Numero de ecuaciones
+            n: Numero de variables
+            k: Numero de lados derechos (None = un solo vector)
+            dtype: Tipo de trabajo
+        """
+        forma = (m, n, k, np.dtype(dtype))
+        if forma == self._forma:
+            return
+
+        columnas = n + (1 if k is None else k)
+        self.aumentada = np.empty((m, columnas), dtype=dtype)
+        self.producto = np.empty((m, columnas), dtype=dtype)
+        self.factores = np.empty(m, dtype=dtype)
+        self.permutacion = np.empty(m, dtype=np.intp)
+        self.solucion = np.empty((n,) if k is None else (n, k), dtype=dtype)
+        self._identidad = np.arange(m)
+        self._forma = forma
+        self.reservas += 1
+
+    def entrada(self, m: int, n: int, k: Optional[int] = None,
+                dtype: np.dtype = np.float64) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vistas de A y b dentro de la matriz aumentada del espacio.
+
+        Escribiendo el sistema en ellas y resolviendo con sobrescribir_entrada
+        (overwrite_input) la eliminacion se hace directamente en el buffer, sin
+        ninguna copia.
+
+        Returns:
+            Tupla con la vista de A (m x n) y la de b (m) o B (m x k)
+        """
+        self.preparar(m, n, k, dtype)
+        lados = self.aumentada[:, n] if k is None else self.aumentada[:, n:]
+        return self.aumentada[:, :n], lados
+
+    def cargar(self, matriz: np.ndarray, lados: np.ndarray, dtype: np.dtype) -> np.ndarray:
+        """Copia [A | B] en la matriz aumentada del espacio (reservandola si hace falta)."""
+        m, n = matriz.shape
+        self.preparar(m, n, None if np.ndim(lados) == 1 else lados.shape[1], dtype)
+        return matriz_aumentada(matriz, lados, dtype, destino=self.aumentada)
+
+    def reiniciar_permutacion(self) -> np.ndarray:
+        """Deja la permutacion de filas en la identidad y la devuelve."""
+        np.copyto(self.permutacion, self._identidad)
+        return self.permutacion
+
+
+def vista_aumentada(matriz: np.ndarray, lados: np.ndarray, dtype: np.dtype) -> Optional[np.ndarray]:
+    """
+    Arreglo [A | B] del que A y b son vistas de columnas consecutivas (por ejemplo
+    las de EspacioTrabajo.entrada), o None si no lo son.
+
+    Solo se acepta si el arreglo ya tiene el tipo de trabajo y se puede escribir,
+    de modo que la eliminacion puede hacerse en el sin copiar.
+    """
+    base = getattr(matriz, 'base', None)
+    if not isinstance(base, np.ndarray) or getattr(lados, 'base', None) is not base:
+        return None
+
+    m, n = matriz.shape
+    k = 1 if lados.ndim == 1 else lados.shape[1]
+    if base.shape != (m, n + k) or base.dtype != dtype or not base.flags.writeable:
+        return None
+
+    inicio = base.__array_interface__['data'][0]
+    if (matriz.__array_interface__['data'][0] != inicio or matriz.strides != base.strides
+            or lados.__array_interface__['data'][0] != inicio + n * base.strides[1]
+            or lados.strides[0] != base.strides[0]):
+        return None
+    return base
+
+
+def solucion_en_ceros(espacio: Optional[EspacioTrabajo], forma: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    """Arreglo de ceros para la solucion: el buffer del espacio si coincide la forma, si no uno nuevo."""
+    if espacio is not None and espacio.solucion is not None \
+            and espacio.solucion.shape == forma and espacio.solucion.dtype == dtype:
+        espacio.solucion.fill(0)
+        return espacio.solucion
+    return np.zeros(forma, dtype=dtype)
+
+
+def factores_en_ceros(espacio: Optional[EspacioTrabajo], m: int, dtype: np.dtype) -> np.ndarray:
+    """Columna de m factores en cero: el buffer del espacio si coincide, si no una nueva."""
+    if espacio is not None and espacio.factores is not None \
+            and len(espacio.factores) == m and espacio.factores.dtype == dtype:
+        espacio.factores.fill(0)
+        return espacio.factores
+    return np.zeros(m, dtype=dtype)
+
+
+def producto_para(espacio: Optional[EspacioTrabajo], arreglo: np.ndarray, filas: int) -> Optional[np.ndarray]:
+    """
+    Buffer (filas x columnas de arreglo) para el producto exterior de una
+    actualizacion de rango 1 sobre arreglo, o None si el espacio no lo tiene.
+    """
+    if espacio is None or espacio.producto is None or espacio.producto.dtype != arreglo.dtype \
+            or espacio.producto.shape[1] != arreglo.shape[1] or espacio.producto.shape[0] < filas:
+        return None
+    return espacio.producto[:filas]
+
+
+def permutacion_identidad(espacio: Optional[EspacioTrabajo], m: int) -> np.ndarray:
+    """Permutacion de filas inicial (identidad): el buffer del espacio si es de m filas, si no una nueva."""
+    if espacio is not None and espacio.permutacion is not None and len(espacio.permutacion) == m:
+        return espacio.reiniciar_permutacion()
+    return np.arange(m)
+
+
+def ordenar_filas(aumentada: np.ndarray, orden: np.ndarray, espacio: Optional[EspacioTrabajo] = None):
+    """
+    Mueve las filas de la matriz a su orden logico (fila i = fila fisica orden[i])
+    con una sola copia, en el buffer del espacio de trabajo si lo hay.
+    """
+    if np.all(orden[1:] > orden[:-1]):
+        return  # Identidad: no hubo intercambios
+    producto = producto_para(espacio, aumentada, aumentada.shape[0])
+    if producto is None:
+        aumentada[:] = aumentada[orden]
+    else:
+        np.take(aumentada, orden, axis=0, out=producto, mode='clip')  # 'clip' no usa buffer intermedio
+        aumentada[:] = producto
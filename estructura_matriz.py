@@ -0,0 +1,237 @@
+"""
+Deteccion de estructura de la matriz
+Reconoce matrices diagonales, triangulares, diagonales por bloques, de banda y
+simetricas definidas positivas, y las resuelve con su metodo especializado
+"""
+
+import numpy as np
+from typing import Callable, Dict, Optional, Tuple
+from gauss_elimination_banda import BandedMatrix, GaussEliminationBanda
+from tipos_numericos import tipo_de_trabajo
+
+# Estructuras reconocidas (tambien son el nombre de la ruta de resolucion)
+ESTRUCTURA_GENERAL = "general"
+ESTRUCTURA_DIAGONAL = "diagonal"
+ESTRUCTURA_TRIANGULAR_SUPERIOR = "triangular_superior"
+ESTRUCTURA_TRIANGULAR_INFERIOR = "triangular_inferior"
+ESTRUCTURA_DIAGONAL_POR_BLOQUES = "diagonal_por_bloques"
+ESTRUCTURA_BANDA = "banda"
+ESTRUCTURA_CHOLESKY = "cholesky"  # Simetrica (hermitica si es compleja) definida positiva
+
+# Elementos de la matriz que se examinan a la vez al detectar la estructura
+ELEMENTOS_POR_TROZO = 2**18
+
+ESTRUCTURAS = (ESTRUCTURA_GENERAL, ESTRUCTURA_DIAGONAL, ESTRUCTURA_TRIANGULAR_SUPERIOR,
+               ESTRUCTURA_TRIANGULAR_INFERIOR, ESTRUCTURA_DIAGONAL_POR_BLOQUES,
+               ESTRUCTURA_BANDA, ESTRUCTURA_CHOLESKY)
+
+
+def detectar_estructura(matriz: np.ndarray, tolerancia: float = 1e-10) -> Tuple[str, Dict]:
+    """
+    Examina la matriz con operaciones O(n^2) (mas una factorizacion de Cholesky
+    solo si la matriz es simetrica, o hermitica si es compleja, con diagonal
+    real positiva).
+
+    Args:
+        matriz: Matriz cuadrada de coeficientes
+        tolerancia: Valores con modulo menor o igual se consideran cero
+
+    Returns:
+        Tupla con la estructura y sus datos: anchos de banda 'inferior' y
+        'superior', 'bloques' (lista de (inicio, fin)) o el factor 'L' de Cholesky
+    """
+    if matriz.ndim != 2 or matriz.shape[0] != matriz.shape[1] or matriz.shape[0] == 0:
+        return ESTRUCTURA_GENERAL, {}
+
+    n = matriz.shape[0]
+    # Primera y ultima columna no nula de cada fila (la propia diagonal si la fila
+    # es nula), por trozos de filas para no crear temporales de n^2 elementos
+    primeras = np.arange(n)
+    ultimas = np.arange(n)
+    inferior = superior = 0
+    paso = max(1, ELEMENTOS_POR_TROZO // n)
+    for inicio in range(0, n, paso):
+        fin = min(inicio + paso, n)
+        no_nulos = np.abs(matriz[inicio:fin]) > tolerancia
+        hay = no_nulos.any(axis=1)
+        filas = np.arange(inicio, fin)
+        primeras[inicio:fin] = np.where(hay, np.argmax(no_nulos, axis=1), filas)
+        ultimas[inicio:fin] = np.where(hay, n - 1 - np.argmax(no_nulos[:, ::-1], axis=1), filas)
+        inferior = max(inferior, int(np.max(filas - primeras[inicio:fin])))
+        superior = max(superior, int(np.max(ultimas[inicio:fin] - filas)))
+        if 2 * min(inferior, superior) > n and fin < n and _sin_cortes(primeras[:fin], ultimas[:fin], n):
+            completa = False  # Ni triangular, ni de banda, ni por bloques: no hace falta seguir
+            break
+    else:
+        completa = True  # Anchos exactos
+    info = {'inferior': inferior, 'superior': superior}
+
+    if inferior == 0 and superior == 0:
+        return ESTRUCTURA_DIAGONAL, info
+    if inferior == 0:
+        return ESTRUCTURA_TRIANGULAR_SUPERIOR, info
+    if superior == 0:
+        return ESTRUCTURA_TRIANGULAR_INFERIOR, info
+
+    if completa:
+        bloques = _bloques_diagonales(primeras, ultimas)
+        if len(bloques) > 1:
+            info['bloques'] = bloques
+            return ESTRUCTURA_DIAGONAL_POR_BLOQUES, info
+
+        if 2 * (inferior + superior + 1) <= n:
+            return ESTRUCTURA_BANDA, info
+
+    diagonal = np.diag(matriz)
+    if np.all(diagonal.real > tolerancia) and np.all(np.abs(diagonal.imag) <= tolerancia) \
+            and _es_hermitica(matriz, tolerancia):
+        try:
+            info['L'] = np.linalg.cholesky(matriz)
+            return ESTRUCTURA_CHOLESKY, info
+        except np.linalg.LinAlgError:
+            pass  # Simetrica pero no definida positiva
+
+    return ESTRUCTURA_GENERAL, info
+
+
+def resolver_estructurada(matriz: np.ndarray, lado: np.ndarray, tolerancia: float = 1e-10,
+                          resolver_general: Optional[Callable] = None) -> Tuple[Optional[np.ndarray], str]:
+    """
+    Resuelve Ax = b con el metodo especializado para la estructura de A.
+
+    Solo se usa cuando A es cuadrada y no singular; en cualquier otro caso se
+    devuelve None para que el solucionador siga con su algoritmo general.
+
+    Args:
+        matriz: Matriz cuadrada de coeficientes A (n x n)
+        lado: Vector b (n) o bloque B (n x k)
+        tolerancia: Valores con modulo menor o igual se consideran cero
+        resolver_general: Funcion (A, b) -> solucion o None para los bloques
+                          diagonales sin estructura propia
+
+    Returns:
+        Tupla con la solucion (None si no aplica) y la ruta usada, en el tipo de
+        trabajo de A y b (float32, float64 o complejo)
+    """
+    tipo = tipo_de_trabajo(matriz, lado)
+    matriz = np.asarray(matriz, dtype=tipo)  # Sin copia si ya tiene el tipo de trabajo
+    lado = np.asarray(lado, dtype=tipo)
+    estructura, info = detectar_estructura(matriz, tolerancia)
+    if estructura == ESTRUCTURA_GENERAL:
+        return None, ESTRUCTURA_GENERAL
+
+    diagonal = np.diag(matriz)
+    if estructura in (ESTRUCTURA_DIAGONAL, ESTRUCTURA_TRIANGULAR_SUPERIOR, ESTRUCTURA_TRIANGULAR_INFERIOR) \
+            and np.any(np.abs(diagonal) <= tolerancia):
+        return None, ESTRUCTURA_GENERAL  # Singular: la clasificacion la hace el algoritmo general
+
+    if estructura == ESTRUCTURA_DIAGONAL:
+        solucion = lado / diagonal.reshape((-1,) + (1,) * (lado.ndim - 1))
+    elif estructura == ESTRUCTURA_TRIANGULAR_SUPERIOR:
+        solucion = sustitucion_hacia_atras(matriz, lado)
+    elif estructura == ESTRUCTURA_TRIANGULAR_INFERIOR:
+        solucion = sustitucion_hacia_adelante(matriz, lado)
+    elif estructura == ESTRUCTURA_BANDA:
+        solucion = resolver_banda(matriz, lado, info['inferior'], info['superior'], tolerancia)
+        if solucion is None:
+            return None, ESTRUCTURA_GENERAL
+    elif estructura == ESTRUCTURA_CHOLESKY:
+        L = info['L']
+        if np.any(np.abs(np.diag(L)) <= tolerancia):
+            return None, ESTRUCTURA_GENERAL
+        solucion = sustitucion_hacia_atras(L.conj().T, sustitucion_hacia_adelante(L, lado))
+    else:
+        solucion = np.empty_like(lado)
+        for inicio, fin in info['bloques']:
+            parcial, _ = resolver_estructurada(matriz[inicio:fin, inicio:fin], lado[inicio:fin],
+                                               tolerancia, resolver_general)
+            if parcial is None and resolver_general is not None:
+                parcial = resolver_general(matriz[inicio:fin, inicio:fin], lado[inicio:fin])
+            if parcial is None:
+                return None, ESTRUCTURA_GENERAL
+            solucion[inicio:fin] = parcial
+
+    return solucion, estructura
+
+
+def sustitucion_hacia_atras(U: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Resuelve Ux = b con U triangular superior (diagonal no nula)."""
+    n = U.shape[0]
+    x = np.zeros(b.shape, dtype=np.result_type(U.dtype, b.dtype))
+    for i in range(n - 1, -1, -1):
+        x[i] = (b[i] - U[i, i + 1:] @ x[i + 1:]) / U[i, i]
+    return x
+
+
+def sustitucion_hacia_adelante(L: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Resuelve Lx = b con L triangular inferior (diagonal no nula)."""
+    n = L.shape[0]
+    x = np.zeros(b.shape, dtype=np.result_type(L.dtype, b.dtype))
+    for i in range(n):
+        x[i] = (b[i] - L[i, :i] @ x[:i]) / L[i, i]
+    return x
+
+
+def resolver_banda(matriz: np.ndarray, lado: np.ndarray, inferior: int, superior: int,
+                   tolerancia: float = 1e-10) -> Optional[np.ndarray]:
+    """
+    Resuelve con GaussEliminationBanda (pivoteo parcial dentro de la banda,
+    Thomas si es tridiagonal dominante). Devuelve None si la matriz es singular.
+    """
+    banda = BandedMatrix.from_dense(matriz, inferior, superior)
+    solver = GaussEliminationBanda(tolerance=tolerancia)
+    columnas = lado.reshape(len(lado), -1)
+
+    solucion = np.empty(columnas.shape, dtype=np.result_type(banda.diagonals.dtype, lado.dtype))
+    for j in range(columnas.shape[1]):
+        parcial, es_unica, _ = solver.solve(banda, columnas[:, j])
+        if not es_unica:
+            return None
+        solucion[:, j] = parcial
+    return solucion.reshape(lado.shape)
+
+
+def _es_hermitica(matriz: np.ndarray, tolerancia: float) -> bool:
+    """Compara A con A^H por trozos de filas, sin temporales de n^2 elementos."""
+    n = matriz.shape[0]
+    paso = max(1, ELEMENTOS_POR_TROZO // n)
+    for inicio in range(0, n, paso):
+        fin = min(inicio + paso, n)
+        if np.max(np.abs(matriz[inicio:fin] - matriz[:, inicio:fin].conj().T)) > tolerancia:
+            return False
+    return True
+
+
+def _sin_cortes(primeras: np.ndarray, ultimas: np.ndarray, n: int) -> bool:
+    """
+    Indica si las filas ya examinadas impiden cualquier division en bloques
+    diagonales: la fila i impide cortar entre k - 1 y k para todo k en
+    (min(primera, i), max(ultima, i)], y no queda ningun corte si esos
+    intervalos cubren 1..n-1.
+    """
+    indices = np.arange(len(primeras))
+    desde = np.minimum(primeras, indices)
+    orden = np.argsort(desde, kind='stable')
+    desde = desde[orden]
+    alcance = np.maximum.accumulate(np.maximum(ultimas, indices)[orden])
+    return bool(desde[0] == 0 and alcance[-1] >= n - 1 and np.all(desde[1:] <= alcance[:-1]))
+
+
+def _bloques_diagonales(primeras: np.ndarray, ultimas: np.ndarray) -> list:
+    """
+    Divide los indices en bloques [inicio, fin) tales que no hay elementos no
+    nulos fuera de los bloques diagonales, a partir de la primera y la ultima
+    columna no nula de cada fila.
+    """
+    n = len(primeras)
+    indices = np.arange(n)
+    # Se corta tras la fila k si ninguna fila anterior llega mas alla de k y
+    # ninguna fila posterior empieza antes de k + 1
+    alcance = np.maximum.accumulate(np.maximum(ultimas, indices))
+    comienzo = np.minimum.accumulate(np.minimum(primeras, indices)[::-1])[::-1]
+    cortes = alcance == indices
+    cortes[:-1] &= comienzo[1:] > indices[:-1]
+
+    fines = np.flatnonzero(cortes) + 1
+    inicios = np.concatenate(([0], fines[:-1]))
+    return list(zip(inicios.tolist(), fines.tolist()))
@@ -1,39 +1,67 @@
 import numpy as np
 from typing import Tuple, List, Optional
+from estructura_matriz import ESTRUCTURA_GENERAL, resolver_estructurada
+from tipos_numericos import matriz_aumentada
+from registro_pasos import (REGISTRO_NINGUNO, REGISTRO_COMPLETO, RegistroPasos, SecuenciaPasos,
+                            validar_nivel_registro)
 
 class GaussElimination:
     
     
-    def __init__(self):
-        self.steps = []  # Almacena los pasos de la eliminación
+    def __init__(self, record_level: str = REGISTRO_COMPLETO):
+        self.record_level = validar_nivel_registro(record_level)  # Detalle de los pasos guardados
+        self._active_level = self.record_level  # Nivel usado en la resolución en curso
+        self.steps = RegistroPasos()  # Almacena los pasos de la eliminación
         self.operations = []  # Almacena las operaciones realizadas
+        self.solve_path = ESTRUCTURA_GENERAL  # Ruta usada en la última resolución
+        self._order = None  # Fila física de cada fila lógica durante la eliminación
     
-    def solve(self, matrix: np.ndarray, vector: np.ndarray) -> Tuple[Optional[np.ndarray], bool, str]:
+    def solve(self, matrix: np.ndarray, vector: np.ndarray,
+              record_level: Optional[str] = None) -> Tuple[Optional[np.ndarray], bool, str]:
         """
         Resuelve el sistema de ecuaciones Ax = b usando eliminación de Gauss.
         
         Args:
             matrix: Matriz de coeficientes A (n x n)
             vector: Vector independiente b (n x 1)
+            record_level: Nivel de registro de pasos para esta llamada
+                          (None usa el nivel de la instancia)
             
         Returns:
             Tuple con:
             - Solución del sistema (None si no tiene solución única)
             - Boolean indicando si tiene solución única
             - Mensaje de error si aplica
+            Si no se piden los pasos completos, una matriz diagonal, triangular, por
+            bloques, de banda o definida positiva se resuelve por su ruta
+            especializada; la ruta usada queda en solve_path.
         """
+        self._active_level = validar_nivel_registro(record_level or self.record_level)
+        
         try:
             # Reiniciar pasos y operaciones
-            self.steps = []
+            self.steps = RegistroPasos()
             self.operations = []
+            self.solve_path = ESTRUCTURA_GENERAL
+            
+            # Ruta rápida para matrices con estructura (sin pasos que mostrar)
+            if self._active_level != REGISTRO_COMPLETO:
+                solution, path = resolver_estructurada(matrix, vector, resolver_general=self._solve_block)
+                if solution is not None:
+                    self.solve_path = path
+                    if self._recording:
+                        self.operations.append(f"Estructura detectada: {path.replace('_', ' ')} (ruta especializada)")
+                    return solution, True, ""
             
-            # Crear matriz aumentada
+            # Crear matriz aumentada (una sola copia, conservando float32 o complejos)
             n = len(matrix)
-            augmented = np.column_stack((matrix.astype(float), vector.astype(float)))
+            augmented = matriz_aumentada(matrix, vector)
+            # Pivoteo con vector de permutación: la fila lógica i es la fila física order[i]
+            self._order = order = np.arange(n)
             
             # Guardar matriz inicial
-            self.steps.append(augmented.copy())
-            self.operations.append("Matriz aumentada inicial:")
+            if self._recording:
+                self._record_step(augmented, ('inicial',), "Matriz aumentada inicial:")
             
             # Eliminación hacia adelante
             for i in range(n):
@@ -43,38 +71,67 @@ class GaussElimination:
                 if pivot_row == -1:
                     return None, False, "Sistema sin solución única (matriz singular)"
                 
-                # Intercambiar filas si es necesario
+                # Intercambiar filas si es necesario (solo los índices)
                 if pivot_row != i:
-                    augmented[[i, pivot_row]] = augmented[[pivot_row, i]]
-                    self.steps.append(augmented.copy())
-                    self.operations.append(f"Intercambiar fila {i+1} con fila {pivot_row+1}")
+                    order[i], order[pivot_row] = order[pivot_row], order[i]
+                    if self._recording:
+                        self._record_step(augmented, ('intercambio', i, pivot_row),
+                                          f"Intercambiar fila {i+1} con fila {pivot_row+1}")
                 
                 # Verificar si el pivote es cero
-                if abs(augmented[i, i]) < 1e-10:
+                pivot = augmented[order[i]]
+                if abs(pivot[i]) < 1e-10:
                     return None, False, "Sistema sin solución única (pivote nulo)"
                 
                 # Eliminar elementos debajo del pivote
                 for j in range(i + 1, n):
-                    if abs(augmented[j, i]) > 1e-10:
-                        factor = augmented[j, i] / augmented[i, i]
-                        augmented[j] = augmented[j] - factor * augmented[i]
+                    row = augmented[order[j]]
+                    if abs(row[i]) > 1e-10:
+                        factor = row[i] / pivot[i]
+                        row -= factor * pivot
                         
-                        self.steps.append(augmented.copy())
-                        self.operations.append(f"F{j+1} = F{j+1} - ({factor:.2f}) * F{i+1}")
+                        if self._recording:
+                            self._record_step(augmented, ('restar', j, i, factor),
+                                              f"F{j+1} = F{j+1} - ({factor:.2f}) * F{i+1}")
             
             # Sustitución hacia atrás
-            solution = np.zeros(n)
+            solution = np.zeros(n, dtype=augmented.dtype)
             for i in range(n - 1, -1, -1):
-                solution[i] = augmented[i, n]
+                row = augmented[order[i]]
+                solution[i] = row[n]
                 for j in range(i + 1, n):
-                    solution[i] -= augmented[i, j] * solution[j]
-                solution[i] /= augmented[i, i]
+                    solution[i] -= row[j] * solution[j]
+                solution[i] /= row[i]
             
             return solution, True, ""
             
         except Exception as e:
             return None, False, f"Error en el cálculo: {str(e)}"
     
+    @staticmethod
+    def _solve_block(matrix: np.ndarray, vector: np.ndarray) -> Optional[np.ndarray]:
+        """Resuelve un bloque diagonal sin estructura propia; None si no tiene solución única."""
+        solution, unique, _ = GaussElimination(REGISTRO_NINGUNO).solve(matrix, vector)
+        return solution if unique else None
+    
+    @property
+    def _recording(self) -> bool:
+        """Indica si la resolución en curso guarda algún tipo de paso."""
+        return self._active_level != REGISTRO_NINGUNO
+    
+    def _record_step(self, augmented: np.ndarray, step: Tuple, operation: str):
+        """
+        Guarda una operación según el nivel de registro activo.
+        
+        Args:
+            augmented: Matriz aumentada tras la operación
+            step: Operación elemental aplicada (ver RegistroPasos.agregar)
+            operation: Descripción de la operación realizada
+        """
+        if self._active_level == REGISTRO_COMPLETO:
+            self.steps.agregar(augmented, step, self._order)
+        self.operations.append(operation)
+    
     def _find_pivot(self, matrix: np.ndarray, col: int) -> int:
         """
         Encuentra la fila con el mayor elemento en valor absoluto para usar como pivote.
@@ -84,27 +141,30 @@ class GaussElimination:
             col: Columna donde buscar el pivote
             
         Returns:
-            Índice de la fila con el mayor pivote, -1 si todos son cero
+            Índice lógico de la fila con el mayor pivote, -1 si todos son cero
         """
         n = len(matrix)
         max_val = 0
         pivot_row = -1
         
         for i in range(col, n):
-            if abs(matrix[i, col]) > max_val:
-                max_val = abs(matrix[i, col])
+            value = abs(matrix[self._order[i], col])
+            if value > max_val:
+                max_val = value
                 pivot_row = i
         
         return pivot_row if max_val > 1e-10 else -1
     
-    def get_steps(self) -> List[Tuple[np.ndarray, str]]:
+    def get_steps(self) -> SecuenciaPasos:
         """
         Retorna los pasos del proceso de eliminación.
+        Solo contiene pasos si se resolvió con nivel de registro completo.
+        Cada matriz se reconstruye al accederla a partir del registro compacto.
         
         Returns:
-            Lista de tuplas (matriz, operación)
+            Secuencia de tuplas (matriz, operación)
         """
-        return list(zip(self.steps, self.operations))
+        return SecuenciaPasos(self.steps, self.operations)
     
     def format_matrix(self, matrix: np.ndarray, decimals: int = 2) -> str:
         """
@@ -0,0 +1,244 @@
+import numpy as np
+from typing import Tuple, Optional, Union
+from registro_pasos import REGISTRO_NINGUNO, validar_nivel_registro
+from tipos_numericos import tipo_de_trabajo
+
+
+class BandedMatrix:
+    """
+    Matriz de banda guardada por diagonales.
+
+    Con `lower` subdiagonales y `upper` superdiagonales, el elemento A[i, j]
+    (con -lower <= j - i <= upper) se guarda en diagonals[upper + i - j, j], el
+    mismo formato que usa LAPACK. La memoria es (lower + upper + 1) × n en lugar
+    de n × n. Las diagonales conservan su tipo si es float32, float64 o complejo.
+    """
+
+    def __init__(self, diagonals: np.ndarray, lower: int, upper: int):
+        self.diagonals = np.asarray(diagonals, dtype=tipo_de_trabajo(diagonals))
+        self.lower = lower  # Número de subdiagonales
+        self.upper = upper  # Número de superdiagonales
+        if self.diagonals.ndim != 2 or self.diagonals.shape[0] != lower + upper + 1:
+            raise ValueError(f"Se esperaban {lower + upper + 1} diagonales, "
+                             f"se recibió un arreglo de forma {self.diagonals.shape}")
+        self.n = self.diagonals.shape[1]
+
+    @classmethod
+    def from_dense(cls, matrix: np.ndarray, lower: Optional[int] = None,
+                   upper: Optional[int] = None) -> 'BandedMatrix':
+        """
+        Extrae la banda de una matriz cuadrada densa.
+
+        Args:
+            matrix: Matriz cuadrada (n × n)
+            lower: Subdiagonales a guardar (None = las que tengan elementos no nulos)
+            upper: Superdiagonales a guardar (None = las que tengan elementos no nulos)
+        """
+        matrix = np.asarray(matrix, dtype=tipo_de_trabajo(matrix))
+        n = matrix.shape[0]
+        rows, cols = np.nonzero(matrix)
+        if lower is None:
+            lower = int(max(np.max(rows - cols, initial=0), 0))
+        if upper is None:
+            upper = int(max(np.max(cols - rows, initial=0), 0))
+
+        diagonals = np.zeros((lower + upper + 1, n), dtype=matrix.dtype)
+        for offset in range(-lower, upper + 1):
+            values = np.diagonal(matrix, offset)
+            if offset >= 0:
+                diagonals[upper - offset, offset:] = values
+            else:
+                diagonals[upper - offset, :n + offset] = values
+        return cls(diagonals, lower, upper)
+
+    @classmethod
+    def tridiagonal(cls, sub: np.ndarray, diag: np.ndarray, sup: np.ndarray) -> 'BandedMatrix':
+        """
+        Construye una matriz tridiagonal.
+
+        Args:
+            sub: Subdiagonal (n-1 elementos, A[i+1, i])
+            diag: Diagonal principal (n elementos)
+            sup: Superdiagonal (n-1 elementos, A[i, i+1])
+        """
+        n = len(diag)
+        diagonals = np.zeros((3, n), dtype=tipo_de_trabajo(sub, diag, sup))
+        diagonals[0, 1:] = sup
+        diagonals[1] = diag
+        diagonals[2, :-1] = sub
+        return cls(diagonals, 1, 1)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.n, self.n
+
+    def to_dense(self) -> np.ndarray:
+        """Convierte la banda a una matriz densa n × n."""
+        matrix = np.zeros((self.n, self.n), dtype=self.diagonals.dtype)
+        for offset in range(-self.lower, self.upper + 1):
+            row = self.upper - offset
+            if offset >= 0:
+                values = self.diagonals[row, offset:]
+            else:
+                values = self.diagonals[row, :self.n + offset]
+            matrix += np.diag(values, offset)
+        return matrix
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """Producto A @ x sin formar la matriz densa."""
+        result = np.zeros(self.n, dtype=np.result_type(self.diagonals.dtype, np.asarray(x).dtype))
+        for offset in range(-self.lower, self.upper + 1):
+            row = self.upper - offset
+            if offset >= 0:
+                result[:self.n - offset] += self.diagonals[row, offset:] * x[offset:]
+            else:
+                result[-offset:] += self.diagonals[row, :self.n + offset] * x[:self.n + offset]
+        return result
+
+
+class GaussEliminationBanda:
+    """
+    Eliminación de Gauss con pivoteo parcial sobre una matriz de banda.
+
+    Con pivoteo parcial el intercambio de filas puede extender la banda superior
+    hasta lower + upper diagonales, por lo que se trabaja sobre un arreglo de
+    (2·lower + upper + 1) × n diagonales. El costo es O(n·lower·(lower + upper)) en
+    tiempo y O(n·(lower + upper)) en memoria. Para matrices tridiagonales de
+    diagonal dominante se usa el algoritmo de Thomas, que no necesita pivotear.
+
+    No guarda matrices intermedias (serían densas); con record_level distinto de
+    "ninguno" solo se describen los intercambios de filas.
+    """
+
+    def __init__(self, record_level: str = REGISTRO_NINGUNO, tolerance: float = 1e-10):
+        self.record_level = validar_nivel_registro(record_level)  # Detalle de las operaciones guardadas
+        self._active_level = self.record_level  # Nivel usado en la resolución en curso
+        self.tolerance = tolerance  # Pivotes con módulo menor o igual se consideran cero
+        self.operations = []  # Almacena las operaciones realizadas
+        self.method = ""  # Algoritmo usado en la última resolución: "thomas" o "banda"
+
+    def solve(self, matrix: Union[BandedMatrix, np.ndarray], vector: np.ndarray,
+              record_level: Optional[str] = None) -> Tuple[Optional[np.ndarray], bool, str]:
+        """
+        Resuelve el sistema de banda Ax = b.
+
+        Args:
+            matrix: Matriz de banda, o matriz cuadrada densa de la que se extrae la banda
+            vector: Vector independiente b (n)
+            record_level: Nivel de registro para esta llamada (None usa el de la instancia)
+
+        Returns:
+            Tuple con:
+            - Solución del sistema (None si no tiene solución única)
+            - Boolean indicando si tiene solución única
+            - Mensaje de error si aplica
+        """
+        self._active_level = validar_nivel_registro(record_level or self.record_level)
+
+        try:
+            self.operations = []
+            self.method = ""
+            if not isinstance(matrix, BandedMatrix):
+                matrix = BandedMatrix.from_dense(matrix)
+
+            b = np.asarray(vector, dtype=tipo_de_trabajo(matrix.diagonals, vector))
+            if b.shape != (matrix.n,):
+                return None, False, f"Dimensiones incompatibles: matriz {matrix.n}×{matrix.n}, vector {len(b)}×1"
+
+            if matrix.lower == 1 and matrix.upper == 1 and self._diagonally_dominant(matrix):
+                self.method = "thomas"
+                return self._thomas(matrix, b)
+
+            self.method = "banda"
+            return self._banded_elimination(matrix, b)
+
+        except Exception as e:
+            return None, False, f"Error en el cálculo: {str(e)}"
+
+    @staticmethod
+    def _diagonally_dominant(matrix: BandedMatrix) -> bool:
+        """Diagonal estrictamente dominante por filas (no hace falta pivotear)."""
+        d = matrix.diagonals
+        off_diagonal = np.zeros(matrix.n)
+        off_diagonal[:-1] += np.abs(d[0, 1:])  # A[i, i+1]
+        off_diagonal[1:] += np.abs(d[2, :-1])  # A[i, i-1]
+        return bool(np.all(np.abs(d[1]) > off_diagonal))
+
+    def _thomas(self, matrix: BandedMatrix, b: np.ndarray) -> Tuple[Optional[np.ndarray], bool, str]:
+        """Algoritmo de Thomas: eliminación y sustitución tridiagonal en O(n)."""
+        n = matrix.n
+        sup = matrix.diagonals[0, 1:].tolist()
+        diag = matrix.diagonals[1].tolist()
+        sub = matrix.diagonals[2, :-1].tolist()
+        rhs = b.tolist()
+
+        # Eliminación hacia adelante (escalares de Python: más rápido que NumPy elemento a elemento)
+        for i in range(1, n):
+            factor = sub[i - 1] / diag[i - 1]
+            diag[i] -= factor * sup[i - 1]
+            rhs[i] -= factor * rhs[i - 1]
+
+        # Sustitución hacia atrás
+        solution = [0.0] * n
+        solution[n - 1] = rhs[n - 1] / diag[n - 1]
+        for i in range(n - 2, -1, -1):
+            solution[i] = (rhs[i] - sup[i] * solution[i + 1]) / diag[i]
+
+        if self._recording:
+            self.operations.append(f"Algoritmo de Thomas sobre {n} ecuaciones (sin intercambios)")
+        return np.array(solution, dtype=b.dtype), True, ""
+
+    def _banded_elimination(self, matrix: BandedMatrix, b: np.ndarray) -> Tuple[Optional[np.ndarray], bool, str]:
+        """Eliminación con pivoteo parcial y sustitución hacia atrás dentro de la banda."""
+        n, kl, ku = matrix.n, matrix.lower, matrix.upper
+        width = kl + ku  # Banda superior tras los intercambios
+        d = kl + ku  # Fila de la diagonal principal en el arreglo de trabajo
+
+        # work[d + i - j, j] = A[i, j]; las primeras kl filas reciben el relleno del pivoteo
+        work = np.zeros((2 * kl + ku + 1, n), dtype=b.dtype)
+        work[kl:] = matrix.diagonals
+        rhs = b.copy()
+
+        for k in range(n):
+            last_row = min(n - 1, k + kl)
+            last_col = min(n - 1, k + width)
+
+            # Buscar pivote en la columna k (filas k..k+kl)
+            candidates = np.abs(work[d:d + last_row - k + 1, k])
+            offset = int(np.argmax(candidates))
+            if candidates[offset] <= self.tolerance:
+                return None, False, "Sistema sin solución única (matriz singular)"
+
+            cols = np.arange(k, last_col + 1)
+            if offset > 0:
+                p = k + offset
+                row_k = work[d + k - cols, cols].copy()
+                work[d + k - cols, cols] = work[d + p - cols, cols]
+                work[d + p - cols, cols] = row_k
+                rhs[k], rhs[p] = rhs[p], rhs[k]
+                if self._recording:
+                    self.operations.append(f"Intercambiar fila {k+1} con fila {p+1}")
+
+            if last_row == k:
+                continue
+
+            # Eliminar debajo del pivote solo dentro de la banda
+            rows = np.arange(k + 1, last_row + 1)
+            factors = work[d + rows - k, k] / work[d, k]
+            pivot_row = work[d + k - cols, cols]
+            work[d + rows[:, None] - cols[None, :], cols[None, :]] -= np.outer(factors, pivot_row)
+            rhs[k + 1:last_row + 1] -= factors * rhs[k]
+
+        # Sustitución hacia atrás con la banda superior ampliada
+        solution = np.zeros(n, dtype=b.dtype)
+        for i in range(n - 1, -1, -1):
+            last_col = min(n - 1, i + width)
+            cols = np.arange(i + 1, last_col + 1)
+            solution[i] = (rhs[i] - work[d + i - cols, cols] @ solution[i + 1:last_col + 1]) / work[d, i]
+
+        return solution, True, ""
+
+    @property
+    def _recording(self) -> bool:
+        """Indica si la resolución en curso guarda la descripción de las operaciones."""
+        return self._active_level != REGISTRO_NINGUNO
@@ -1,116 +1,368 @@
 import numpy as np
 from typing import Tuple, List, Optional, Union
+from registro_pasos import (REGISTRO_NINGUNO, REGISTRO_COMPLETO, RegistroPasos, SecuenciaPasos,
+                            validar_nivel_registro)
+from espacio_trabajo import (EspacioTrabajo, factores_en_ceros, ordenar_filas, permutacion_identidad,
+                             producto_para, solucion_en_ceros, vista_aumentada)
+from tipos_numericos import matriz_aumentada, tipo_de_trabajo
+
+# Precisión usada por solve_mixed_precision
+PRECISION_MIXED = "mixta"  # Factorización float32/complex64 con refinamiento en float64/complex128
+PRECISION_DOUBLE = "doble"  # Resolución completa en float64/complex128 (respaldo)
 
 class GaussEliminationMejorado:
    
     
-    def __init__(self):
-        self.steps = []  # Almacena los pasos de la eliminación
+    def __init__(self, record_level: str = REGISTRO_COMPLETO):
+        self.record_level = validar_nivel_registro(record_level)  # Detalle de los pasos guardados
+        self._active_level = self.record_level  # Nivel usado en la resolución en curso
+        self.steps = RegistroPasos()  # Almacena los pasos de la eliminación
         self.operations = []  # Almacena las operaciones realizadas
+        self.solution_types = []  # Tipo de solución de cada lado derecho (unico, infinito, inconsistente)
+        self.row_permutation = None  # Fila original de cada fila de la matriz escalonada
+        self._active_workspace = None  # Espacio de trabajo de la resolución en curso
+        self.precision_used = ""  # Precisión de la última llamada a solve_mixed_precision
+        self.refinement_iterations = 0  # Iteraciones de refinamiento de esa llamada
+        self.refinement_residual = np.nan  # Residuo relativo final ||b - Ax|| / (||A||·||x|| + ||b||)
     
-    def solve(self, matrix: np.ndarray, vector: np.ndarray) -> Tuple[Optional[np.ndarray], bool, str]:
+    def solve(self, matrix: np.ndarray, vector: np.ndarray, record_level: Optional[str] = None,
+              workspace: Optional[EspacioTrabajo] = None,
+              overwrite_input: bool = False) -> Tuple[Optional[np.ndarray], bool, str]:
         """
         Resuelve el sistema de ecuaciones Ax = b usando eliminación de Gauss.
         Soporta matrices rectangulares.
         
         Args:
             matrix: Matriz de coeficientes A (m × n)
-            vector: Vector independiente b (m × 1)
+            vector: Vector independiente b (m × 1), o bloque B (m × k) con k lados
+                    derechos que se reducen todos en una sola pasada
+            record_level: Nivel de registro de pasos para esta llamada
+                          (None usa el nivel de la instancia)
+            workspace: Buffers reutilizables (ver EspacioTrabajo). Resolver
+                       repetidamente sistemas de la misma forma sin registrar pasos
+                       no reserva memoria de tamaño m × n; la solución y
+                       row_permutation son vistas del espacio
+            overwrite_input: Si A y b son vistas de un mismo arreglo [A | b] del tipo
+                             de trabajo (ver EspacioTrabajo.entrada), la eliminación
+                             se hace en ese arreglo sin copiarlo
             
         Returns:
             Tuple con:
             - Solución del sistema (None si no tiene solución única)
             - Boolean indicando si tiene solución única
             - Mensaje de error/información si aplica
+            Con un bloque B se devuelven la matriz de soluciones (n × k, con NaN en
+            las columnas inconsistentes), un arreglo de booleanos por columna y un
+            resumen; la clasificación de cada columna queda en solution_types.
         """
+        self._active_level = validar_nivel_registro(record_level or self.record_level)
+        self._active_workspace = workspace
+        
         try:
             # Reiniciar pasos y operaciones
-            self.steps = []
+            self.steps = RegistroPasos()
             self.operations = []
+            self.solution_types = []
+            self.row_permutation = None
             
             # Validar dimensiones
             m, n = matrix.shape  # m = número de ecuaciones, n = número de variables
             if len(vector) != m:
                 return None, False, f"Dimensiones incompatibles: matriz {m}×{n}, vector {len(vector)}×1"
             
-            # Crear matriz aumentada
-            augmented = np.column_stack((matrix.astype(float), vector.astype(float)))
+            # Crear matriz aumentada (una sola copia, conservando float32 o complejos), en el
+            # buffer del espacio de trabajo o, si se permite, directamente sobre la entrada
+            dtype = tipo_de_trabajo(matrix, vector)
+            k = None if np.ndim(vector) == 1 else vector.shape[1]
+            augmented = vista_aumentada(matrix, vector, dtype) if overwrite_input else None
+            if augmented is not None and workspace is not None:
+                workspace.preparar(m, n, k, dtype)
+            elif augmented is None:
+                augmented = (matriz_aumentada(matrix, vector, dtype) if workspace is None
+                             else workspace.cargar(matrix, vector, dtype))
+            self.row_permutation = permutacion_identidad(workspace, m)
             
             # Guardar matriz inicial
-            self.steps.append(augmented.copy())
-            self.operations.append(f"Matriz aumentada inicial ({m}×{n+1}):")
+            if self._recording:
+                self._record_step(augmented, ('inicial',), f"Matriz aumentada inicial ({m}×{n+1}):")
             
             # Análisis inicial del sistema
-            if m > n:
-                self.operations.append(f"Sistema sobredeterminado: {m} ecuaciones, {n} incógnitas")
-            elif m < n:
-                self.operations.append(f"Sistema subdeterminado: {m} ecuaciones, {n} incógnitas")
-            else:
-                self.operations.append(f"Sistema cuadrado: {m} ecuaciones, {n} incógnitas")
+            if self._recording:
+                if m > n:
+                    self.operations.append(f"Sistema sobredeterminado: {m} ecuaciones, {n} incógnitas")
+                elif m < n:
+                    self.operations.append(f"Sistema subdeterminado: {m} ecuaciones, {n} incógnitas")
+                else:
+                    self.operations.append(f"Sistema cuadrado: {m} ecuaciones, {n} incógnitas")
             
             # Eliminación hacia adelante
-            rank = 0  # Rango de la matriz
-            pivot_cols = []  # Columnas pivote
-            
-            for col in range(min(m, n)):  # Procesar hasta min(filas, columnas)
-                # Buscar pivote en la columna actual
-                pivot_row = self._find_pivot_rectangular(augmented, rank, col)
-                
-                if pivot_row == -1:
-                    # No hay pivote en esta columna, continuar con la siguiente
-                    continue
-                
-                # Intercambiar filas si es necesario
-                if pivot_row != rank:
-                    augmented[[rank, pivot_row]] = augmented[[pivot_row, rank]]
-                    self.steps.append(augmented.copy())
-                    self.operations.append(f"Intercambiar fila {rank+1} con fila {pivot_row+1}")
-                
-                # Verificar si el pivote es válido
-                if abs(augmented[rank, col]) < 1e-10:
-                    continue
-                
-                pivot_cols.append(col)
-                
-                # Eliminar elementos debajo del pivote
-                for i in range(rank + 1, m):
-                    if abs(augmented[i, col]) > 1e-10:
-                        factor = augmented[i, col] / augmented[rank, col]
-                        augmented[i] = augmented[i] - factor * augmented[rank]
-                        
-                        self.steps.append(augmented.copy())
-                        self.operations.append(f"F{i+1} = F{i+1} - ({factor:.2f}) * F{rank+1}")
-                
-                rank += 1
+            rank, pivot_cols = self._forward_elimination(augmented, m, n, permutation=self.row_permutation)
+            ordenar_filas(augmented, self.row_permutation, workspace)
             
             # Analizar el resultado
+            if np.ndim(vector) == 2:
+                return self._analyze_multiple(augmented, m, n, rank, pivot_cols)
             return self._analyze_solution(augmented, m, n, rank, pivot_cols)
             
         except Exception as e:
             return None, False, f"Error en el cálculo: {str(e)}"
+        finally:
+            self._active_workspace = None
+    
+    def solve_mixed_precision(self, matrix: np.ndarray, vector: np.ndarray,
+                              max_iterations: int = 30) -> Tuple[Optional[np.ndarray], bool, str]:
+        """
+        Resuelve un sistema cuadrado factorizando en float32 y recuperando la
+        precisión de float64 con refinamiento iterativo.
+        
+        La factorización PA = LU se hace una sola vez en float32 (la mitad de
+        memoria y de tráfico). Luego se repite r = b - Ax en float64 y x += d con
+        d la solución de Ad = r usando los factores float32, hasta que el residuo
+        relativo baja de sqrt(n)·eps(float64). Si la matriz no es cuadrada, los
+        factores float32 no tienen rango completo, o el residuo deja de bajar al
+        menos a la mitad (matriz mal condicionada para float32), se resuelve con
+        solve en float64. Los sistemas complejos usan complex64 y complex128.
+        
+        Args:
+            matrix: Matriz de coeficientes A (m × n)
+            vector: Vector independiente b (m)
+            max_iterations: Máximo de iteraciones de refinamiento
+            
+        Returns:
+            Mismo resultado que solve. La precisión usada queda en precision_used
+            ("mixta" o "doble"), y las iteraciones y el residuo relativo final en
+            refinement_iterations y refinement_residual
+        """
+        self.precision_used = ""
+        self.refinement_iterations = 0
+        self.refinement_residual = np.nan
+        
+        try:
+            high = np.promote_types(tipo_de_trabajo(matrix, vector), np.float64)
+            low = np.dtype(np.complex64 if high.kind == 'c' else np.float32)
+            matrix = np.asarray(matrix, dtype=high)
+            vector = np.asarray(vector, dtype=high)
+            m, n = matrix.shape
+            if vector.shape != (m,):
+                return None, False, f"Dimensiones incompatibles: matriz {m}×{n}, vector {len(vector)}×1"
+            
+            if m == n:
+                factors = self.factorizar(matrix, dtype=low)
+                if factors.rango == n:
+                    solution = self._refine(matrix, vector, factors, max_iterations)
+                    if solution is not None:
+                        self.precision_used = PRECISION_MIXED
+                        return solution, True, (f"Solución única encontrada (precisión mixta: "
+                                                f"{self.refinement_iterations} iteraciones de refinamiento, "
+                                                f"residuo relativo {self.refinement_residual:.2e})")
+            
+            # Respaldo: eliminación completa en float64
+            self.precision_used = PRECISION_DOUBLE
+            self.refinement_iterations = 0
+            solution, unique, msg = self.solve(matrix, vector)
+            if solution is not None:
+                self.refinement_residual = self._relative_residual(matrix, vector, solution)
+            return solution, unique, msg
+            
+        except Exception as e:
+            return None, False, f"Error en el cálculo: {str(e)}"
+    
+    def _refine(self, matrix: np.ndarray, vector: np.ndarray, factors: 'FactorizacionGauss',
+                max_iterations: int) -> Optional[np.ndarray]:
+        """
+        Refinamiento iterativo con residuos en float64 y correcciones con los
+        factores float32. Devuelve None si no converge.
+        """
+        threshold = np.sqrt(len(vector)) * np.finfo(np.float64).eps
+        solution = factors.resolver(vector)[0].astype(vector.dtype)  # Acumulada en la precisión alta
+        previous = np.inf
+        
+        for iteration in range(max_iterations + 1):
+            residual = vector - matrix @ solution
+            relative = self._relative_residual(matrix, vector, solution, residual)
+            self.refinement_iterations = iteration
+            self.refinement_residual = relative
+            
+            if not np.isfinite(relative):
+                return None
+            if relative <= threshold:
+                return solution
+            if relative > 0.5 * previous or iteration == max_iterations:
+                return None  # Estancado: float32 no alcanza para esta matriz
+            
+            previous = relative
+            solution = solution + factors.resolver(residual)[0]
+        
+        return None
+    
+    @staticmethod
+    def _relative_residual(matrix: np.ndarray, vector: np.ndarray, solution: np.ndarray,
+                           residual: Optional[np.ndarray] = None) -> float:
+        """Residuo relativo ||b - Ax||∞ / (||A||∞·||x||∞ + ||b||∞)."""
+        if residual is None:
+            residual = vector - matrix @ solution
+        scale = np.linalg.norm(matrix, np.inf) * np.linalg.norm(solution, np.inf) + np.linalg.norm(vector, np.inf)
+        return float(np.linalg.norm(residual, np.inf) / scale) if scale > 0 else 0.0
     
-    def _find_pivot_rectangular(self, matrix: np.ndarray, start_row: int, col: int) -> int:
+    def factorizar(self, matrix: np.ndarray, dtype: Optional[type] = None) -> 'FactorizacionGauss':
+        """
+        Realiza una sola vez la eliminación hacia adelante de A y la guarda como
+        PA = LU para resolver después muchos vectores b sin repetir el trabajo O(n³).
+        
+        Args:
+            matrix: Matriz de coeficientes A (m × n)
+            dtype: Tipo de los factores (None conserva el de la matriz: float32,
+                   float64 o complejo; los enteros pasan a float64)
+            
+        Returns:
+            Factorización reutilizable (permutación, multiplicadores L, U, rango y
+            columnas pivote); cada resolución cuesta O(n²)
+        """
+        m, n = matrix.shape
+        upper = np.array(matrix, dtype=tipo_de_trabajo(matrix) if dtype is None else dtype)
+        multipliers = np.zeros((m, min(m, n)), dtype=upper.dtype)
+        permutation = np.arange(m)
+        
+        # Sin pasos durante la factorización; el nivel de la instancia se conserva
+        previous_level, self._active_level = self._active_level, REGISTRO_NINGUNO
+        try:
+            rank, pivot_cols = self._forward_elimination(upper, m, n, multipliers, permutation)
+        finally:
+            self._active_level = previous_level
+        
+        # Las filas se ordenan una sola vez, al final
+        return FactorizacionGauss(permutation, multipliers[permutation, :rank], upper[permutation],
+                                  rank, pivot_cols)
+    
+    def _forward_elimination(self, augmented: np.ndarray, m: int, n: int,
+                             multipliers: Optional[np.ndarray] = None,
+                             permutation: Optional[np.ndarray] = None) -> Tuple[int, List[int]]:
+        """
+        Lleva la matriz a forma escalonada con pivoteo parcial.
+        
+        Los intercambios solo permutan el vector de permutación (la fila lógica i
+        está en la fila física permutation[i]); las filas no se mueven y los pasos
+        se registran en el orden lógico.
+        
+        Args:
+            augmented: Matriz aumentada (se modifica en el lugar, sin reordenar filas)
+            m: Número de ecuaciones
+            n: Número de variables
+            multipliers: Si se indica, recibe el factor de cada eliminación (matriz L),
+                         por fila física
+            permutation: Si se indica, recibe el orden de filas resultante de los intercambios
+            
+        Returns:
+            Tuple con el rango y la lista de columnas pivote
+        """
+        order = np.arange(m) if permutation is None else permutation
+        rank = 0  # Rango de la matriz
+        pivot_cols = []  # Columnas pivote
+        
+        for col in range(n):  # Procesar cada columna hasta agotar las filas
+            if rank == m:
+                break
+            # Buscar pivote en la columna actual
+            pivot_row = self._find_pivot_rectangular(augmented, rank, col, order)
+            
+            if pivot_row == -1:
+                # No hay pivote en esta columna, continuar con la siguiente
+                continue
+            
+            # Intercambiar filas si es necesario (solo los índices)
+            if pivot_row != rank:
+                order[rank], order[pivot_row] = order[pivot_row], order[rank]
+                if self._recording:
+                    self._record_step(augmented, ('intercambio', rank, pivot_row),
+                                      f"Intercambiar fila {rank+1} con fila {pivot_row+1}", order)
+            
+            pivot = augmented[order[rank]]
+            
+            # Verificar si el pivote es válido
+            if abs(pivot[col]) < 1e-10:
+                continue
+            
+            pivot_cols.append(col)
+            
+            # Eliminar elementos debajo del pivote
+            if not self._recording:
+                # Actualización de rango 1 sobre todas las filas a eliminar (mismas operaciones).
+                # Las columnas a la izquierda de col ya no se leen: basta actualizar desde col
+                below = order[rank + 1:]
+                column = augmented[below, col]
+                keep = np.abs(column) > 1e-10
+                rows = below[keep]
+                factors = column[keep] / pivot[col]
+                product = producto_para(self._active_workspace, augmented, m)
+                if product is not None and len(rows) > 0:
+                    # Producto exterior en el buffer del espacio de trabajo, con factor 0 en
+                    # las filas que no se eliminan: actualización contigua sin reservar memoria
+                    full = factores_en_ceros(self._active_workspace, m, augmented.dtype)
+                    full[rows] = factors
+                    np.multiply(full[:, None], pivot[col:], out=product[:, col:])
+                    augmented[:, col:] -= product[:, col:]
+                elif len(rows) > 0:
+                    augmented[rows, col:] -= np.outer(factors, pivot[col:])
+                if multipliers is not None:
+                    multipliers[rows, rank] = factors
+                rank += 1
+                continue
+            
+            for i in range(rank + 1, m):
+                row = augmented[order[i]]
+                if abs(row[col]) > 1e-10:
+                    factor = row[col] / pivot[col]
+                    row -= factor * pivot
+                    if multipliers is not None:
+                        multipliers[order[i], rank] = factor
+                    
+                    if self._recording:
+                        self._record_step(augmented, ('restar', i, rank, factor),
+                                          f"F{i+1} = F{i+1} - ({factor:.2f}) * F{rank+1}", order)
+            
+            rank += 1
+        
+        return rank, pivot_cols
+    
+    @property
+    def _recording(self) -> bool:
+        """Indica si la resolución en curso guarda algún tipo de paso."""
+        return self._active_level != REGISTRO_NINGUNO
+    
+    def _record_step(self, augmented: np.ndarray, step: Tuple, operation: str,
+                     order: Optional[np.ndarray] = None):
+        """
+        Guarda una operación según el nivel de registro activo.
+        
+        Args:
+            augmented: Matriz aumentada tras la operación
+            step: Operación elemental aplicada (ver RegistroPasos.agregar)
+            operation: Descripción de la operación realizada
+            order: Fila física de cada fila lógica, si hubo pivoteo por permutación
+        """
+        if self._active_level == REGISTRO_COMPLETO:
+            self.steps.agregar(augmented, step, order)
+        self.operations.append(operation)
+    
+    def _find_pivot_rectangular(self, matrix: np.ndarray, start_row: int, col: int,
+                                order: np.ndarray) -> int:
         """
         Encuentra el mejor pivote en una columna específica para matrices rectangulares.
         
         Args:
             matrix: Matriz aumentada
-            start_row: Fila donde empezar a buscar
+            start_row: Fila lógica donde empezar a buscar
             col: Columna donde buscar el pivote
+            order: Fila física de cada fila lógica
             
         Returns:
-            Índice de la fila con el mejor pivote, -1 si no hay pivote válido
+            Índice lógico de la fila con el mejor pivote, -1 si no hay pivote válido
         """
-        m = matrix.shape[0]
-        max_val = 0
-        pivot_row = -1
-        
-        for i in range(start_row, m):
-            if abs(matrix[i, col]) > max_val:
-                max_val = abs(matrix[i, col])
-                pivot_row = i
-        
-        return pivot_row if max_val > 1e-10 else -1
+        values = np.abs(matrix[order[start_row:], col])
+        if len(values) == 0:
+            return -1
+        best = int(np.argmax(values))  # El primero de los máximos, como el recorrido fila a fila
+        return start_row + best if values[best] > 1e-10 else -1
     
     def _analyze_solution(self, augmented: np.ndarray, m: int, n: int, rank: int, 
                          pivot_cols: List[int]) -> Tuple[Optional[np.ndarray], bool, str]:
@@ -152,6 +404,49 @@ class GaussEliminationMejorado:
         else:
             return None, False, "Error en análisis de rango"
     
+    def _analyze_multiple(self, augmented: np.ndarray, m: int, n: int, rank: int,
+                          pivot_cols: List[int]) -> Tuple[np.ndarray, np.ndarray, str]:
+        """
+        Clasifica cada lado derecho de un sistema con varios términos independientes.
+        
+        Args:
+            augmented: Matriz [A | B] escalonada
+            m: Número de ecuaciones
+            n: Número de variables
+            rank: Rango de la matriz de coeficientes
+            pivot_cols: Lista de columnas pivote
+            
+        Returns:
+            Tuple con matriz de soluciones (n × k), arreglo de unicidad y resumen
+        """
+        rhs = augmented[:, n:]
+        k = rhs.shape[1]
+        
+        # Verificar consistencia por columna (0 = número ≠ 0)
+        inconsistent = (np.abs(rhs[rank:m]) > 1e-10).any(axis=0)
+        
+        self.solution_types = []
+        for no_solution in inconsistent:
+            if no_solution:
+                self.solution_types.append("inconsistente")
+            elif rank == n:
+                self.solution_types.append("unico")
+            else:
+                self.solution_types.append("infinito")
+        
+        # Sustitución hacia atrás simultánea (variables libres = 0)
+        solutions = solucion_en_ceros(self._active_workspace, (n, k), augmented.dtype)
+        for i in range(rank - 1, -1, -1):
+            col = pivot_cols[i]
+            solutions[col] = (rhs[i] - augmented[i, col + 1:n] @ solutions[col + 1:n]) / augmented[i, col]
+        solutions[:, inconsistent] = np.nan
+        
+        unique = np.array([kind == "unico" for kind in self.solution_types], dtype=bool)
+        msg = (f"{k} lados derechos: {self.solution_types.count('unico')} con solución única, "
+               f"{self.solution_types.count('infinito')} con infinitas soluciones, "
+               f"{self.solution_types.count('inconsistente')} inconsistentes")
+        return solutions, unique, msg
+    
     def _back_substitution(self, augmented: np.ndarray, n: int, pivot_cols: List[int]) -> np.ndarray:
         """
         Realiza sustitución hacia atrás para sistemas con solución única.
@@ -164,15 +459,14 @@ class GaussEliminationMejorado:
         Returns:
             Vector solución
         """
-        solution = np.zeros(n)
+        solution = solucion_en_ceros(self._active_workspace, (n,), augmented.dtype)
         
         for i in range(len(pivot_cols) - 1, -1, -1):
             col = pivot_cols[i]
             solution[col] = augmented[i, n]  # Término independiente
             
             # Restar contribuciones de variables ya resueltas
-            for j in range(col + 1, n):
-                solution[col] -= augmented[i, j] * solution[j]
+            solution[col] -= augmented[i, col + 1:n] @ solution[col + 1:n]
             
             # Dividir por el coeficiente
             solution[col] /= augmented[i, col]
@@ -194,15 +488,14 @@ class GaussEliminationMejorado:
             Una solución particular (variables libres = 0)
         """
         try:
-            solution = np.zeros(n)
+            solution = solucion_en_ceros(self._active_workspace, (n,), augmented.dtype)
             
             # Resolver para las variables pivote (variables libres = 0)
             for i in range(rank - 1, -1, -1):
                 col = pivot_cols[i]
                 solution[col] = augmented[i, n]
                 
-                for j in range(col + 1, n):
-                    solution[col] -= augmented[i, j] * solution[j]
+                solution[col] -= augmented[i, col + 1:n] @ solution[col + 1:n]
                 
                 solution[col] /= augmented[i, col]
             
@@ -237,14 +530,16 @@ class GaussEliminationMejorado:
         
         return "\n".join(info)
     
-    def get_steps(self) -> List[Tuple[np.ndarray, str]]:
+    def get_steps(self) -> SecuenciaPasos:
         """
         Retorna los pasos del proceso de eliminación.
+        Solo contiene pasos si se resolvió con nivel de registro completo.
+        Cada matriz se reconstruye al accederla a partir del registro compacto.
         
         Returns:
-            Lista de tuplas (matriz, operación)
+            Secuencia de tuplas (matriz, operación)
         """
-        return list(zip(self.steps, self.operations))
+        return SecuenciaPasos(self.steps, self.operations)
     
     def format_matrix(self, matrix: np.ndarray, decimals: int = 2) -> str:
         """
@@ -268,3 +563,53 @@ class GaussEliminationMejorado:
             rows.append(" ".join(formatted_row))
         
         return "\n".join(rows)
+
+
+class FactorizacionGauss:
+    """
+    Factorización PA = LU obtenida con GaussEliminationMejorado.factorizar.
+    
+    Guarda el resultado de la eliminación hacia adelante para resolver nuevos
+    vectores b con solo una sustitución hacia adelante, la verificación de
+    consistencia y la sustitución hacia atrás.
+    """
+    
+    def __init__(self, permutacion: np.ndarray, L: np.ndarray, U: np.ndarray, rango: int,
+                 columnas_pivote: List[int]):
+        self.permutacion = permutacion  # Fila i de PA = fila permutacion[i] de A
+        self.L = L  # Multiplicadores (m × rango), diagonal unitaria implícita
+        self.U = U  # Matriz escalonada (m × n); las filas desde el rango son nulas
+        self.rango = rango  # Rango de A
+        self.columnas_pivote = columnas_pivote  # Columnas pivote de A
+        self._analizador = GaussEliminationMejorado(REGISTRO_NINGUNO)
+    
+    def resolver(self, vector: np.ndarray) -> Tuple[Optional[np.ndarray], bool, str]:
+        """
+        Resuelve Ax = b reutilizando la factorización, en O(m·rango + rango·n).
+        
+        Args:
+            vector: Vector independiente b (m × 1) o bloque B (m × k)
+            
+        Returns:
+            Mismo resultado que GaussEliminationMejorado.solve para A y b
+        """
+        m, n = self.U.shape
+        if len(vector) != m:
+            return None, False, f"Dimensiones incompatibles: matriz {m}×{n}, vector {len(vector)}×1"
+        
+        # Sustitución hacia adelante con L sobre b permutado (en la precisión de los factores,
+        # promovida a complejo si b lo es)
+        dtype = self.U.dtype
+        if np.iscomplexobj(vector):
+            dtype = np.promote_types(dtype, np.complex64)
+        c = np.asarray(vector)[self.permutacion].astype(dtype)
+        for j in range(self.rango):
+            if c.ndim == 2:
+                c[j + 1:] -= np.outer(self.L[j + 1:, j], c[j])
+            else:
+                c[j + 1:] -= self.L[j + 1:, j] * c[j]
+        
+        augmented = np.column_stack((self.U, c))
+        if c.ndim == 2:
+            return self._analizador._analyze_multiple(augmented, m, n, self.rango, self.columnas_pivote)
+        return self._analizador._analyze_solution(augmented, m, n, self.rango, self.columnas_pivote)
@@ -1,32 +1,121 @@
 import numpy as np
 from typing import Tuple, List, Optional, Dict, Set
+from cache_eliminaciones import CacheEliminaciones
+from espacio_trabajo import (EspacioTrabajo, ordenar_filas, permutacion_identidad, producto_para,
+                             solucion_en_ceros, vista_aumentada)
+from estructura_matriz import ESTRUCTURA_GENERAL, resolver_estructurada
+from eliminacion_exacta import matriz_entera, bareiss, sustitucion_exacta
+from modular_exacto import resolver_modular
+from tipos_numericos import matriz_aumentada, tipo_de_trabajo
+from registro_pasos import (REGISTRO_NINGUNO, REGISTRO_COMPLETO, RegistroPasos, SecuenciaPasos,
+                            validar_nivel_registro)
+
+# Metodos de reduccion disponibles
+METODO_ESTANDAR = "estandar"  # Columna a columna con actualizaciones de rango 1
+METODO_BLOQUES = "bloques"  # Paneles de columnas con actualizacion matriz-matriz (BLAS-3)
+METODO_EXACTO = "exacto"  # Eliminacion de Bareiss sobre enteros, soluciones racionales exactas
+METODO_MODULAR = "modular"  # Eliminacion modulo varios primos con reconstruccion CRT, exacta
+
+METODOS = (METODO_ESTANDAR, METODO_BLOQUES, METODO_EXACTO, METODO_MODULAR)
 
 class GaussJordan:
    
     
-    def __init__(self):
-        self.pasos = []  # Almacena los pasos de la eliminacion
+    def __init__(self, nivel_registro: str = REGISTRO_COMPLETO, metodo: str = METODO_ESTANDAR,
+                 tam_bloque: int = 64, tolerancia: float = 1e-10,
+                 cache: Optional[CacheEliminaciones] = None, usar_estructura: bool = True):
+        self.nivel_registro = validar_nivel_registro(nivel_registro)  # Detalle de los pasos guardados
+        self._nivel_activo = self.nivel_registro  # Nivel usado en la resolucion en curso
+        self.metodo = self._validar_metodo(metodo)  # Metodo de reduccion
+        self._metodo_activo = self.metodo  # Metodo usado en la resolucion en curso
+        self.tam_bloque = tam_bloque  # Columnas por panel en el metodo por bloques
+        self.tolerancia = tolerancia  # Valores con modulo menor o igual se consideran cero
+        self.cache = cache  # Cache opcional de eliminaciones ya calculadas
+        self.usar_estructura = usar_estructura  # Detectar estructura y usar una ruta especializada
+        self.ruta_resolucion = ESTRUCTURA_GENERAL  # Ruta usada en la ultima resolucion
+        self.matriz_reducida = None  # Matriz aumentada en forma escalonada reducida
+        self.permutacion_filas = None  # Fila original de cada fila de matriz_reducida
+        self._espacio_activo = None  # Espacio de trabajo de la resolucion en curso
+        self._sobrescribir_activo = False  # La resolucion en curso puede eliminar sobre la entrada
+        self.pasos = RegistroPasos()  # Almacena los pasos de la eliminacion
         self.operaciones = []  # Almacena las operaciones realizadas
         self.columnas_pivote = []  # Indices de columnas pivote
         self.variables_libres = []  # Indices de variables libres
         self.rango_matriz = 0  # Rango de la matriz de coeficientes
         self.rango_aumentada = 0  # Rango de la matriz aumentada
         self.tipo_sistema = ""  # Tipo de sistema: unico, infinito, inconsistente
+        self.tipos_sistema = []  # Tipo de sistema de cada lado derecho
+        self.rangos_aumentada = []  # Rango de la matriz aumentada con cada lado derecho
     
-    def resolver(self, matriz: np.ndarray, vector: np.ndarray) -> Tuple[Optional[np.ndarray], bool, str]:
+    def resolver(self, matriz: np.ndarray, vector: np.ndarray, nivel_registro: Optional[str] = None,
+                 metodo: Optional[str] = None, espacio_trabajo: Optional[EspacioTrabajo] = None,
+                 sobrescribir_entrada: bool = False) -> Tuple[Optional[np.ndarray], bool, str]:
         """
         Resuelve el sistema de ecuaciones Ax = b usando eliminacion de Gauss-Jordan.
         
         Args:
             matriz: Matriz de coeficientes A (m x n)
-            vector: Vector independiente b (m x 1)
+            vector: Vector independiente b (m x 1), o bloque B (m x k) con k lados
+                    derechos que se reducen todos en una sola pasada
+            nivel_registro: Nivel de registro de pasos para esta llamada
+                            (None usa el nivel de la instancia)
+            metodo: Metodo de reduccion para esta llamada: "estandar", "bloques",
+                    "exacto" o "modular" (None usa el metodo de la instancia). Los
+                    metodos exacto y modular no usan tolerancias y devuelven la
+                    solucion como arreglo de Fraction
+            espacio_trabajo: Buffers reutilizables (matriz aumentada, producto de las
+                             actualizaciones, permutacion y solucion). Con el metodo
+                             estandar, resolver repetidamente sistemas de la misma forma
+                             no reserva memoria de tamano m x n; la solucion,
+                             matriz_reducida y permutacion_filas son vistas del espacio.
+                             Con un espacio no se busca la ruta por estructura
+            sobrescribir_entrada: Si A y b son vistas de un mismo arreglo [A | b] del
+                                  tipo de trabajo (ver EspacioTrabajo.entrada), la
+                                  eliminacion se hace en ese arreglo sin copiarlo y la
+                                  entrada queda con la forma escalonada reducida
             
         Returns:
             Tuple con:
             - Solucion del sistema (None si no existe solucion)
             - Boolean indicando si tiene solucion unica
             - Mensaje con informacion del sistema
+            Con un bloque B se devuelven la matriz de soluciones (n x k, con NaN en
+            las columnas inconsistentes), un arreglo de booleanos por columna y un
+            resumen; la clasificacion de cada columna queda en tipos_sistema.
+            Si A es cuadrada y no se piden los pasos completos, se detecta su estructura
+            (diagonal, triangular, por bloques, banda, definida positiva) y se resuelve
+            por la ruta especializada; la ruta usada queda en ruta_resolucion.
         """
+        self._nivel_activo = validar_nivel_registro(nivel_registro or self.nivel_registro)
+        self._metodo_activo = self._validar_metodo(metodo or self.metodo)
+        self._espacio_activo = espacio_trabajo
+        self._sobrescribir_activo = sobrescribir_entrada
+        try:
+            return self._resolver_con_cache(matriz, vector)
+        finally:
+            self._espacio_activo = None
+            self._sobrescribir_activo = False
+    
+    def _resolver_con_cache(self, matriz: np.ndarray, vector: np.ndarray) -> Tuple[Optional[np.ndarray], bool, str]:
+        """Consulta la cache (si hay) antes de resolver y guarda el resultado."""
+        if self.cache is None:
+            return self._resolver(matriz, vector)
+        
+        clave = self.cache.clave(matriz, vector, tolerancia=self.tolerancia,
+                                 contexto=('GaussJordan.resolver', self._nivel_activo,
+                                           self._metodo_activo, self.tam_bloque, self.usar_estructura),
+                                 exacto=self._metodo_activo in (METODO_EXACTO, METODO_MODULAR))
+        guardado = self.cache.obtener(clave)
+        if guardado is not None:
+            return self._restaurar_desde_cache(guardado)
+        
+        resultado = self._resolver(matriz, vector)
+        if self.tipo_sistema:  # No se guardan errores de dimensiones o de calculo
+            self.cache.guardar(clave, self._estado_para_cache(resultado))
+        return resultado
+    
+    def _resolver(self, matriz: np.ndarray, vector: np.ndarray) -> Tuple[Optional[np.ndarray], bool, str]:
+        """Realiza la eliminacion y el analisis (sin consultar la cache)."""
         try:
             # Reiniciar todos los datos
             self._reiniciar_datos()
@@ -36,67 +125,342 @@ class GaussJordan:
             if len(vector) != m:
                 return None, False, f"Dimensiones incompatibles: matriz {m}x{n}, vector {len(vector)}x1"
             
-            # Crear matriz aumentada
-            aumentada = np.column_stack((matriz.astype(float), vector.astype(float)))
+            if self._metodo_activo == METODO_EXACTO:
+                return self._resolver_exacto(matriz, vector, m, n)
+            if self._metodo_activo == METODO_MODULAR:
+                return self._resolver_modular(matriz, vector, n)
+            
+            # Ruta rapida para matrices con estructura (sin pasos que mostrar). Con un
+            # espacio de trabajo no se detecta: la deteccion reserva sus propios temporales
+            if self.usar_estructura and self._nivel_activo != REGISTRO_COMPLETO and m == n \
+                    and self._espacio_activo is None:
+                solucion, ruta = resolver_estructurada(matriz, vector, self.tolerancia, self._resolver_bloque)
+                if solucion is not None:
+                    return self._aceptar_solucion_estructurada(solucion, ruta, n, vector)
+            
+            # Crear matriz aumentada (una sola copia, en el tipo de trabajo: float32, float64 o complejo),
+            # en el buffer del espacio de trabajo o, si se permite, directamente sobre la entrada
+            aumentada = self._preparar_aumentada(matriz, vector, m, n)
+            self.permutacion_filas = permutacion_identidad(self._espacio_activo, m)
             
             # Guardar estado inicial
-            self.pasos.append(aumentada.copy())
-            self.operaciones.append(f"Matriz aumentada inicial ({m}x{n+1})")
+            if self._registrando:
+                self._registrar_paso(aumentada, ('inicial',), f"Matriz aumentada inicial ({m}x{n+1})")
             
             # FASE 1: Reduccion a forma escalonada reducida
-            fila_actual = 0
-            for col in range(n):  # Procesar cada columna
-                # Buscar pivote en la columna actual
-                fila_pivote = self._buscar_pivote(aumentada, fila_actual, col, m)
+            if self._metodo_activo == METODO_BLOQUES:
+                self._reducir_por_bloques(aumentada, m, n)
+            else:
+                self._reducir_estandar(aumentada, m, n)
+            ordenar_filas(aumentada, self.permutacion_filas, self._espacio_activo)
+            
+            self.matriz_reducida = aumentada
+            
+            # FASE 2: Analizar el sistema
+            if np.ndim(vector) == 2:
+                return self._analizar_multiples(aumentada, m, n)
+            return self._analizar_sistema(aumentada, m, n)
+            
+        except Exception as e:
+            return None, False, f"Error en el calculo: {str(e)}"
+    
+    def _reducir_estandar(self, aumentada: np.ndarray, m: int, n: int):
+        """
+        Reduce la matriz aumentada a forma escalonada reducida columna a columna.
+        
+        Los intercambios solo permutan permutacion_filas (la fila logica i esta en
+        la fila fisica permutacion_filas[i]); las filas se reordenan una sola vez al
+        final (ver espacio_trabajo.ordenar_filas). Los pasos se registran en el orden logico.
+        
+        Args:
+            aumentada: Matriz aumentada (se modifica en el lugar)
+            m: Numero de ecuaciones
+            n: Numero de variables
+        """
+        orden = self.permutacion_filas
+        fila_actual = 0
+        for col in range(n):  # Procesar cada columna
+            # Buscar pivote en la columna actual
+            fila_pivote = self._buscar_pivote(aumentada, fila_actual, col, m)
+            
+            if fila_pivote == -1:
+                # No hay pivote en esta columna (variable libre)
+                self.variables_libres.append(col)
+                continue
+            
+            # Intercambiar filas si es necesario (solo los indices)
+            if fila_pivote != fila_actual:
+                self._intercambiar_permutacion(fila_actual, fila_pivote)
+                if self._registrando:
+                    self._registrar_paso(aumentada, ('intercambio', fila_actual, fila_pivote),
+                                         f"Intercambiar fila {fila_actual+1} con fila {fila_pivote+1}")
+            
+            # Registrar columna pivote
+            self.columnas_pivote.append(col)
+            
+            # Hacer el pivote igual a 1
+            fisica = orden[fila_actual]
+            pivote = aumentada[fisica, col]
+            if abs(pivote - 1.0) > self.tolerancia:
+                aumentada[fisica] /= pivote
+                if self._registrando:
+                    self._registrar_paso(aumentada, ('dividir', fila_actual, pivote),
+                                         f"F{fila_actual+1} = F{fila_actual+1} / {pivote:.2f}")
+            
+            # Eliminar todos los otros elementos en esta columna
+            filas, factores = self._eliminar_columna(aumentada, fisica, col)
+            if len(filas) > 0 and self._registrando:
+                factores = factores[orden]  # Factor de cada fila logica
+                filas = np.flatnonzero(factores)
+                self._registrar_paso(aumentada, ('rango1', fila_actual, filas, factores[filas]),
+                                     "; ".join(f"F{i+1} = F{i+1} - ({factores[i]:.2f}) * F{fila_actual+1}"
+                                               for i in filas))
+
+            fila_actual += 1
+            if fila_actual >= m:
+                break
+    
+    def _reducir_por_bloques(self, aumentada: np.ndarray, m: int, n: int):
+        """
+        Reduce la matriz aumentada a forma escalonada reducida por paneles de columnas.
+        
+        Cada panel de tam_bloque columnas se reduce con pivoteo parcial igual que en
+        el metodo estandar, pero solo sobre sus propias columnas. Las operaciones de
+        fila del panel equivalen a multiplicar por la izquierda por
+        [[W^-1, 0], [-C W^-1, I]], donde W son las filas pivote en las columnas pivote
+        del panel y C el resto de filas en esas columnas. Esa transformacion se aplica
+        a las columnas restantes con una sola multiplicacion matriz-matriz.
+        
+        Args:
+            aumentada: Matriz aumentada (se modifica en el lugar)
+            m: Numero de ecuaciones
+            n: Numero de variables
+        """
+        fila_actual = 0
+        for inicio in range(0, n, self.tam_bloque):
+            if fila_actual >= m:
+                break
+            
+            fin = min(inicio + self.tam_bloque, n)
+            panel = aumentada[:, inicio:fin]  # Vista: los cambios se reflejan en aumentada
+            original = panel.copy()  # Panel antes de reducirlo (filas fisicas: no se mueven)
+            primera_fila = fila_actual
+            pivotes_panel = []
+            
+            for col in range(inicio, fin):
+                local = col - inicio
+                fila_pivote = self._buscar_pivote(panel, fila_actual, local, m)
                 
                 if fila_pivote == -1:
-                    # No hay pivote en esta columna (variable libre)
                     self.variables_libres.append(col)
                     continue
                 
-                # Intercambiar filas si es necesario
+                # El intercambio solo permuta los indices de fila
                 if fila_pivote != fila_actual:
-                    aumentada[[fila_actual, fila_pivote]] = aumentada[[fila_pivote, fila_actual]]
-                    self.pasos.append(aumentada.copy())
-                    self.operaciones.append(f"Intercambiar fila {fila_actual+1} con fila {fila_pivote+1}")
+                    self._intercambiar_permutacion(fila_actual, fila_pivote)
                 
-                # Registrar columna pivote
                 self.columnas_pivote.append(col)
+                pivotes_panel.append(local)
                 
-                # Hacer el pivote igual a 1
-                pivote = aumentada[fila_actual, col]
-                if abs(pivote - 1.0) > 1e-10:
-                    aumentada[fila_actual] = aumentada[fila_actual] / pivote
-                    self.pasos.append(aumentada.copy())
-                    self.operaciones.append(f"F{fila_actual+1} = F{fila_actual+1} / {pivote:.2f}")
+                fisica = self.permutacion_filas[fila_actual]
+                pivote = panel[fisica, local]
+                if abs(pivote - 1.0) > self.tolerancia:
+                    panel[fisica] = panel[fisica] / pivote
                 
-                # Eliminar todos los otros elementos en esta columna
-                for i in range(m):
-                    if i != fila_actual and abs(aumentada[i, col]) > 1e-10:
-                        factor = aumentada[i, col]
-                        aumentada[i] = aumentada[i] - factor * aumentada[fila_actual]
-                        self.pasos.append(aumentada.copy())
-                        self.operaciones.append(f"F{i+1} = F{i+1} - ({factor:.2f}) * F{fila_actual+1}")
+                self._eliminar_columna(panel, fisica, local)
                 
                 fila_actual += 1
                 if fila_actual >= m:
                     break
             
-            # FASE 2: Analizar el sistema
-            return self._analizar_sistema(aumentada, m, n)
+            if not pivotes_panel:
+                continue
             
-        except Exception as e:
-            return None, False, f"Error en el calculo: {str(e)}"
+            # Actualizacion de las columnas pendientes (incluido el termino independiente)
+            restantes = aumentada[:, fin:]
+            filas_pivote = self.permutacion_filas[primera_fila:fila_actual].copy()  # Filas fisicas
+            w = original[filas_pivote][:, pivotes_panel]
+            nuevas_filas_pivote = np.linalg.solve(w, restantes[filas_pivote])
+            restantes -= original[:, pivotes_panel] @ nuevas_filas_pivote
+            restantes[filas_pivote] = nuevas_filas_pivote
+            
+            if self._registrando:
+                self._registrar_paso(aumentada, ('instantanea',),
+                                     f"Bloque de columnas {inicio+1}-{fin}: {len(pivotes_panel)} pivotes "
+                                     f"(filas {primera_fila+1}-{fila_actual})")
+    
+    def _preparar_aumentada(self, matriz: np.ndarray, vector: np.ndarray, m: int, n: int) -> np.ndarray:
+        """
+        Matriz aumentada de trabajo: la propia entrada si se permite sobrescribirla y
+        ya tiene la forma [A | b]; si no, una copia en el espacio de trabajo (o nueva).
+        """
+        tipo = tipo_de_trabajo(matriz, vector)
+        if self._sobrescribir_activo:
+            aumentada = vista_aumentada(matriz, vector, tipo)
+            if aumentada is not None:
+                if self._espacio_activo is not None:
+                    self._espacio_activo.preparar(m, n, None if np.ndim(vector) == 1 else vector.shape[1], tipo)
+                return aumentada
+        if self._espacio_activo is not None:
+            return self._espacio_activo.cargar(matriz, vector, tipo)
+        return matriz_aumentada(matriz, vector, tipo)
+    
+    def _intercambiar_permutacion(self, i: int, j: int):
+        """Intercambia las filas logicas i y j (sin mover datos de la matriz)."""
+        permutacion = self.permutacion_filas
+        permutacion[i], permutacion[j] = permutacion[j], permutacion[i]
+    
+    def _validar_metodo(self, metodo: str) -> str:
+        """Verifica que el metodo de reduccion sea uno de los soportados."""
+        if metodo not in METODOS:
+            raise ValueError(f"Metodo desconocido: {metodo!r}. Opciones: {', '.join(METODOS)}")
+        return metodo
     
     def _reiniciar_datos(self):
         """Reinicia todas las variables de analisis."""
-        self.pasos = []
+        self.pasos = RegistroPasos()
         self.operaciones = []
         self.columnas_pivote = []
         self.variables_libres = []
         self.rango_matriz = 0
         self.rango_aumentada = 0
         self.tipo_sistema = ""
+        self.tipos_sistema = []
+        self.rangos_aumentada = []
+        self.matriz_reducida = None
+        self.permutacion_filas = None
+        self.ruta_resolucion = ESTRUCTURA_GENERAL
+    
+    def _estado_para_cache(self, resultado: Tuple) -> Dict[str, any]:
+        """Empaqueta el resultado y el analisis de la ultima resolucion para la cache."""
+        solucion, es_unica, mensaje = resultado
+        return {
+            'resultado': (None if solucion is None else solucion.copy(), es_unica, mensaje),
+            'matriz_reducida': None if self.matriz_reducida is None else self.matriz_reducida.copy(),
+            'permutacion_filas': None if self.permutacion_filas is None else self.permutacion_filas.copy(),
+            'pasos': self.pasos,
+            'operaciones': list(self.operaciones),
+            'columnas_pivote': list(self.columnas_pivote),
+            'variables_libres': list(self.variables_libres),
+            'rango_matriz': self.rango_matriz,
+            'rango_aumentada': self.rango_aumentada,
+            'tipo_sistema': self.tipo_sistema,
+            'tipos_sistema': list(self.tipos_sistema),
+            'rangos_aumentada': list(self.rangos_aumentada),
+            'ruta_resolucion': self.ruta_resolucion
+        }
+    
+    def _restaurar_desde_cache(self, guardado: Dict[str, any]) -> Tuple[Optional[np.ndarray], bool, str]:
+        """Recupera el analisis guardado como si se acabara de resolver el sistema."""
+        self.pasos = guardado['pasos']  # El registro de pasos no se modifica tras resolver
+        self.operaciones = list(guardado['operaciones'])
+        self.columnas_pivote = list(guardado['columnas_pivote'])
+        self.variables_libres = list(guardado['variables_libres'])
+        self.rango_matriz = guardado['rango_matriz']
+        self.rango_aumentada = guardado['rango_aumentada']
+        self.tipo_sistema = guardado['tipo_sistema']
+        self.tipos_sistema = list(guardado['tipos_sistema'])
+        self.rangos_aumentada = list(guardado['rangos_aumentada'])
+        self.ruta_resolucion = guardado['ruta_resolucion']
+        self.matriz_reducida = None if guardado['matriz_reducida'] is None else guardado['matriz_reducida'].copy()
+        self.permutacion_filas = None if guardado['permutacion_filas'] is None else guardado['permutacion_filas'].copy()
+        
+        solucion, es_unica, mensaje = guardado['resultado']
+        return (None if solucion is None else solucion.copy()), es_unica, mensaje
+    
+    def _resolver_exacto(self, matriz: np.ndarray, vector: np.ndarray, m: int,
+                         n: int) -> Tuple[Optional[np.ndarray], bool, str]:
+        """
+        Resuelve con eliminacion de Bareiss sobre enteros. El rango, las columnas
+        pivote y la consistencia se deciden sin tolerancia y la solucion es racional
+        exacta. matriz_reducida queda con la forma escalonada entera (libre de fracciones).
+        """
+        if np.ndim(vector) != 1:
+            return None, False, "El metodo exacto admite un solo vector independiente"
+        
+        operaciones = self.operaciones if self._registrando else None
+        escalonada, self.columnas_pivote, determinante = bareiss(matriz_entera(matriz, vector), n, operaciones)
+        self.matriz_reducida = escalonada
+        
+        self.rango_matriz = len(self.columnas_pivote)
+        self.rango_aumentada = self.rango_matriz + int(any(escalonada[i, n] != 0 for i in range(self.rango_matriz, m)))
+        self._completar_variables_libres(n)
+        
+        if self.rango_aumentada > self.rango_matriz:
+            self.tipo_sistema = "inconsistente"
+            return None, False, self._mensaje_sistema()
+        
+        self.tipo_sistema = "unico" if self.rango_matriz == n else "infinito"
+        solucion = sustitucion_exacta(escalonada, self.columnas_pivote, n, determinante)
+        return solucion, self.tipo_sistema == "unico", self._mensaje_sistema()
+    
+    def _resolver_modular(self, matriz: np.ndarray, vector: np.ndarray,
+                          n: int) -> Tuple[Optional[np.ndarray], bool, str]:
+        """
+        Resuelve con eliminacion modulo varios primos de 31 bits y reconstruccion
+        por CRT (ver modular_exacto). Da las mismas respuestas que el metodo exacto
+        sin aritmetica de enteros grandes durante la eliminacion; no se construye
+        matriz_reducida (queda en None).
+        """
+        if np.ndim(vector) != 1:
+            return None, False, "El metodo modular admite un solo vector independiente"
+        
+        solucion, self.columnas_pivote, self.rango_matriz, self.rango_aumentada = resolver_modular(matriz, vector)
+        self._completar_variables_libres(n)
+        if self._registrando:
+            self.operaciones.append(f"Eliminacion modular: rango {self.rango_matriz}, "
+                                    f"columnas pivote {[c+1 for c in self.columnas_pivote]}")
+        
+        if solucion is None:
+            self.tipo_sistema = "inconsistente"
+            return None, False, self._mensaje_sistema()
+        
+        self.tipo_sistema = "unico" if self.rango_matriz == n else "infinito"
+        return solucion, self.tipo_sistema == "unico", self._mensaje_sistema()
+    
+    def _aceptar_solucion_estructurada(self, solucion: np.ndarray, ruta: str, n: int,
+                                       vector: np.ndarray) -> Tuple[Optional[np.ndarray], bool, str]:
+        """
+        Completa el analisis de un sistema cuadrado no singular resuelto por una ruta
+        especializada: su forma escalonada reducida es [I | x].
+        """
+        self.ruta_resolucion = ruta
+        if self._registrando:
+            self.operaciones.append(f"Estructura detectada: {ruta.replace('_', ' ')} (ruta especializada)")
+        
+        aumentada = np.column_stack((np.eye(n, dtype=solucion.dtype), solucion))
+        self.columnas_pivote = list(range(n))
+        self.matriz_reducida = aumentada
+        if np.ndim(vector) == 2:
+            return self._analizar_multiples(aumentada, n, n)
+        return self._analizar_sistema(aumentada, n, n)
+    
+    def _resolver_bloque(self, matriz: np.ndarray, vector: np.ndarray) -> Optional[np.ndarray]:
+        """Resuelve un bloque diagonal sin estructura propia; None si no tiene solucion unica."""
+        solver = GaussJordan(REGISTRO_NINGUNO, metodo=self._metodo_activo, tam_bloque=self.tam_bloque,
+                             tolerancia=self.tolerancia)
+        solucion, es_unica, _ = solver.resolver(matriz, vector)
+        if np.ndim(vector) == 2:
+            return solucion if np.all(es_unica) else None
+        return solucion if es_unica else None
+    
+    @property
+    def _registrando(self) -> bool:
+        """Indica si la resolucion en curso guarda algun tipo de paso."""
+        return self._nivel_activo != REGISTRO_NINGUNO
+    
+    def _registrar_paso(self, aumentada: np.ndarray, paso: Tuple, operacion: str):
+        """
+        Guarda una operacion segun el nivel de registro activo.
+        
+        Args:
+            aumentada: Matriz aumentada tras la operacion
+            paso: Operacion elemental aplicada (ver RegistroPasos.agregar)
+            operacion: Descripcion de la operacion realizada
+        """
+        if self._nivel_activo == REGISTRO_COMPLETO:
+            self.pasos.agregar(aumentada, paso, self.permutacion_filas)
+        self.operaciones.append(operacion)
     
     def _buscar_pivote(self, matriz: np.ndarray, fila_inicio: int, col: int, m: int) -> int:
         """
@@ -104,22 +468,62 @@ class GaussJordan:
         
         Args:
             matriz: Matriz aumentada
-            fila_inicio: Fila donde empezar a buscar
+            fila_inicio: Fila logica donde empezar a buscar
             col: Columna donde buscar el pivote
             m: Numero de filas
             
         Returns:
-            Indice de la fila con el mayor pivote, -1 si todos son cero
+            Indice logico de la fila con el mayor pivote, -1 si todos son cero
         """
-        max_val = 0
-        fila_pivote = -1
-        
-        for i in range(fila_inicio, m):
-            if abs(matriz[i, col]) > max_val:
-                max_val = abs(matriz[i, col])
-                fila_pivote = i
-        
-        return fila_pivote if max_val > 1e-10 else -1
+        if fila_inicio >= m:
+            return -1
+
+        # argmax devuelve la primera ocurrencia del maximo (en orden logico), igual que
+        # el recorrido fila a fila
+        valores = np.abs(matriz[self.permutacion_filas[fila_inicio:m], col])
+        indice = int(np.argmax(valores))
+
+        return fila_inicio + indice if valores[indice] > self.tolerancia else -1
+
+    def _eliminar_columna(self, aumentada: np.ndarray, fila_pivote: int, col: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Anula la columna del pivote en todas las demas filas con una sola
+        actualizacion de rango 1: A -= factores ⊗ fila_pivote.
+
+        Las filas cuyo factor es despreciable (<= tolerancia) no se tocan, igual que
+        en la eliminacion fila a fila, por lo que el resultado es identico.
+
+        Args:
+            aumentada: Matriz aumentada (se modifica en el lugar)
+            fila_pivote: Fila que contiene el pivote (ya normalizado a 1)
+            col: Columna del pivote
+            
+        Returns:
+            Tupla con los indices de las filas modificadas y el vector de factores
+        """
+        factores = aumentada[:, col].copy()
+        factores[fila_pivote] = 0.0
+        factores[np.abs(factores) <= self.tolerancia] = 0.0
+
+        filas = np.flatnonzero(factores)
+        if len(filas) == 0:
+            return filas, factores
+
+        fila = aumentada[fila_pivote]
+        producto = producto_para(self._espacio_activo, aumentada, aumentada.shape[0])
+        if len(filas) == aumentada.shape[0] - 1 and producto is not None:
+            # Caso denso con espacio de trabajo: producto exterior en el buffer (el factor
+            # de la fila pivote es 0, asi que esa fila no cambia)
+            np.multiply(factores[:, None], fila, out=producto)
+            aumentada -= producto
+        elif len(filas) == aumentada.shape[0] - 1:
+            # Caso denso: se actualizan las vistas por encima y por debajo del pivote sin copias
+            aumentada[:fila_pivote] -= np.outer(factores[:fila_pivote], fila)
+            aumentada[fila_pivote + 1:] -= np.outer(factores[fila_pivote + 1:], fila)
+        else:
+            aumentada[filas] -= np.outer(factores[filas], fila)
+
+        return filas, factores
     
     def _analizar_sistema(self, aumentada: np.ndarray, m: int, n: int) -> Tuple[Optional[np.ndarray], bool, str]:
         """
@@ -137,30 +541,19 @@ class GaussJordan:
         self.rango_matriz = len(self.columnas_pivote)
         self.rango_aumentada = self._calcular_rango_aumentada(aumentada, m, n)
         
-        # Completar lista de variables libres
-        for i in range(n):
-            if i not in self.columnas_pivote:
-                if i not in self.variables_libres:
-                    self.variables_libres.append(i)
+        self._completar_variables_libres(n)
         
         # Verificar consistencia
         if self.rango_aumentada > self.rango_matriz:
             self.tipo_sistema = "inconsistente"
-            mensaje = f"Sistema inconsistente (sin solucion)\n"
-            mensaje += f"Rango matriz: {self.rango_matriz}, Rango aumentada: {self.rango_aumentada}\n"
-            mensaje += f"Columnas pivote: {[c+1 for c in self.columnas_pivote]}"
-            return None, False, mensaje
+            return None, False, self._mensaje_sistema()
         
         # Sistema consistente
         if self.rango_matriz == n:
             # Solucion unica
             self.tipo_sistema = "unico"
             solucion = self._extraer_solucion_unica(aumentada, n)
-            mensaje = f"Sistema con solucion unica\n"
-            mensaje += f"Rango: {self.rango_matriz}\n"
-            mensaje += f"Columnas pivote: {{{', '.join(str(c+1) for c in self.columnas_pivote)}}}\n"
-            mensaje += f"Variables libres: Ninguna"
-            return solucion, True, mensaje
+            return solucion, True, self._mensaje_sistema()
         else:
             # Verificar si realmente forma matriz identidad en las columnas pivote
             es_matriz_identidad = self._verificar_matriz_identidad(aumentada, n)
@@ -169,12 +562,7 @@ class GaussJordan:
                 # Infinitas soluciones
                 self.tipo_sistema = "infinito"
                 solucion = self._extraer_solucion_particular(aumentada, n)
-                num_libres = len(self.variables_libres)
-                mensaje = f"Sistema con infinitas soluciones\n"
-                mensaje += f"Rango: {self.rango_matriz}\n"
-                mensaje += f"Columnas pivote: {{{', '.join(str(c+1) for c in self.columnas_pivote)}}}\n"
-                mensaje += f"Variables libres: {{{', '.join(str(v+1) for v in self.variables_libres)}}} ({num_libres} variables)"
-                return solucion, False, mensaje
+                return solucion, False, self._mensaje_sistema()
             else:
                 # No forma matriz identidad - inconsistente
                 self.tipo_sistema = "inconsistente"
@@ -184,13 +572,93 @@ class GaussJordan:
                 mensaje += f"Columnas pivote: {{{', '.join(str(c+1) for c in self.columnas_pivote)}}}"
                 return None, False, mensaje
     
+    def _mensaje_sistema(self) -> str:
+        """Mensaje informativo segun tipo_sistema, rangos, columnas pivote y variables libres."""
+        pivotes = ', '.join(str(c+1) for c in self.columnas_pivote)
+        if self.tipo_sistema == "inconsistente":
+            mensaje = f"Sistema inconsistente (sin solucion)\n"
+            mensaje += f"Rango matriz: {self.rango_matriz}, Rango aumentada: {self.rango_aumentada}\n"
+            mensaje += f"Columnas pivote: {[c+1 for c in self.columnas_pivote]}"
+        elif self.tipo_sistema == "unico":
+            mensaje = f"Sistema con solucion unica\n"
+            mensaje += f"Rango: {self.rango_matriz}\n"
+            mensaje += f"Columnas pivote: {{{pivotes}}}\n"
+            mensaje += f"Variables libres: Ninguna"
+        else:
+            num_libres = len(self.variables_libres)
+            mensaje = f"Sistema con infinitas soluciones\n"
+            mensaje += f"Rango: {self.rango_matriz}\n"
+            mensaje += f"Columnas pivote: {{{pivotes}}}\n"
+            mensaje += f"Variables libres: {{{', '.join(str(v+1) for v in self.variables_libres)}}} ({num_libres} variables)"
+        return mensaje
+    
+    def _analizar_multiples(self, aumentada: np.ndarray, m: int, n: int) -> Tuple[np.ndarray, np.ndarray, str]:
+        """
+        Clasifica cada lado derecho de un sistema con varios terminos independientes.
+        
+        La reduccion de A es comun a todas las columnas; solo la consistencia
+        depende de cada lado derecho.
+        
+        Args:
+            aumentada: Matriz [A | B] en forma escalonada reducida
+            m: Numero de ecuaciones
+            n: Numero de variables
+            
+        Returns:
+            Tupla con matriz de soluciones (n x k), arreglo de unicidad y resumen
+        """
+        self.rango_matriz = len(self.columnas_pivote)
+        self._completar_variables_libres(n)
+        
+        lados = aumentada[:, n:]
+        k = lados.shape[1]
+        rango = self.rango_matriz
+        
+        # Una fila nula en A con termino independiente no nulo vuelve inconsistente esa columna
+        sin_solucion = (np.abs(lados[rango:m]) > self.tolerancia).any(axis=0)
+        es_matriz_identidad = rango == n or self._verificar_matriz_identidad(aumentada[:, :n + 1], n)
+        
+        self.rangos_aumentada = [rango + int(inconsistente) for inconsistente in sin_solucion]
+        self.tipos_sistema = []
+        for inconsistente in sin_solucion:
+            if inconsistente or not es_matriz_identidad:
+                self.tipos_sistema.append("inconsistente")
+            elif rango == n:
+                self.tipos_sistema.append("unico")
+            else:
+                self.tipos_sistema.append("infinito")
+        
+        self.rango_aumentada = max(self.rangos_aumentada, default=rango)
+        tipos_distintos = set(self.tipos_sistema)
+        self.tipo_sistema = tipos_distintos.pop() if len(tipos_distintos) == 1 else "mixto"
+        
+        # Solucion particular por columna (variables libres = 0)
+        soluciones = solucion_en_ceros(self._espacio_activo, (n, k), aumentada.dtype)
+        soluciones[self.columnas_pivote] = lados[:rango]
+        es_inconsistente = np.array([tipo == "inconsistente" for tipo in self.tipos_sistema], dtype=bool)
+        soluciones[:, es_inconsistente] = np.nan
+        son_unicas = np.array([tipo == "unico" for tipo in self.tipos_sistema], dtype=bool)
+        
+        mensaje = f"Sistema con {k} lados derechos\n"
+        mensaje += f"Rango: {rango}\n"
+        mensaje += f"Columnas pivote: {{{', '.join(str(c+1) for c in self.columnas_pivote)}}}\n"
+        mensaje += (f"Solucion unica: {self.tipos_sistema.count('unico')}, "
+                    f"infinitas soluciones: {self.tipos_sistema.count('infinito')}, "
+                    f"inconsistentes: {self.tipos_sistema.count('inconsistente')}")
+        return soluciones, son_unicas, mensaje
+    
+    def _completar_variables_libres(self, n: int):
+        """Agrega como variables libres las columnas sin pivote que aun no se registraron."""
+        excluidas = set(self.columnas_pivote) | set(self.variables_libres)
+        self.variables_libres.extend(i for i in range(n) if i not in excluidas)
+    
     def _calcular_rango_aumentada(self, aumentada: np.ndarray, m: int, n: int) -> int:
         """Calcula el rango de la matriz aumentada."""
         rango = len(self.columnas_pivote)
         
         # Verificar si hay filas no nulas adicionales
         for i in range(len(self.columnas_pivote), m):
-            if abs(aumentada[i, n]) > 1e-10:  # Elemento no nulo en columna aumentada
+            if abs(aumentada[i, n]) > self.tolerancia:  # Elemento no nulo en columna aumentada
                 rango += 1
                 break
         
@@ -198,26 +666,28 @@ class GaussJordan:
     
     def _extraer_solucion_unica(self, aumentada: np.ndarray, n: int) -> np.ndarray:
         """Extrae la solucion cuando el sistema tiene solucion unica."""
-        solucion = np.zeros(n)
+        solucion = solucion_en_ceros(self._espacio_activo, (n,), aumentada.dtype)
         for i, col in enumerate(self.columnas_pivote):
             solucion[col] = aumentada[i, n]
         return solucion
     
     def _extraer_solucion_particular(self, aumentada: np.ndarray, n: int) -> np.ndarray:
         """Extrae una solucion particular (variables libres = 0)."""
-        solucion = np.zeros(n)
+        solucion = solucion_en_ceros(self._espacio_activo, (n,), aumentada.dtype)
         for i, col in enumerate(self.columnas_pivote):
             solucion[col] = aumentada[i, n]
         return solucion
     
-    def obtener_pasos(self) -> List[Tuple[np.ndarray, str]]:
+    def obtener_pasos(self) -> SecuenciaPasos:
         """
         Retorna los pasos del proceso de eliminacion.
+        Solo contiene pasos si se resolvio con nivel de registro completo.
+        Cada matriz se reconstruye al accederla a partir del registro compacto.
         
         Returns:
-            Lista de tuplas (matriz, operacion)
+            Secuencia de tuplas (matriz, operacion)
         """
-        return list(zip(self.pasos, self.operaciones))
+        return SecuenciaPasos(self.pasos, self.operaciones)
     
     def formatear_matriz(self, matriz: np.ndarray, decimales: int = 2) -> str:
         """
@@ -256,7 +726,8 @@ class GaussJordan:
             'variables_libres': {v + 1 for v in self.variables_libres},  # Base 1 con llaves
             'num_variables_libres': len(self.variables_libres),
             'es_consistente': self.rango_matriz == self.rango_aumentada,
-            'tiene_solucion_unica': self.tipo_sistema == "unico"
+            'tiene_solucion_unica': self.tipo_sistema == "unico",
+            'ruta_resolucion': self.ruta_resolucion
         }
     
     def obtener_ecuaciones_variables_libres(self, aumentada: np.ndarray, n: int) -> List[str]:
@@ -289,7 +760,7 @@ class GaussJordan:
                 if i < len(aumentada) and var_libre < aumentada.shape[1] - 1:  # No incluir columna aumentada
                     coef = -aumentada[i, var_libre]  # Negativo porque lo pasamos al otro lado
                     
-                    if abs(coef) > 1e-10:  # Si el coeficiente no es cero
+                    if abs(coef) > self.tolerancia:  # Si el coeficiente no es cero
                         termino_independiente = aumentada[i, -1]  # Término independiente
                         
                         if coef > 0:
@@ -301,7 +772,7 @@ class GaussJordan:
                             ecuacion_partes.append(f" - {abs(coef):.2f}x{col_pivote + 1}")
                         
                         # Agregar término independiente si existe
-                        if abs(termino_independiente) > 1e-10:
+                        if abs(termino_independiente) > self.tolerancia:
                             if termino_independiente > 0:
                                 ecuacion_partes.append(f" + {termino_independiente:.2f}")
                             else:
@@ -339,12 +810,12 @@ class GaussJordan:
                 return False
                 
             # Verificar que hay un 1 en la posicion [i, col_pivote]
-            if abs(aumentada[i, col_pivote] - 1.0) > 1e-10:
+            if abs(aumentada[i, col_pivote] - 1.0) > self.tolerancia:
                 return False
                 
             # Verificar que hay ceros en las otras filas de esta columna
             for j in range(aumentada.shape[0]):
-                if j != i and abs(aumentada[j, col_pivote]) > 1e-10:
+                if j != i and abs(aumentada[j, col_pivote]) > self.tolerancia:
                     return False
                     
         return True
@@ -0,0 +1,338 @@
+"""
+Gauss-Jordan para matrices dispersas
+Elimina sobre una estructura por filas que solo guarda los elementos no nulos,
+eligiendo los pivotes con el criterio de Markowitz con umbral para limitar el relleno
+"""
+
+import heapq
+import numpy as np
+from typing import Optional, Tuple
+from gauss_jordan import GaussJordan
+from registro_pasos import REGISTRO_NINGUNO, validar_nivel_registro
+from tipos_numericos import tipo_de_trabajo
+
+RUTA_DISPERSA = "dispersa"  # Valor de ruta_resolucion de este solucionador
+
+
+class MatrizCSR:
+    """
+    Matriz dispersa en formato CSR (filas comprimidas).
+
+    Los elementos no nulos de la fila i son datos[indptr[i]:indptr[i+1]] en las
+    columnas indices[indptr[i]:indptr[i+1]]. Es el mismo formato que usa
+    scipy.sparse, pero sin depender de SciPy.
+    """
+
+    def __init__(self, datos: np.ndarray, indices: np.ndarray, indptr: np.ndarray, forma: Tuple[int, int]):
+        self.datos = np.asarray(datos, dtype=tipo_de_trabajo(datos))
+        self.indices = np.asarray(indices, dtype=np.intp)
+        self.indptr = np.asarray(indptr, dtype=np.intp)
+        self.shape = (int(forma[0]), int(forma[1]))
+        if len(self.indptr) != self.shape[0] + 1 or len(self.datos) != len(self.indices):
+            raise ValueError("Arreglos CSR incompatibles con la forma indicada")
+
+    @classmethod
+    def desde_coo(cls, filas, columnas, valores, forma: Tuple[int, int]) -> 'MatrizCSR':
+        """
+        Construye la matriz a partir de tripletas (fila, columna, valor).
+        Las tripletas repetidas se suman, como en el formato COO habitual.
+        """
+        filas = np.asarray(filas, dtype=np.intp)
+        columnas = np.asarray(columnas, dtype=np.intp)
+        valores = np.asarray(valores, dtype=tipo_de_trabajo(valores))
+
+        orden = np.lexsort((columnas, filas))
+        filas, columnas, valores = filas[orden], columnas[orden], valores[orden]
+
+        # Sumar duplicados
+        nuevo = np.ones(len(filas), dtype=bool)
+        nuevo[1:] = (filas[1:] != filas[:-1]) | (columnas[1:] != columnas[:-1])
+        grupos = np.cumsum(nuevo) - 1
+        datos = np.zeros(int(nuevo.sum()), dtype=valores.dtype)
+        np.add.at(datos, grupos, valores)
+        filas, columnas = filas[nuevo], columnas[nuevo]
+
+        indptr = np.zeros(forma[0] + 1, dtype=np.intp)
+        np.add.at(indptr, filas + 1, 1)
+        return cls(datos, columnas, np.cumsum(indptr), forma)
+
+    @classmethod
+    def desde_densa(cls, matriz: np.ndarray) -> 'MatrizCSR':
+        """Construye la matriz guardando solo los elementos no nulos de una matriz densa."""
+        matriz = np.asarray(matriz, dtype=tipo_de_trabajo(matriz))
+        filas, columnas = np.nonzero(matriz)
+        return cls.desde_coo(filas, columnas, matriz[filas, columnas], matriz.shape)
+
+    @property
+    def nnz(self) -> int:
+        """Numero de elementos guardados."""
+        return len(self.datos)
+
+    def a_densa(self) -> np.ndarray:
+        """Convierte la matriz a un arreglo denso."""
+        densa = np.zeros(self.shape, dtype=self.datos.dtype)
+        filas = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        densa[filas, self.indices] = self.datos
+        return densa
+
+
+def a_csr(matriz) -> MatrizCSR:
+    """
+    Convierte la entrada a MatrizCSR.
+
+    Args:
+        matriz: MatrizCSR, matriz de scipy.sparse (CSR, COO, ...) o arreglo denso
+
+    Returns:
+        La matriz en formato CSR
+    """
+    if isinstance(matriz, MatrizCSR):
+        return matriz
+    if hasattr(matriz, 'tocsr'):  # scipy.sparse
+        csr = matriz.tocsr()
+        return MatrizCSR(csr.data, csr.indices, csr.indptr, csr.shape)
+    return MatrizCSR.desde_densa(matriz)
+
+
+class GaussJordanDisperso(GaussJordan):
+    """
+    Resuelve Ax = b sin densificar A.
+
+    Cada fila se guarda como diccionario {columna: valor} y cada columna conoce
+    las filas aun no usadas donde tiene elementos, de modo que el trabajo y la
+    memoria dependen del numero de no nulos (mas el relleno) y no de m x n.
+
+    En cada paso se examinan las `columnas_busqueda` columnas con menos no nulos
+    y, entre sus filas cuyo elemento es al menos `umbral` veces el mayor de la
+    columna, se elige el pivote de menor costo de Markowitz
+    (no nulos de la fila - 1) x (no nulos de la columna - 1), que es el que menos
+    relleno produce. Si A no tiene rango completo por columnas, el orden de las
+    columnas decide cuales son pivote; en ese caso se recorren en orden natural
+    (eligiendo solo la fila por Markowitz) para reportar las mismas columnas
+    pivote y variables libres que GaussJordan. La eliminacion es solo hacia
+    adelante y la solucion se obtiene por sustitucion hacia atras, sin relleno.
+
+    El analisis (rango, pivotes, variables libres, tipo de sistema y mensaje) es
+    el de GaussJordan._analizar_sistema. No se guardan matrices intermedias; con
+    un nivel de registro distinto de "ninguno" solo se describen los pivotes.
+    """
+
+    def __init__(self, nivel_registro: str = REGISTRO_NINGUNO, tolerancia: float = 1e-10, umbral: float = 0.5,
+                 columnas_busqueda: int = 4):
+        super().__init__(nivel_registro, tolerancia=tolerancia)
+        self.umbral = umbral  # Fraccion del mayor elemento de la columna aceptable como pivote
+        self.columnas_busqueda = columnas_busqueda  # Columnas de menor cuenta examinadas por paso
+        self.relleno = 0  # Elementos nuevos creados durante la eliminacion
+        self._filas = []  # Fila i -> {columna: valor}
+        self._lado_derecho = None  # Termino independiente tras la eliminacion
+        self._fila_de_pivote = {}  # Columna pivote -> fila que la contiene, en orden de eliminacion
+        self._filas_de_columna = []  # Columna -> filas aun no usadas con elemento no nulo
+
+    def resolver(self, matriz, vector: np.ndarray, nivel_registro: Optional[str] = None,
+                 metodo: Optional[str] = None) -> Tuple[Optional[np.ndarray], bool, str]:
+        """
+        Resuelve el sistema disperso Ax = b.
+
+        Args:
+            matriz: MatrizCSR, matriz de scipy.sparse o arreglo denso (m x n)
+            vector: Vector independiente b (m)
+            nivel_registro: Nivel de registro para esta llamada (None usa el de la instancia)
+            metodo: Se ignora; existe por compatibilidad con GaussJordan.resolver
+
+        Returns:
+            Tupla con solucion, es_unica y mensaje, igual que GaussJordan.resolver
+        """
+        self._nivel_activo = validar_nivel_registro(nivel_registro or self.nivel_registro)
+        try:
+            self._reiniciar_datos()
+            self.ruta_resolucion = RUTA_DISPERSA
+            matriz = a_csr(matriz)
+            vector = np.asarray(vector, dtype=tipo_de_trabajo(matriz.datos, vector))
+
+            m, n = matriz.shape
+            if vector.shape != (m,):
+                return None, False, f"Dimensiones incompatibles: matriz {m}x{n}, vector {len(vector)}x1"
+
+            self._eliminar(matriz, vector)
+            return self._analizar_sistema(None, m, n)
+
+        except Exception as e:
+            return None, False, f"Error en el calculo: {str(e)}"
+
+    def _reiniciar_datos(self):
+        super()._reiniciar_datos()
+        self.relleno = 0
+        self._filas = []
+        self._lado_derecho = None
+        self._fila_de_pivote = {}
+        self._filas_de_columna = []
+
+    def _cargar(self, matriz: MatrizCSR, vector: np.ndarray):
+        """Copia la matriz a la estructura de trabajo por filas y arma el indice por columnas."""
+        self._filas = []
+        for i in range(matriz.shape[0]):
+            inicio, fin = matriz.indptr[i], matriz.indptr[i + 1]
+            self._filas.append({int(j): v.item() for j, v in zip(matriz.indices[inicio:fin], matriz.datos[inicio:fin])
+                                if abs(v) > self.tolerancia})
+        self._lado_derecho = vector.copy()
+        self._fila_de_pivote = {}
+        self.relleno = 0
+
+        # Columna -> filas aun no usadas con elemento no nulo en ella
+        self._filas_de_columna = [set() for _ in range(matriz.shape[1])]
+        for i, fila in enumerate(self._filas):
+            for j in fila:
+                self._filas_de_columna[j].add(i)
+
+    def _eliminar(self, matriz: MatrizCSR, vector: np.ndarray):
+        """
+        Eliminacion hacia adelante. Si A tiene rango completo por columnas, las
+        columnas pivote no dependen del orden y se usa Markowitz completo; si no,
+        se repite con las columnas en orden natural para obtener las mismas
+        columnas pivote y variables libres que GaussJordan.
+        """
+        m, n = matriz.shape
+        self._cargar(matriz, vector)
+        if m >= n:
+            self._eliminar_markowitz(n)
+            if len(self._fila_de_pivote) == n:
+                self.columnas_pivote = sorted(self._fila_de_pivote)
+                return
+            self._cargar(matriz, vector)
+
+        self._eliminar_orden_natural(m, n)
+
+    def _eliminar_markowitz(self, n: int):
+        """Elige en cada paso fila y columna con el menor costo de Markowitz entre pocas columnas."""
+        filas = self._filas
+        filas_de_columna = self._filas_de_columna
+        pendientes = [(len(filas_de_columna[j]), j) for j in range(n)]  # (no nulos, columna)
+        heapq.heapify(pendientes)
+        eliminadas = set()
+
+        while pendientes:
+            # Columnas vigentes con menos no nulos (las entradas viejas del monticulo se descartan)
+            examinadas = []
+            while pendientes and len(examinadas) < self.columnas_busqueda:
+                cuenta, col = heapq.heappop(pendientes)
+                if col not in eliminadas and cuenta == len(filas_de_columna[col]):
+                    examinadas.append(col)
+            if not examinadas:
+                break
+
+            mejor = None
+            for col in examinadas:
+                candidatas = filas_de_columna[col]
+                mayor = max((abs(filas[i][col]) for i in candidatas), default=0.0)
+                if mayor <= self.tolerancia:
+                    continue  # Columna sin pivote: el rango no es completo
+                limite = self.umbral * mayor
+                for i in candidatas:
+                    if abs(filas[i][col]) >= limite:
+                        # A igual costo se prefiere el pivote mas grande (menos crecimiento)
+                        costo = ((len(filas[i]) - 1) * (len(candidatas) - 1), -abs(filas[i][col]), i, col)
+                        if mejor is None or costo < mejor:
+                            mejor = costo
+            if mejor is None:
+                return  # Ninguna columna examinada tiene pivote
+
+            _, _, fila_pivote, col = mejor
+            for j in examinadas:
+                if j != col:
+                    heapq.heappush(pendientes, (len(filas_de_columna[j]), j))
+            eliminadas.add(col)
+            for j in self._pivotar(fila_pivote, col):
+                if j not in eliminadas:
+                    heapq.heappush(pendientes, (len(filas_de_columna[j]), j))
+
+    def _eliminar_orden_natural(self, m: int, n: int):
+        """Recorre las columnas en orden; dentro de cada una elige la fila por Markowitz con umbral."""
+        filas = self._filas
+        for col in range(n):
+            candidatas = self._filas_de_columna[col]
+            mayor = max((abs(filas[i][col]) for i in candidatas), default=0.0)
+            if mayor <= self.tolerancia:
+                # Sin elementos o solo restos despreciables: la columna no tiene pivote
+                for i in candidatas:
+                    del filas[i][col]
+                candidatas.clear()
+                self.variables_libres.append(col)
+                continue
+
+            # El costo de la columna es comun a todas las filas: decide la longitud de la fila
+            # y, a igual longitud, el pivote mas grande
+            limite = self.umbral * mayor
+            fila_pivote = min((i for i in candidatas if abs(filas[i][col]) >= limite),
+                              key=lambda i: (len(filas[i]), -abs(filas[i][col]), i))
+            self._pivotar(fila_pivote, col)
+            self.columnas_pivote.append(col)
+
+            if len(self.columnas_pivote) == m:
+                break  # Las columnas restantes son libres
+
+    def _pivotar(self, fila_pivote: int, col: int) -> set:
+        """
+        Usa A[fila_pivote, col] como pivote y anula la columna en las filas no usadas.
+
+        Returns:
+            Columnas cuyo numero de no nulos cambio
+        """
+        filas = self._filas
+        filas_de_columna = self._filas_de_columna
+        b = self._lado_derecho
+        pivote_fila = filas[fila_pivote]
+        pivote = pivote_fila[col]
+        candidatas = filas_de_columna[col]
+
+        self._fila_de_pivote[col] = fila_pivote
+        for j in pivote_fila:
+            filas_de_columna[j].discard(fila_pivote)
+        if self._registrando:
+            self.operaciones.append(f"Pivote columna {col+1}: fila {fila_pivote+1} "
+                                    f"({len(pivote_fila)} no nulos, {len(candidatas)} filas a eliminar)")
+
+        for i in list(candidatas):
+            fila = filas[i]
+            factor = fila[col] / pivote
+            for j, valor in pivote_fila.items():
+                if j in fila:
+                    nuevo = fila[j] - factor * valor
+                else:
+                    nuevo = -factor * valor
+                    self.relleno += 1
+                if j == col or abs(nuevo) <= self.tolerancia:
+                    fila.pop(j, None)
+                    filas_de_columna[j].discard(i)
+                else:
+                    fila[j] = nuevo
+                    filas_de_columna[j].add(i)
+            b[i] -= factor * b[fila_pivote]
+
+        return set(pivote_fila)
+
+    def _calcular_rango_aumentada(self, aumentada, m: int, n: int) -> int:
+        """Rango de la matriz aumentada: un termino independiente no nulo en una fila sin pivote lo aumenta."""
+        rango = len(self.columnas_pivote)
+        usadas = set(self._fila_de_pivote.values())
+        if any(abs(self._lado_derecho[i]) > self.tolerancia for i in range(m) if i not in usadas):
+            rango += 1
+        return rango
+
+    def _verificar_matriz_identidad(self, aumentada, n: int) -> bool:
+        """Cada columna pivote tiene su propia fila pivote, asi que la forma reducida es la identidad."""
+        return len(set(self._fila_de_pivote.values())) == len(self.columnas_pivote)
+
+    def _extraer_solucion_unica(self, aumentada, n: int) -> np.ndarray:
+        return self._sustitucion_hacia_atras(n)
+
+    def _extraer_solucion_particular(self, aumentada, n: int) -> np.ndarray:
+        return self._sustitucion_hacia_atras(n)
+
+    def _sustitucion_hacia_atras(self, n: int) -> np.ndarray:
+        """Solucion con variables libres = 0, del ultimo pivote eliminado al primero."""
+        solucion = np.zeros(n, dtype=self._lado_derecho.dtype)
+        for col, i in reversed(list(self._fila_de_pivote.items())):
+            fila = self._filas[i]
+            suma = sum(valor * solucion[j] for j, valor in fila.items() if j != col)
+            solucion[col] = (self._lado_derecho[i] - suma) / fila[col]
+        return solucion
@@ -0,0 +1,265 @@
+"""
+Gauss-Jordan sobre GF(2)
+Sistemas binarios (sumas XOR) con las filas empaquetadas en palabras de 64 bits
+"""
+
+import numpy as np
+from typing import List, Optional, Tuple
+from gauss_jordan import GaussJordan
+from registro_pasos import REGISTRO_NINGUNO, validar_nivel_registro
+
+RUTA_GF2 = "gf2"  # Valor de ruta_resolucion de este solucionador
+BITS_PALABRA = 64
+BLOQUE_COLUMNAS = 8  # Columnas por bloque: tabla de 2^8 combinaciones de filas pivote
+FILAS_POR_TANDA = 4096  # Filas actualizadas por consulta a la tabla (limita la memoria temporal)
+
+
+def _bits_bajos(valores: np.ndarray) -> np.ndarray:
+    """Paridad de cada valor como uint8 (0 o 1), sin copias del tipo de la entrada."""
+    if valores.dtype.kind in 'biu':
+        # El byte bajo conserva la paridad; el ufunc convierte por tramos de su búfer
+        return np.bitwise_and(valores, 1, dtype=np.uint8, casting='unsafe')
+    return (valores % 2).astype(np.uint8)  # Flotantes con valores enteros
+
+
+def empaquetar_bits(bits: np.ndarray, ultima: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Empaqueta una matriz de bits (m x c) en palabras uint64 (m x ceil(c/64)).
+
+    La columna j queda en el bit j % 64 de la palabra j // 64. Los valores se
+    toman modulo 2 leyendo solo su bit bajo, así que una matriz de enteros no
+    se copia con su tipo (ni con np.column_stack para añadir el vector).
+
+    Args:
+        bits: Matriz de enteros o booleanos
+        ultima: Columna opcional (m) que se empaqueta como columna c, por
+                ejemplo el vector b de [A | b]
+
+    Returns:
+        Arreglo uint64 con una fila de palabras por fila de la matriz
+    """
+    bits = np.asarray(bits)
+    m, c = bits.shape
+    total = c + (ultima is not None)
+    palabras = -(-total // BITS_PALABRA)
+    octetos = np.zeros((m, palabras * BITS_PALABRA // 8), dtype=np.uint8)
+    octetos[:, :-(-c // 8)] = np.packbits(_bits_bajos(bits), axis=1, bitorder='little')
+    if ultima is not None:
+        octetos[:, c // 8] |= _bits_bajos(np.asarray(ultima)) << (c % 8)
+    return octetos.view('<u8').astype(np.uint64, copy=False)
+
+
+def desempaquetar_bits(palabras: np.ndarray, c: int) -> np.ndarray:
+    """Inversa de empaquetar_bits: devuelve la matriz de bits (m x c) como uint8."""
+    octetos = np.ascontiguousarray(palabras, dtype='<u8').view(np.uint8)
+    return np.unpackbits(octetos, axis=1, count=c, bitorder='little')
+
+
+def _invertir_gf2(filas: List[List[int]]) -> List[int]:
+    """
+    Inversa de una matriz pequena no singular sobre GF(2).
+
+    Returns:
+        Filas de la inversa como enteros (bit i = columna i)
+    """
+    r = len(filas)
+    izquierda = [sum(b << i for i, b in enumerate(fila)) for fila in filas]
+    derecha = [1 << i for i in range(r)]
+    for col in range(r):
+        pivote = next(i for i in range(col, r) if izquierda[i] >> col & 1)
+        izquierda[col], izquierda[pivote] = izquierda[pivote], izquierda[col]
+        derecha[col], derecha[pivote] = derecha[pivote], derecha[col]
+        for i in range(r):
+            if i != col and izquierda[i] >> col & 1:
+                izquierda[i] ^= izquierda[col]
+                derecha[i] ^= derecha[col]
+    return derecha
+
+
+class GaussJordanGF2(GaussJordan):
+    """
+    Resuelve Ax = b con aritmetica modulo 2.
+
+    Cada fila de [A | b] se guarda en ceil((n+1)/64) palabras uint64, 64 veces
+    menos memoria que float64. En cada columna el pivote es la primera fila
+    restante con el bit encendido (en GF(2) todo pivote no nulo vale 1, asi que no
+    hay que normalizar) y las demas filas con ese bit se eliminan con XOR
+    vectorizados de las palabras a partir de la del pivote, agrupando ocho
+    columnas por pasada (metodo de los cuatro rusos). El costo es
+    O(rango * m * n / (64 * 8)) operaciones de palabra.
+
+    Las columnas pivote, variables libres, rangos, tipo de sistema y mensaje son
+    los de GaussJordan._analizar_sistema. La solucion (variables libres = 0) es
+    un arreglo uint8 de ceros y unos, y matriz_reducida guarda la forma
+    escalonada reducida empaquetada (ver desempaquetar_bits). Con un nivel de
+    registro distinto de "ninguno" solo se describen los intercambios.
+    """
+
+    def __init__(self, nivel_registro: str = REGISTRO_NINGUNO):
+        super().__init__(nivel_registro, tolerancia=0)
+
+    def resolver(self, matriz: np.ndarray, vector: np.ndarray, nivel_registro: Optional[str] = None,
+                 metodo: Optional[str] = None) -> Tuple[Optional[np.ndarray], bool, str]:
+        """
+        Resuelve el sistema binario Ax = b.
+
+        Args:
+            matriz: Matriz de coeficientes A (m x n) con ceros y unos (se toma modulo 2)
+            vector: Vector independiente b (m)
+            nivel_registro: Nivel de registro para esta llamada (None usa el de la instancia)
+            metodo: Se ignora; existe por compatibilidad con GaussJordan.resolver
+
+        Returns:
+            Tupla con solucion, es_unica y mensaje, igual que GaussJordan.resolver
+        """
+        matriz = np.asarray(matriz)
+        vector = np.asarray(vector)
+        m, n = matriz.shape
+        if vector.shape != (m,):
+            self._reiniciar_datos()
+            return None, False, f"Dimensiones incompatibles: matriz {m}x{n}, vector {len(vector)}x1"
+        return self.resolver_empaquetado(empaquetar_bits(matriz, vector), n,
+                                         nivel_registro)
+
+    def resolver_empaquetado(self, palabras: np.ndarray, n: int,
+                             nivel_registro: Optional[str] = None) -> Tuple[Optional[np.ndarray], bool, str]:
+        """
+        Resuelve un sistema ya empaquetado, sin pasar por la matriz de bits.
+
+        Args:
+            palabras: [A | b] empaquetada con empaquetar_bits (m x ceil((n+1)/64)),
+                      se modifica en el lugar
+            n: Numero de variables (el bit n de cada fila es el termino independiente)
+            nivel_registro: Nivel de registro para esta llamada (None usa el de la instancia)
+
+        Returns:
+            Tupla con solucion, es_unica y mensaje, igual que GaussJordan.resolver
+        """
+        self._nivel_activo = validar_nivel_registro(nivel_registro or self.nivel_registro)
+        try:
+            self._reiniciar_datos()
+            self.ruta_resolucion = RUTA_GF2
+            m = palabras.shape[0]
+            if palabras.dtype != np.uint64 or palabras.shape[1] * BITS_PALABRA < n + 1:
+                return None, False, f"Se esperaban al menos {n + 1} bits uint64 por fila"
+
+            self._reducir(palabras, m, n)
+            self.matriz_reducida = palabras
+            return self._analizar_sistema(palabras, m, n)
+
+        except Exception as e:
+            return None, False, f"Error en el calculo: {str(e)}"
+
+    def _reducir(self, palabras: np.ndarray, m: int, n: int):
+        """
+        Forma escalonada reducida en el lugar, en bloques de BLOQUE_COLUMNAS columnas
+        (metodo de los cuatro rusos).
+
+        Dentro de un bloque los pivotes se buscan sobre la submatriz de bits de sus
+        columnas (m x 8 bytes), con los mismos intercambios que la eliminacion
+        columna a columna. Luego las filas pivote se reducen entre si (inversa de
+        su submatriz r x r) y se arma una tabla con las 2^r combinaciones XOR de
+        ellas: cada fila se elimina con una sola consulta a la tabla indexada por
+        sus bits en las columnas pivote, en lugar de r pasadas XOR sobre la matriz.
+        """
+        fila = 0
+        col = 0
+        while col < n and fila < m:
+            columnas = list(range(col, min(col + BLOQUE_COLUMNAS, n)))
+            col = columnas[-1] + 1
+            w, desplazamiento = divmod(columnas[0], BITS_PALABRA)  # Las palabras anteriores son cero
+            # Los bits de las columnas del bloque en un byte por fila (los bloques no cruzan palabras)
+            bits = ((palabras[:, w] >> np.uint64(desplazamiento))
+                    & np.uint64((1 << len(columnas)) - 1)).astype(np.uint8)
+
+            inicio = fila
+            pivotes = []
+            for j, c in enumerate(columnas):
+                if fila >= m:
+                    break
+                candidatas = np.flatnonzero((bits[fila:] >> j) & 1)
+                if len(candidatas) == 0:
+                    continue
+
+                fila_pivote = fila + int(candidatas[0])
+                if fila_pivote != fila:
+                    palabras[[fila, fila_pivote], w:] = palabras[[fila_pivote, fila], w:]
+                    bits[[fila, fila_pivote]] = bits[[fila_pivote, fila]]
+                    if self._registrando:
+                        self.operaciones.append(f"Intercambiar fila {fila+1} con fila {fila_pivote+1}")
+
+                pivote = bits[fila]
+                bits ^= ((bits >> j) & 1) * pivote
+                bits[fila] = pivote
+                pivotes.append(c)
+                fila += 1
+
+            if pivotes:
+                self._eliminar_bloque(palabras, inicio, pivotes, w)
+                self.columnas_pivote.extend(pivotes)
+
+    def _eliminar_bloque(self, palabras: np.ndarray, inicio: int, pivotes: List[int], w: int):
+        """
+        Reduce las filas pivote inicio..inicio+r-1 y elimina sus columnas pivote de
+        todas las demas filas con la tabla de combinaciones.
+        """
+        r = len(pivotes)
+        originales = palabras[inicio:inicio + r, w:].copy()
+
+        # Filas pivote reducidas: U^-1 por las originales, con U sus bits en las columnas pivote
+        inversa = _invertir_gf2([[self._bit(originales, i, c - w * BITS_PALABRA) for c in pivotes]
+                                 for i in range(r)])
+        reducidas = np.zeros_like(originales)
+        for j in range(r):
+            for i in range(r):
+                if inversa[j] >> i & 1:
+                    reducidas[j] ^= originales[i]
+
+        # tabla[clave] = XOR de las filas reducidas cuyos bits estan en la clave
+        tabla = np.zeros((1 << r, originales.shape[1]), dtype=np.uint64)
+        for j in range(r):
+            tabla[1 << j:2 << j] = tabla[:1 << j] ^ reducidas[j]
+
+        claves = np.zeros(palabras.shape[0], dtype=np.intp)
+        for j, c in enumerate(pivotes):
+            claves |= self._columna(palabras, c).astype(np.intp) << j
+        claves[inicio:inicio + r] = 0
+        for desde in range(0, palabras.shape[0], FILAS_POR_TANDA):
+            hasta = desde + FILAS_POR_TANDA
+            palabras[desde:hasta, w:] ^= tabla[claves[desde:hasta]]
+        palabras[inicio:inicio + r, w:] = reducidas
+
+    @staticmethod
+    def _bit(palabras: np.ndarray, fila: int, col: int) -> int:
+        """Bit (fila, col) de una matriz empaquetada."""
+        w, desplazamiento = divmod(col, BITS_PALABRA)
+        return int(palabras[fila, w]) >> desplazamiento & 1
+
+    @staticmethod
+    def _columna(palabras: np.ndarray, col: int) -> np.ndarray:
+        """Columna col de la matriz empaquetada como arreglo de bits uint8."""
+        w, desplazamiento = divmod(col, BITS_PALABRA)
+        return ((palabras[:, w] >> np.uint64(desplazamiento)) & np.uint64(1)).astype(np.uint8)
+
+    def _lado_derecho(self, palabras: np.ndarray, n: int) -> np.ndarray:
+        """Columna del termino independiente como arreglo de bits."""
+        return self._columna(palabras, n)
+
+    def _calcular_rango_aumentada(self, palabras: np.ndarray, m: int, n: int) -> int:
+        """Un termino independiente 1 en una fila sin pivote aumenta el rango."""
+        rango = len(self.columnas_pivote)
+        return rango + int(np.any(self._lado_derecho(palabras, n)[rango:]))
+
+    def _verificar_matriz_identidad(self, palabras: np.ndarray, n: int) -> bool:
+        """La reduccion elimina cada columna pivote en todas las demas filas: siempre es la identidad."""
+        return True
+
+    def _extraer_solucion_unica(self, palabras: np.ndarray, n: int) -> np.ndarray:
+        return self._extraer_solucion_particular(palabras, n)
+
+    def _extraer_solucion_particular(self, palabras: np.ndarray, n: int) -> np.ndarray:
+        """Solucion con variables libres = 0: cada variable pivote vale el bit de su fila."""
+        solucion = np.zeros(n, dtype=np.uint8)
+        rango = len(self.columnas_pivote)
+        solucion[self.columnas_pivote] = self._lado_derecho(palabras, n)[:rango]
+        return solucion
@@ -0,0 +1,168 @@
+"""
+Gauss-Jordan incremental
+Sesion que conserva la forma escalonada reducida y agrega ecuaciones de una en una
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+from gauss_jordan import GaussJordan, METODO_EXACTO, METODO_MODULAR
+from registro_pasos import REGISTRO_NINGUNO
+from tipos_numericos import tipo_de_trabajo
+
+RUTA_INCREMENTAL = "incremental"  # Valor de ruta_resolucion de la sesion
+
+
+class SesionGaussJordan(GaussJordan):
+    """
+    Sistema Ax = b que crece ecuacion a ecuacion.
+
+    Guarda solo las filas no nulas de la forma escalonada reducida de [A | b]
+    (una por columna pivote, en orden de columna). Cada ecuacion nueva se reduce
+    contra ellas con un producto matriz-vector; si le queda una entrada no nula
+    en A, esa columna pasa a ser pivote: se normaliza la fila, se elimina la
+    columna de las filas guardadas y se inserta en su posicion. Asi cada
+    agregar_ecuacion cuesta O(rango * n) en lugar de repetir la eliminacion
+    completa O(m * n^2).
+
+    matriz_reducida es la vista de esas filas (rango x (n + 1)); las filas nulas
+    no se guardan. Tras cada ecuacion quedan actualizados columnas_pivote,
+    variables_libres, rango_matriz, rango_aumentada, tipo_sistema y la solucion
+    particular (variables libres = 0), igual que tras GaussJordan.resolver con
+    todas las ecuaciones agregadas hasta ese momento. Una ecuacion que se reduce a
+    [0 ... 0 | c] con c no nulo deja el sistema inconsistente para siempre.
+    """
+
+    def __init__(self, n: int, dtype: np.dtype = np.float64, tolerancia: float = 1e-10,
+                 nivel_registro: str = REGISTRO_NINGUNO):
+        super().__init__(nivel_registro, tolerancia=tolerancia, usar_estructura=False)
+        self.n = n  # Numero de variables
+        self.numero_ecuaciones = 0  # Ecuaciones agregadas
+        self.ecuaciones_redundantes = []  # Ecuaciones que no aportaron columna pivote
+        self.solucion = None  # Solucion particular actual (None si es inconsistente)
+        self._inconsistente = False  # Alguna ecuacion se redujo a 0 = c con c no nulo
+        self._filas = np.zeros((n, n + 1), dtype=dtype)  # Filas pivote (las primeras rango)
+        self.ruta_resolucion = RUTA_INCREMENTAL
+        self._actualizar_analisis()
+
+    def resolver(self, matriz: np.ndarray, vector: np.ndarray, nivel_registro: Optional[str] = None,
+                 metodo: Optional[str] = None, **opciones) -> Tuple[Optional[np.ndarray], bool, str]:
+        """
+        Reinicia la sesion con un sistema completo, reducido de una vez con
+        GaussJordan.resolver; despues se le pueden agregar ecuaciones.
+
+        Args:
+            matriz: Matriz de coeficientes A (m x n)
+            vector: Vector independiente b (m)
+            nivel_registro: Nivel de registro para esta llamada (None usa el de la instancia)
+            metodo: Metodo de reduccion ("estandar" o "bloques"; None usa el de la instancia)
+
+        Returns:
+            Tupla con solucion, es_unica y mensaje, igual que GaussJordan.resolver
+        """
+        matriz = np.asarray(matriz)
+        vector = np.asarray(vector)
+        m, n = matriz.shape
+        if vector.shape != (m,):
+            return None, False, f"Dimensiones incompatibles: matriz {m}x{n}, vector {len(vector)}x1"
+
+        if (metodo or self.metodo) in (METODO_EXACTO, METODO_MODULAR):
+            raise ValueError("La sesion incremental trabaja en coma flotante: use 'estandar' o 'bloques'")
+
+        resultado = super().resolver(matriz, vector, nivel_registro, metodo, **opciones)
+        if not self.tipo_sistema:
+            return resultado  # Error de dimensiones o de calculo
+
+        aumentada = self.matriz_reducida
+        rango = len(self.columnas_pivote)
+        self.n = n
+        self._filas = np.zeros((n, n + 1), dtype=aumentada.dtype)
+        self._filas[:rango] = aumentada[:rango]
+        self._filas[np.arange(rango), self.columnas_pivote] = 1  # Identidad exacta en las columnas pivote
+        self._inconsistente = self.tipo_sistema == "inconsistente"
+        self.numero_ecuaciones = m
+        self.ecuaciones_redundantes = []
+        self.ruta_resolucion = RUTA_INCREMENTAL
+        return self._actualizar_analisis()
+
+    def agregar_ecuacion(self, fila: np.ndarray, b) -> Tuple[Optional[np.ndarray], bool, str]:
+        """
+        Agrega la ecuacion fila . x = b y actualiza el analisis en O(rango * n).
+
+        Args:
+            fila: Coeficientes de la ecuacion (n), en el tipo de la sesion
+            b: Termino independiente
+
+        Returns:
+            Tupla con solucion, es_unica y mensaje del sistema ampliado, igual que
+            GaussJordan.resolver
+        """
+        fila = np.asarray(fila)
+        if fila.shape != (self.n,) or np.ndim(b) != 0:
+            return None, False, f"Dimensiones incompatibles: se esperaban {self.n} coeficientes y un escalar"
+
+        self._nivel_activo = self.nivel_registro
+        # La ecuacion se convierte al tipo de la sesion (un b de Python o una fila
+        # float64 no promueven una sesion float32); solo datos complejos en una
+        # sesion real la pasan al complejo de la misma precision
+        tipo = self._filas.dtype
+        if tipo.kind != 'c' and (np.iscomplexobj(fila) or np.iscomplexobj(b)):
+            tipo = tipo_de_trabajo(self._filas, np.complex64(0))
+            self._filas = self._filas.astype(tipo)
+        rango = len(self.columnas_pivote)
+        filas = self._filas[:rango]
+
+        nueva = np.empty(self.n + 1, dtype=tipo)
+        nueva[:self.n] = fila
+        nueva[self.n] = b
+        # Restar a la ecuacion su componente en cada fila pivote (identidad en las columnas pivote)
+        if rango:
+            nueva -= nueva[self.columnas_pivote] @ filas
+        nueva[np.abs(nueva) <= self.tolerancia] = 0
+
+        self.numero_ecuaciones += 1
+        indice = self.numero_ecuaciones
+        candidatas = np.flatnonzero(nueva[:self.n])
+        if len(candidatas) == 0:
+            self.ecuaciones_redundantes.append(indice - 1)
+            if nueva[self.n] != 0 and not self._inconsistente:
+                self._inconsistente = True
+                if self._registrando:
+                    self.operaciones.append(f"Ecuacion {indice}: se reduce a 0 = {nueva[self.n]:.4g} (inconsistente)")
+            elif self._registrando:
+                self.operaciones.append(f"Ecuacion {indice}: combinacion de las anteriores")
+            return self._actualizar_analisis()
+
+        # Nueva columna pivote: la primera entrada no nula de la fila reducida
+        col = int(candidatas[0])
+        nueva /= nueva[col]
+        factores = filas[:, col].copy()
+        if np.any(factores):
+            filas -= np.outer(factores, nueva)
+            filas[:, col] = 0
+
+        posicion = int(np.searchsorted(self.columnas_pivote, col))
+        self._filas[posicion + 1:rango + 1] = self._filas[posicion:rango].copy()
+        self._filas[posicion] = nueva
+        self.columnas_pivote.insert(posicion, col)
+        if self._registrando:
+            self.operaciones.append(f"Ecuacion {indice}: nueva columna pivote {col + 1}")
+        return self._actualizar_analisis()
+
+    def _actualizar_analisis(self) -> Tuple[Optional[np.ndarray], bool, str]:
+        """Recalcula rangos, variables libres, tipo de sistema y solucion en O(n)."""
+        rango = len(self.columnas_pivote)
+        self.matriz_reducida = self._filas[:rango]
+        pivotes = set(self.columnas_pivote)
+        self.variables_libres = [c for c in range(self.n) if c not in pivotes]
+        self.rango_matriz = rango
+        self.rango_aumentada = rango + (1 if self._inconsistente else 0)
+
+        if self._inconsistente:
+            self.tipo_sistema = "inconsistente"
+            self.solucion = None
+            return None, False, self._mensaje_sistema()
+
+        self.solucion = np.zeros(self.n, dtype=self._filas.dtype)
+        self.solucion[self.columnas_pivote] = self._filas[:rango, self.n]
+        self.tipo_sistema = "unico" if rango == self.n else "infinito"
+        return self.solucion, self.tipo_sistema == "unico", self._mensaje_sistema()
@@ -0,0 +1,150 @@
+"""
+Gauss-Jordan por lotes
+Resuelve muchos sistemas pequenos de la misma forma en una sola pasada vectorizada
+"""
+
+import numpy as np
+from typing import Tuple
+from tipos_numericos import tipo_de_trabajo
+
+# Clasificaciones (mismos nombres que GaussJordan.tipo_sistema)
+TIPO_UNICO = "unico"
+TIPO_INFINITO = "infinito"
+TIPO_INCONSISTENTE = "inconsistente"
+
+TIPOS = (TIPO_UNICO, TIPO_INFINITO, TIPO_INCONSISTENTE)
+
+
+class GaussJordanLotes:
+    """
+    Eliminacion de Gauss-Jordan sobre una pila de N sistemas (N, m, n).
+
+    Recorre las columnas una sola vez y, en cada una, busca el pivote, intercambia,
+    normaliza y elimina en todos los sistemas a la vez a lo largo del eje del lote.
+    Cada sistema lleva su propia fila actual, por lo que sistemas con distinto rango
+    o con variables libres en columnas distintas conviven en el mismo lote. Las
+    operaciones de fila son las mismas que hace GaussJordan con pivoteo parcial,
+    asi que la clasificacion coincide con resolver cada sistema por separado.
+
+    No registra pasos: esta pensado para procesos por lotes.
+    """
+
+    def __init__(self, tolerancia: float = 1e-10):
+        self.tolerancia = tolerancia  # Valores con modulo menor o igual se consideran cero
+        self.matrices_reducidas = None  # Matrices aumentadas reducidas (N, m, n+1)
+        self.es_pivote = None  # Columnas pivote de cada sistema (N, n) booleano
+        self.rangos = None  # Rango de la matriz de coeficientes de cada sistema (N,)
+        self.tipos = None  # Clasificacion de cada sistema (N,)
+
+    def resolver(self, matrices: np.ndarray, vectores: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Resuelve los N sistemas A_k x = b_k.
+
+        Args:
+            matrices: Arreglo de coeficientes (N, m, n)
+            vectores: Arreglo de lados derechos (N, m)
+
+        Returns:
+            Tupla con:
+            - Soluciones (N, n): la unica, o la particular con variables libres = 0;
+              NaN en los sistemas inconsistentes
+            - Clasificacion de cada sistema: "unico", "infinito" o "inconsistente"
+            - Rango de la matriz de coeficientes de cada sistema
+        """
+        matrices = np.asarray(matrices)
+        vectores = np.asarray(vectores)
+        if matrices.ndim != 3 or vectores.shape != matrices.shape[:2]:
+            raise ValueError(
+                f"Dimensiones incompatibles: matrices {matrices.shape}, vectores {vectores.shape}; "
+                f"se esperaba (N, m, n) y (N, m)"
+            )
+
+        # Una sola copia, en el tipo de trabajo (float32, float64 o complejo)
+        N, m, n = matrices.shape
+        aumentada = np.empty((N, m, n + 1), dtype=tipo_de_trabajo(matrices, vectores))
+        aumentada[:, :, :n] = matrices
+        aumentada[:, :, n] = vectores
+        es_pivote, rangos = self._reducir(aumentada)
+
+        soluciones, tipos = self._analizar(aumentada, es_pivote, rangos)
+
+        self.matrices_reducidas = aumentada
+        self.es_pivote = es_pivote
+        self.rangos = rangos
+        self.tipos = tipos
+        return soluciones, tipos, rangos
+
+    def _reducir(self, aumentada: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Reduce todas las matrices aumentadas a forma escalonada reducida.
+
+        Args:
+            aumentada: Pila de matrices aumentadas (se modifica en el lugar)
+
+        Returns:
+            Tupla con la mascara de columnas pivote (N, n) y el rango de cada sistema
+        """
+        N, m, columnas = aumentada.shape
+        n = columnas - 1
+        lote = np.arange(N)
+        filas = np.arange(m)
+        fila_actual = np.zeros(N, dtype=np.intp)
+        es_pivote = np.zeros((N, n), dtype=bool)
+
+        for col in range(n):
+            # Buscar pivote: las filas ya usadas no participan
+            valores = np.abs(aumentada[:, :, col])
+            valores[filas[None, :] < fila_actual[:, None]] = -1.0
+            fila_pivote = np.argmax(valores, axis=1)
+            activos = valores[lote, fila_pivote] > self.tolerancia
+            if not activos.any():
+                continue  # Variable libre en todos los sistemas
+
+            indices = lote[activos]
+            destino = fila_actual[activos]
+            origen = fila_pivote[activos]
+
+            # Intercambiar filas y hacer el pivote igual a 1
+            fila = aumentada[indices, origen]
+            aumentada[indices, origen] = aumentada[indices, destino]
+            pivote = fila[:, col]
+            dividir = np.abs(pivote - 1.0) > self.tolerancia
+            fila[dividir] = fila[dividir] / pivote[dividir, None]
+            aumentada[indices, destino] = fila
+
+            # Eliminar la columna en las demas filas (actualizacion de rango 1 por sistema)
+            factores = aumentada[indices, :, col]
+            factores[np.arange(len(indices)), destino] = 0.0
+            factores[np.abs(factores) <= self.tolerancia] = 0.0
+            if len(indices) == N:
+                aumentada -= factores[:, :, None] * fila[:, None, :]
+            else:
+                aumentada[indices] -= factores[:, :, None] * fila[:, None, :]
+
+            es_pivote[indices, col] = True
+            fila_actual[indices] += 1
+
+        return es_pivote, fila_actual
+
+    def _analizar(self, aumentada: np.ndarray, es_pivote: np.ndarray,
+                  rangos: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Clasifica cada sistema y extrae su solucion."""
+        N, m, columnas = aumentada.shape
+        n = columnas - 1
+
+        # Inconsistente si queda un termino independiente no nulo bajo las filas pivote
+        bajo_pivotes = np.arange(m)[None, :] >= rangos[:, None]
+        inconsistentes = (bajo_pivotes & (np.abs(aumentada[:, :, n]) > self.tolerancia)).any(axis=1)
+
+        codigos = np.where(rangos == n, 0, 1)
+        codigos[inconsistentes] = 2
+        tipos = np.array(TIPOS)[codigos]
+
+        # La i-esima columna pivote de cada sistema toma el valor de la fila i
+        sistemas, columnas_pivote = np.nonzero(es_pivote)
+        fila_de_pivote = np.cumsum(es_pivote, axis=1)[sistemas, columnas_pivote] - 1
+        soluciones = np.zeros((N, n), dtype=aumentada.dtype)
+        soluciones[sistemas, columnas_pivote] = aumentada[sistemas, fila_de_pivote, n]
+        soluciones[inconsistentes] = np.nan
+
+        return soluciones, tipos
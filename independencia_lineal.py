@@ -4,16 +4,191 @@ Módulo de Independencia Lineal
 Analiza si un conjunto de vectores es linealmente independiente o dependiente
 """
 
+import math
 import numpy as np
-from typing import Tuple, List, Dict, Any
+from fractions import Fraction
+from typing import Tuple, List, Dict, Any, Optional
+from gauss_elimination_mejorado import GaussEliminationMejorado
 from gauss_jordan import GaussJordan
+from gauss_jordan_incremental import SesionGaussJordan
+from gauss_jordan_lotes import GaussJordanLotes
+from cache_eliminaciones import CacheEliminaciones
+from eliminacion_exacta import es_matriz_entera
+from modular_exacto import analisis_modular
+from registro_pasos import REGISTRO_COMPLETO, REGISTRO_NINGUNO, validar_nivel_registro
+from tipos_numericos import tipo_de_trabajo
+
+# Mayor log|det| representable en float64
+_LOG_MAXIMO = math.log(np.finfo(np.float64).max)
+
+# Vectores dependientes que se separan con QR repetidas antes de pasar a la eliminación
+_MAXIMO_DEFLACIONES = 8
+
+
+def _determinante_householder(h: np.ndarray, tau: np.ndarray) -> Tuple[Any, float]:
+    """
+    Signo y logaritmo del módulo del determinante a partir de np.linalg.qr(mode='raw').
+
+    det(A) = det(Q)·det(R): cada reflector I - tau·v·v^H (v_0 = 1, el resto bajo la
+    diagonal de h) tiene determinante 1 - tau·|v|^2, de módulo 1.
+
+    Args:
+        h: Factorización compacta traspuesta (n x n)
+        tau: Coeficientes de los reflectores
+
+    Returns:
+        Tupla (signo, log|det|); signo es 0 y el logaritmo -inf si es singular
+    """
+    diagonal = np.diagonal(h)
+    modulos = np.abs(diagonal)
+    if not np.all(modulos > 0):
+        return 0, -math.inf
+    factores = (1 - tau * (1 + np.sum(np.abs(np.triu(h, 1)) ** 2, axis=1))) * diagonal / modulos
+    signo = np.prod(factores / np.abs(factores))
+    signo = complex(signo) if np.iscomplexobj(signo) else int(np.rint(signo))
+    return signo, float(np.sum(np.log(modulos)))
+
+
+def _tolerancia_rango(vectores: np.ndarray) -> float:
+    """
+    Umbral de rango relativo a la escala del conjunto: max(n, m)·eps·max‖v_j‖.
+
+    Es la regla de np.linalg.matrix_rank con la mayor norma de columna en lugar
+    del mayor valor singular, así que multiplicar todos los vectores por una
+    constante no cambia el rango.
+
+    Args:
+        vectores: Matriz con los vectores como columnas (n x m)
+
+    Returns:
+        Módulo por debajo del cual un pivote o un residuo se considera cero
+    """
+    n, m = vectores.shape
+    if vectores.size == 0:
+        return 0.0
+    tipo = vectores.dtype if vectores.dtype.kind in 'fc' else np.float64
+    return max(n, m) * float(np.finfo(tipo).eps) * float(np.max(np.linalg.norm(vectores, axis=0)))
+
+
+def _columnas_pivote_householder(vectores: np.ndarray, h: np.ndarray,
+                                 tolerancia: Optional[float] = None) -> Optional[List[int]]:
+    """
+    Columnas pivote (vectores independientes de los anteriores) con QR de Householder.
+
+    Hasta el primer |R_jj| despreciable todas las columnas son pivote y esa es
+    dependiente; a partir de ella R ya no sirve, así que se proyectan las columnas
+    siguientes fuera del espacio de las anteriores y se repite la QR con ellas.
+
+    Args:
+        vectores: Matriz con los vectores como columnas (n x m)
+        h: Resultado de np.linalg.qr(vectores, mode='raw')[0]
+        tolerancia: Umbral para considerar despreciable |R_jj|; por defecto el de
+                    _tolerancia_rango, que se mantiene en cada deflación
+
+    Returns:
+        Lista de columnas pivote (base 0), o None si hay más de _MAXIMO_DEFLACIONES
+        vectores dependientes
+    """
+    n, m = vectores.shape
+    if tolerancia is None:
+        tolerancia = _tolerancia_rango(vectores)
+    columnas = []
+    indices = np.arange(m)
+    resto = vectores
+    for _ in range(_MAXIMO_DEFLACIONES + 1):
+        deficientes = np.flatnonzero(np.abs(np.diagonal(h)) <= tolerancia)
+        k = int(deficientes[0]) if len(deficientes) else min(n, len(indices))
+        columnas.extend(int(c) for c in indices[:k])
+        if len(columnas) == n or k == len(indices):
+            return columnas  # Espacio completo o sin más vectores: el resto depende
+        # El vector k depende de los anteriores; los siguientes se proyectan fuera
+        # del espacio de los k primeros (ya ortogonales a los pivotes previos)
+        siguientes = resto[:, k + 1:]
+        if k:
+            q = np.linalg.qr(resto[:, :k])[0]
+            siguientes = siguientes - q @ (q.conj().T @ siguientes)
+        resto, indices = siguientes, indices[k + 1:]
+        if not len(indices):
+            return columnas
+        h = np.linalg.qr(resto, mode='raw')[0]
+    return None
+
+
+def _dependencias_triviales(vectores: np.ndarray, exacta: bool,
+                            tolerancia: Optional[float] = None) -> Dict[int, Tuple[Optional[int], Any]]:
+    """
+    Vectores nulos o múltiplos escalares de un vector anterior, sin eliminación.
+
+    Cada vector se normaliza dividiéndolo por su primera entrada no nula (así v,
+    -v y 3v quedan iguales) y se agrupa por una firma redondeada del vector
+    normalizado, con un solo producto matriz-vector para todo el conjunto.
+    Los candidatos de un mismo grupo se comprueban contra el primero del grupo:
+    con enteros exactamente (v·u_p = u·v_p), y si no, por la norma de v - factor·u
+    con el mismo umbral que la eliminación. El redondeo solo elige candidatos: un
+    múltiplo que caiga en otro grupo lo detecta después la eliminación.
+
+    Args:
+        vectores: Matriz con los vectores como columnas (n×m)
+        exacta: Si los elementos son enteros (comprobación exacta)
+        tolerancia: Norma por debajo de la cual un vector es nulo y residuo máximo
+                    de un múltiplo; por defecto el de _tolerancia_rango, relativo
+                    a las normas del conjunto como el de la eliminación
+
+    Returns:
+        Diccionario índice -> (índice del vector anterior, factor) en base 0, con
+        índice None y factor 0 para los vectores nulos
+    """
+    n, m = vectores.shape
+    if vectores.dtype.kind not in 'iubfc' or m == 0:
+        return {}
+    datos = np.asarray(vectores, dtype=tipo_de_trabajo(vectores))
+    normas = np.linalg.norm(datos, axis=0)
+    if tolerancia is None:
+        tolerancia = _tolerancia_rango(datos)
+    nulos = normas == 0 if exacta else normas <= tolerancia
+    primeros = np.argmax(np.abs(datos) > (0 if exacta else tolerancia), axis=0)
+    escalas = datos[primeros, np.arange(m)]
+    escalas[nulos] = 1
+    # Firma de cada vector normalizado: su producto con un vector fijo de pesos,
+    # redondeado. Vectores colineales dan la misma firma; una colisión entre
+    # distintos solo produce un candidato que la comprobación descarta
+    pesos = np.cos(np.arange(n) * 2.399963229728653)  # Ángulo áureo: pesos sin periodo corto
+    firmas = np.round((pesos @ datos) / escalas, 8) + 0  # + 0 iguala -0.0 y 0.0
+    # Primer vector (en orden original) de cada grupo de firmas iguales
+    orden = np.argsort(firmas, kind='stable')
+    ordenadas = firmas[orden]
+    inicios = np.ones(m, dtype=bool)
+    inicios[1:] = ordenadas[1:] != ordenadas[:-1]
+    anteriores = np.empty(m, dtype=np.intp)
+    anteriores[orden] = orden[np.flatnonzero(inicios)][np.cumsum(inicios) - 1]
+
+    triviales = {int(j): (None, 0) for j in np.flatnonzero(nulos)}
+    candidatos = np.flatnonzero((anteriores != np.arange(m)) & ~nulos & ~nulos[anteriores])
+    if exacta:
+        for j in candidatos:
+            k, p = int(anteriores[j]), int(primeros[anteriores[j]])
+            u = [int(x) for x in vectores[:, k]]
+            v = [int(x) for x in vectores[:, j]]
+            if all(vi * u[p] == ui * v[p] for ui, vi in zip(u, v)):
+                triviales[int(j)] = (k, Fraction(v[p], u[p]))
+    elif len(candidatos):
+        previos = anteriores[candidatos]
+        factores = escalas[candidatos] / escalas[previos]
+        residuos = np.linalg.norm(datos[:, candidatos] - factores * datos[:, previos], axis=0)
+        confirmados = residuos <= tolerancia
+        for j, k, factor in zip(candidatos[confirmados], previos[confirmados], factores[confirmados]):
+            triviales[int(j)] = (int(k), factor.item())
+    return triviales
+
 
 class IndependenciaLineal:
     """
     Clase para analizar la independencia lineal de vectores.
     """
     
-    def __init__(self):
+    def __init__(self, cache: Optional[CacheEliminaciones] = None, nivel_registro: str = REGISTRO_COMPLETO):
+        self.cache = cache  # Cache compartida de resultados (None = sin cache)
+        self.nivel_registro = validar_nivel_registro(nivel_registro)  # Pasos de la reducción por filas
         self.pasos = []
         self.operaciones = []
         self.vectores = None
@@ -34,6 +209,17 @@ class IndependenciaLineal:
         self.operaciones = []
         self.vectores = vectores.copy()
         
+        clave = None
+        if self.cache is not None:
+            clave = self.cache.clave(vectores, tolerancia=1e-10,
+                                     contexto=('IndependenciaLineal.analizar_vectores', self.nivel_registro),
+                                     exacto=True)  # Los enteros se analizan exactamente
+            guardado = self.cache.obtener(clave)
+            if guardado is not None:
+                self.pasos = guardado['pasos_reduccion']
+                self.resultado_analisis = self._copiar_resultado(guardado)
+                return self.resultado_analisis
+        
         n, m = vectores.shape  # n dimensiones, m vectores
         
         resultado = {
@@ -43,6 +229,10 @@ class IndependenciaLineal:
             'es_independiente': False,
             'rango': 0,
             'determinante': None,
+            'log_determinante': None,  # log|det|, útil cuando el determinante se desborda
+            'signo_determinante': None,
+            'columnas_pivote': [],
+            'dependencias_triviales': [],  # (j, k, factor): v_j = factor·v_k, k None si v_j es nulo
             'tipo_analisis': '',
             'conclusion': '',
             'explicacion_detallada': [],
@@ -50,6 +240,11 @@ class IndependenciaLineal:
             'vectores_combinacion_lineal': []
         }
         
+        # Una sola eliminación da rango, columnas pivote y determinante
+        eliminacion = self._eliminacion_unica(vectores)
+        resultado.update(eliminacion)
+        dependientes = resultado['vectores_combinacion_lineal']
+        
         # Determinar tipo de análisis
         if m > n:
             resultado['tipo_analisis'] = 'MAS_VECTORES_QUE_DIMENSIONES'
@@ -61,13 +256,49 @@ class IndependenciaLineal:
             )
         elif m == n:
             resultado['tipo_analisis'] = 'CUADRADO_DETERMINANTE'
-            resultado = self._analizar_con_determinante(vectores, resultado)
+            det = resultado['determinante']
+            resultado['es_independiente'] = resultado['rango'] == m
+            if resultado['es_independiente']:
+                resultado['explicacion_detallada'].append(
+                    f'Determinante = {det:.6f} ≠ 0, por lo tanto los vectores son linealmente independientes.'
+                )
+            else:
+                resultado['explicacion_detallada'].append(
+                    f'Determinante = {det:.6f} ≈ 0, por lo tanto los vectores son linealmente dependientes.'
+                )
         else:  # m < n
             resultado['tipo_analisis'] = 'REDUCCION_FILAS'
-            resultado = self._analizar_con_reduccion(vectores, resultado)
+            resultado['es_independiente'] = resultado['rango'] == m
+            if resultado['es_independiente']:
+                resultado['explicacion_detallada'].append(
+                    f'El rango de la matriz ({resultado["rango"]}) es igual al número de vectores '
+                    f'({m}), por lo tanto son linealmente independientes.'
+                )
+            else:
+                resultado['explicacion_detallada'].append(
+                    f'El rango de la matriz ({resultado["rango"]}) es menor que el número de vectores '
+                    f'({m}), por lo tanto son linealmente dependientes.'
+                )
+        for j, k, factor in resultado['dependencias_triviales']:
+            resultado['explicacion_detallada'].append(
+                f'v{j} es el vector cero.' if k is None else
+                f'v{j} = {factor if isinstance(factor, Fraction) else format(factor, ".6g")}·v{k} '
+                f'(múltiplo de un vector anterior, detectado sin eliminación).'
+            )
+        if resultado['es_independiente']:
+            resultado['vectores_combinacion_lineal'] = []
+        elif dependientes and resultado['tipo_analisis'] != 'MAS_VECTORES_QUE_DIMENSIONES':
+            resultado['explicacion_detallada'].append(
+                f'Los vectores {", ".join(f"v{j}" for j in dependientes)} son combinación lineal '
+                f'de los anteriores.'
+            )
         
-        # Calcular rango siempre
-        resultado['rango'] = self._calcular_rango(vectores)
+        # Pasos de la reducción por filas, solo para mostrarlos (el rango viene de
+        # la eliminación con umbral relativo y la reducción con pasos se hace aparte)
+        if self._registra_pasos(n, m):
+            if not self.pasos:
+                self._reducir_con_pasos(vectores)
+            resultado['pasos_reduccion'] = self.pasos
         
         # Conclusión final
         if resultado['es_independiente']:
@@ -77,70 +308,138 @@ class IndependenciaLineal:
                 resultado['conclusion'] = f'Los {m} vectores son LINEALMENTE DEPENDIENTES'
         
         self.resultado_analisis = resultado
+        if clave is not None:
+            self.cache.guardar(clave, self._copiar_resultado(resultado))
         return resultado
     
-    def _analizar_con_determinante(self, vectores: np.ndarray, resultado: Dict[str, Any]) -> Dict[str, Any]:
-        """Analiza independencia usando determinante (matriz cuadrada)."""
-        
-        det = np.linalg.det(vectores)
-        resultado['determinante'] = det
-        
-        if abs(det) > 1e-10:
-            resultado['es_independiente'] = True
-            resultado['explicacion_detallada'].append(
-                f'Determinante = {det:.6f} ≠ 0, por lo tanto los vectores son linealmente independientes.'
-            )
-        else:
-            resultado['es_independiente'] = False
-            resultado['explicacion_detallada'].append(
-                f'Determinante = {det:.6f} ≈ 0, por lo tanto los vectores son linealmente dependientes.'
-            )
-        
-        return resultado
+    @staticmethod
+    def _copiar_resultado(resultado: Dict[str, Any]) -> Dict[str, Any]:
+        """Copia un resultado para que la cache no comparta listas ni arreglos con el llamador."""
+        copia = dict(resultado)
+        copia['vectores_originales'] = resultado['vectores_originales'].copy()
+        copia['explicacion_detallada'] = list(resultado['explicacion_detallada'])
+        copia['vectores_combinacion_lineal'] = list(resultado['vectores_combinacion_lineal'])
+        copia['columnas_pivote'] = list(resultado['columnas_pivote'])
+        copia['dependencias_triviales'] = list(resultado['dependencias_triviales'])
+        return copia
     
-    def _analizar_con_reduccion(self, vectores: np.ndarray, resultado: Dict[str, Any]) -> Dict[str, Any]:
-        """Analiza independencia usando reducción por filas."""
-        
-        # Usar Gauss-Jordan para reducir
-        solver = GaussJordan()
-        solucion, es_unica, mensaje = solver.resolver(vectores, np.zeros(vectores.shape[0]))
-        
-        # Obtener información detallada
-        info_detallada = solver.obtener_informacion_detallada()
-        
-        # Guardar pasos
-        if hasattr(solver, 'pasos') and solver.pasos:
-            self.pasos = solver.pasos
+    def _registra_pasos(self, n: int, m: int) -> bool:
+        """Los pasos se guardan solo en la reducción por filas (menos vectores que dimensiones)."""
+        return self.nivel_registro == REGISTRO_COMPLETO and m < n
+    
+    def _reducir_con_pasos(self, vectores: np.ndarray) -> None:
+        """Reduce los vectores con Gauss-Jordan guardando los pasos en self.pasos."""
+        solver = GaussJordan(cache=self.cache)
+        solver.resolver(vectores, np.zeros(vectores.shape[0]))
+        self.pasos = solver.obtener_pasos()
+    
+    def _eliminacion_unica(self, vectores: np.ndarray) -> Dict[str, Any]:
+        """
+        Rango, columnas pivote, vectores dependientes y determinante con una sola
+        eliminación.
         
-        resultado['pasos_reduccion'] = self.pasos
-        resultado['rango'] = info_detallada['rango_matriz']
+        Antes de eliminar se apartan los vectores nulos y los múltiplos escalares
+        de un vector anterior (_dependencias_triviales): no pueden ser columna
+        pivote ni cambian el carácter de las demás, así que la eliminación se hace
+        solo con las direcciones restantes y, si la matriz era cuadrada, el
+        determinante es 0 sin calcularlo. Los pasos guardados (reducción de
+        Gauss-Jordan) se calculan aparte y solo se muestran: el rango no depende
+        del nivel de registro.
         
-        # Determinar independencia
-        if resultado['rango'] == vectores.shape[1]:
-            resultado['es_independiente'] = True
-            resultado['explicacion_detallada'].append(
-                f'El rango de la matriz ({resultado["rango"]}) es igual al número de vectores '
-                f'({vectores.shape[1]}), por lo tanto son linealmente independientes.'
-            )
+        Con elementos enteros se usa la eliminación multimodular (rango, pivotes y
+        determinante exactos, sin tolerancia). Con vectores reales o complejos
+        (m <= n) una factorización QR de Householder de LAPACK da a la vez el
+        determinante (producto de los pivotes R_jj por el determinante de cada
+        reflector) y, si ningún |R_jj| es despreciable, que todos los vectores son
+        independientes. El umbral de "despreciable" es relativo a la escala de los
+        vectores (_tolerancia_rango), así que el rango no cambia al multiplicarlos
+        por una constante. Solo si hay muchas dependencias se hace una eliminación
+        gaussiana con pivoteo parcial para el rango y las columnas pivote. El
+        logaritmo del módulo del determinante se da siempre, porque el producto
+        puede desbordarse.
+        """
+        n, m = vectores.shape
+        resultado = {'determinante': None, 'log_determinante': None, 'signo_determinante': None,
+                     'dependencias_triviales': []}
+        entera = vectores.size > 0 and es_matriz_entera(vectores)
+        if vectores.size == 0:
+            rango, columnas = 0, []
         else:
-            resultado['es_independiente'] = False
-            resultado['explicacion_detallada'].append(
-                f'El rango de la matriz ({resultado["rango"]}) es menor que el número de vectores '
-                f'({vectores.shape[1]}), por lo tanto son linealmente dependientes.'
-            )
-            
-            # Identificar qué vectores son combinación lineal de otros
-            if info_detallada.get('variables_libres'):
-                resultado['vectores_combinacion_lineal'] = list(info_detallada['variables_libres'])
+            tolerancia = None if entera else _tolerancia_rango(np.asarray(vectores, dtype=tipo_de_trabajo(vectores)))
+            triviales = _dependencias_triviales(vectores, entera, tolerancia)
+            resultado['dependencias_triviales'] = [
+                (j + 1, None if k is None else k + 1, factor) for j, (k, factor) in sorted(triviales.items())
+            ]
+            if triviales and n == m:
+                resultado.update(determinante=0.0, log_determinante=-math.inf, signo_determinante=0)
+            unicos = [j for j in range(m) if j not in triviales]
+            restantes = vectores[:, unicos] if triviales else vectores
+            if not unicos:
+                columnas = []
+            elif entera:
+                columnas = self._eliminar_entera(restantes, resultado, n == m and not triviales)
+            else:
+                columnas = self._eliminar_flotante(restantes, resultado, n == m and not triviales, tolerancia)
+            columnas = [unicos[c] for c in columnas]
+            rango = len(columnas)
         
+        pivotes = set(columnas)
+        resultado['rango'] = rango
+        resultado['columnas_pivote'] = [c + 1 for c in columnas]  # Base 1, como los vectores v1..vm
+        resultado['vectores_combinacion_lineal'] = [j + 1 for j in range(m) if j not in pivotes]
         return resultado
     
-    def _calcular_rango(self, matriz: np.ndarray) -> int:
-        """Calcula el rango de la matriz."""
-        try:
-            return np.linalg.matrix_rank(matriz)
-        except:
-            return 0
+    @staticmethod
+    def _eliminar_entera(vectores: np.ndarray, resultado: Dict[str, Any], cuadrada: bool) -> List[int]:
+        """Columnas pivote (y determinante exacto si es cuadrada) por eliminación multimodular."""
+        _, columnas, det = analisis_modular(vectores, determinante=cuadrada)
+        if det is not None:
+            resultado['signo_determinante'] = (det > 0) - (det < 0)
+            resultado['log_determinante'] = math.log(abs(det)) if det else -math.inf
+            resultado['determinante'] = (float(det) if det.bit_length() <= 1023
+                                         else resultado['signo_determinante'] * math.inf)
+        return list(columnas)
+    
+    @staticmethod
+    def _eliminar_flotante(vectores: np.ndarray, resultado: Dict[str, Any], cuadrada: bool,
+                           tolerancia: float) -> List[int]:
+        """Columnas pivote (y determinante si es cuadrada) con QR de Householder."""
+        # Householder (LAPACK): mientras ningún vector dependa de los anteriores,
+        # |R_jj| es la distancia de v_j al espacio generado por v_1..v_{j-1}
+        h, tau = np.linalg.qr(vectores, mode='raw')  # h = [R | reflectores] traspuesta
+        if cuadrada:
+            signo, log_det = _determinante_householder(h, tau)
+            modulo = math.exp(log_det) if log_det < _LOG_MAXIMO else math.inf
+            resultado['signo_determinante'] = signo
+            resultado['log_determinante'] = log_det
+            resultado['determinante'] = signo * modulo if signo != 0 else 0.0
+        columnas = _columnas_pivote_householder(vectores, h, tolerancia)
+        if columnas is None:
+            # Demasiadas dependencias para deflactar: la eliminación gaussiana con
+            # pivoteo parcial da el rango y las columnas pivote. Su tolerancia es
+            # absoluta, así que se elimina con los vectores llevados a norma máxima 1
+            escala = float(np.max(np.linalg.norm(vectores, axis=0)))
+            columnas = GaussEliminationMejorado(REGISTRO_NINGUNO).factorizar(vectores / escala).columnas_pivote
+        return columnas
+    
+    def crear_indice_generado(self, tolerancia: float = 1e-10) -> 'IndiceGenerado':
+        """
+        Índice de pertenencia al subespacio generado por el último conjunto analizado.
+
+        La base son los vectores de las columnas pivote; los coeficientes de cada
+        consulta se refieren a ellos (IndiceGenerado.columnas, en base 1).
+
+        Args:
+            tolerancia: Residuo relativo máximo para considerar que un vector pertenece
+
+        Returns:
+            IndiceGenerado listo para consultas
+        """
+        if not self.resultado_analisis:
+            raise ValueError("No se ha realizado ningún análisis.")
+        columnas = self.resultado_analisis['columnas_pivote']
+        base = self.resultado_analisis['vectores_originales'][:, [c - 1 for c in columnas]]
+        return IndiceGenerado(base, columnas, tolerancia)
     
     def obtener_reporte_completo(self) -> str:
         """Genera un reporte completo del análisis de independencia lineal."""
@@ -180,6 +479,8 @@ class IndependenciaLineal:
         elif resultado['tipo_analisis'] == 'CUADRADO_DETERMINANTE':
             reporte.append("• Cálculo del determinante (matriz cuadrada)")
             reporte.append(f"• Determinante = {resultado['determinante']:.6f}")
+            if resultado.get('log_determinante') is not None and math.isfinite(resultado['log_determinante']):
+                reporte.append(f"• log|det| = {resultado['log_determinante']:.6f}")
         else:
             reporte.append("• Reducción por filas de Gauss-Jordan")
             reporte.append("• Análisis del rango de la matriz")
@@ -213,6 +514,227 @@ class IndependenciaLineal:
         
         return "\n".join(reporte)
 
+class IndiceGenerado:
+    """
+    Índice reutilizable del subespacio generado por una base.
+
+    Guarda la base (n×r, los vectores independientes del conjunto analizado) y
+    su factorización QR reducida B = QR con R⁻¹ ya calculada. Para una consulta
+    v, y = Q^H v da a la vez la proyección Qy (v está en el subespacio si el
+    residuo v - Qy es despreciable) y los coeficientes c = R⁻¹y con Bc = v,
+    en O(n·r) sin repetir ninguna eliminación. consultar atiende una matriz de
+    vectores con un solo producto matriz-matriz Q^H V.
+    """
+
+    def __init__(self, base: np.ndarray, columnas: Optional[List[int]] = None, tolerancia: float = 1e-10):
+        base = np.asarray(base)
+        self.n, self.rango = base.shape
+        self.tolerancia = tolerancia  # Residuo relativo máximo para considerar que v pertenece
+        # Vector original al que corresponde cada coeficiente (base 1)
+        self.columnas = list(range(1, self.rango + 1)) if columnas is None else list(columnas)
+        self.base = np.array(base, dtype=tipo_de_trabajo(base))
+        self._q, r = np.linalg.qr(self.base)
+        self._q_adjunta = np.ascontiguousarray(self._q.conj().T)
+        self._r_inversa = np.linalg.inv(r) if self.rango else r
+
+    def consultar(self, vectores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pertenencia y coeficientes de k vectores a la vez.
+
+        Args:
+            vectores: Matriz con los vectores consultados como columnas (n×k)
+
+        Returns:
+            Tupla con la pertenencia de cada vector (k,) y los coeficientes (r×k)
+            respecto de la base; la columna j solo tiene sentido si el vector j pertenece
+        """
+        vectores = np.asarray(vectores)
+        if vectores.ndim != 2 or vectores.shape[0] != self.n:
+            raise ValueError(f"Se esperaban vectores de dimensión {self.n} como columnas, se recibió {vectores.shape}")
+        proyecciones = self._q_adjunta @ vectores  # Única pasada sobre los datos (r×k)
+        residuos = np.linalg.norm(vectores - self._q @ proyecciones, axis=0)
+        escala = np.maximum(np.linalg.norm(vectores, axis=0), 1.0)
+        return residuos <= self.tolerancia * escala, self._r_inversa @ proyecciones
+
+    def pertenece(self, vector: np.ndarray) -> bool:
+        """Si el vector está en el subespacio generado por la base."""
+        return self._proyectar(vector)[0]
+
+    def coeficientes(self, vector: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Coeficientes de v como combinación lineal de la base.
+
+        Args:
+            vector: Vector de dimensión n
+
+        Returns:
+            Arreglo (r,) con c tal que base @ c = v, o None si v no pertenece al subespacio
+        """
+        pertenece, proyeccion = self._proyectar(vector)
+        return self._r_inversa @ proyeccion if pertenece else None
+
+    def _proyectar(self, vector: np.ndarray) -> Tuple[bool, np.ndarray]:
+        """Pertenencia de un vector y su proyección y = Q^H v, con productos matriz-vector."""
+        vector = np.asarray(vector)
+        if vector.shape != (self.n,):
+            raise ValueError(f"Se esperaba un vector de dimensión {self.n}, se recibió {vector.shape}")
+        proyeccion = self._q_adjunta @ vector
+        residuo = vector - self._q @ proyeccion
+        escala = max(np.linalg.norm(vector), 1.0)
+        return bool(np.linalg.norm(residuo) <= self.tolerancia * escala), proyeccion
+
+
+class IndependenciaIncremental:
+    """
+    Análisis de independencia para vectores que llegan de uno en uno.
+
+    Cada vector se trata como una ecuación más de una SesionGaussJordan: se
+    reduce contra la base escalonada reducida acumulada en O(n·r) y se acepta
+    si aporta una columna pivote nueva; si no, es combinación lineal de los
+    vectores aceptados antes. No se repite ningún determinante, reducción ni
+    SVD sobre el conjunto completo.
+    """
+
+    def __init__(self, n: int, tolerancia: float = 1e-10):
+        self.n = n  # Dimensión de los vectores
+        self._sesion = SesionGaussJordan(n, tolerancia=tolerancia)
+        self.indices_independientes = []  # Índices (desde 0) de los vectores aceptados
+        self.indices_dependientes = []  # Índices (desde 0) de los vectores rechazados
+
+    def agregar_vector(self, vector: np.ndarray) -> bool:
+        """
+        Agrega un vector y decide si es independiente de los anteriores.
+
+        Args:
+            vector: Vector de dimensión n
+
+        Returns:
+            True si el vector amplía el subespacio generado (se acepta)
+        """
+        vector = np.asarray(vector)
+        if vector.shape != (self.n,):
+            raise ValueError(f"Se esperaba un vector de dimensión {self.n}, se recibió {vector.shape}")
+
+        indice = self.num_vectores
+        rango_anterior = self._sesion.rango_matriz
+        self._sesion.agregar_ecuacion(vector, 0)
+        if self._sesion.rango_matriz > rango_anterior:
+            self.indices_independientes.append(indice)
+            return True
+        self.indices_dependientes.append(indice)
+        return False
+
+    def agregar_vectores(self, vectores: np.ndarray) -> List[bool]:
+        """Agrega en orden cada columna de vectores (n×m) y devuelve la decisión de cada una."""
+        return [self.agregar_vector(vectores[:, j]) for j in range(vectores.shape[1])]
+
+    @property
+    def num_vectores(self) -> int:
+        """Vectores agregados hasta ahora."""
+        return len(self.indices_independientes) + len(self.indices_dependientes)
+
+    @property
+    def rango(self) -> int:
+        """Rango del conjunto agregado hasta ahora."""
+        return self._sesion.rango_matriz
+
+    @property
+    def es_independiente(self) -> bool:
+        """Si todos los vectores agregados son linealmente independientes."""
+        return not self.indices_dependientes
+
+    @property
+    def base_reducida(self) -> np.ndarray:
+        """Base del subespacio generado en forma escalonada reducida (r×n, una fila por vector)."""
+        return self._sesion.matriz_reducida[:, :self.n]
+
+
+class IndependenciaLotes:
+    """
+    Análisis de independencia de una pila de N conjuntos de vectores (N, n, m).
+
+    El rango y los vectores independientes salen de una sola reducción de
+    GaussJordanLotes vectorizada sobre el eje del lote (con un término
+    independiente nulo), y los determinantes de los conjuntos cuadrados de una
+    llamada a np.linalg.slogdet sobre toda la pila. No se crea un
+    IndependenciaLineal por conjunto ni se arma ningún texto: los reportes
+    completos solo se generan si se piden con obtener_reportes. Los vectores
+    enteros se analizan en coma flotante, como en GaussJordanLotes. Cada conjunto
+    se reduce dividido por su mayor norma de columna, así que la tolerancia es
+    relativa y el rango no cambia al multiplicar un conjunto por una constante.
+    """
+
+    def __init__(self, tolerancia: float = 1e-10):
+        self.tolerancia = tolerancia  # Módulo relativo a la mayor norma de columna que se considera cero
+        self.vectores = None  # Pila analizada (N, n, m)
+        self.rangos = None  # Rango de cada conjunto (N,)
+        self.es_independiente = None  # Si cada conjunto es independiente (N,)
+        self.es_pivote = None  # Vectores independientes de los anteriores (N, m) booleano
+        self.determinantes = None  # Determinante de cada conjunto (N,); NaN si no es cuadrado
+        self.log_determinantes = None  # log|det| de cada conjunto (N,); NaN si no es cuadrado
+
+    def analizar(self, vectores: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Analiza los N conjuntos a la vez.
+
+        Args:
+            vectores: Arreglo (N, n, m); cada vectores[k] tiene sus m vectores como columnas
+
+        Returns:
+            Tupla con el rango (N,), la independencia (N,) y el determinante (N,)
+            de cada conjunto (NaN en los que no son cuadrados)
+        """
+        vectores = np.asarray(vectores)
+        if vectores.ndim != 3:
+            raise ValueError(f"Dimensiones incompatibles: {vectores.shape}; se esperaba (N, n, m)")
+
+        N, n, m = vectores.shape
+        escalas = np.linalg.norm(vectores, axis=1).max(axis=1, initial=0)
+        escalas[escalas == 0] = 1  # Conjuntos nulos: rango 0 sin escalar
+        normalizados = vectores / escalas[:, np.newaxis, np.newaxis]  # La norma conserva float32
+        solver = GaussJordanLotes(self.tolerancia)
+        _, _, rangos = solver.resolver(normalizados, np.zeros((N, n), dtype=normalizados.dtype))
+
+        if n == m and N:
+            signos, log_determinantes = np.linalg.slogdet(vectores)
+            # El producto de los pivotes puede desbordarse aunque su logaritmo no
+            modulos = np.exp(np.minimum(log_determinantes, _LOG_MAXIMO))
+            modulos[log_determinantes > _LOG_MAXIMO] = np.inf
+            determinantes = signos * modulos
+        else:
+            determinantes = np.full(N, np.nan)
+            log_determinantes = np.full(N, np.nan)
+
+        self.vectores = vectores
+        self.rangos = rangos
+        self.es_independiente = rangos == m
+        self.es_pivote = solver.es_pivote
+        self.determinantes = determinantes
+        self.log_determinantes = log_determinantes
+        return self.rangos, self.es_independiente, self.determinantes
+
+    def obtener_reportes(self, indices: Optional[List[int]] = None) -> List[str]:
+        """
+        Reportes completos (los de IndependenciaLineal) de los conjuntos pedidos.
+
+        Args:
+            indices: Conjuntos cuyo reporte se quiere (None: todos)
+
+        Returns:
+            Lista con el reporte de cada conjunto pedido, en el mismo orden
+        """
+        if self.vectores is None:
+            return []
+        if indices is None:
+            indices = range(len(self.vectores))
+        reportes = []
+        for k in indices:
+            analizador = IndependenciaLineal()
+            analizador.analizar_vectores(self.vectores[k])
+            reportes.append(analizador.obtener_reporte_completo())
+        return reportes
+
+
 # Función auxiliar para las interfaces
 def analizar_independencia_vectores(vectores: np.ndarray) -> Tuple[bool, str, Dict[str, Any]]:
     """
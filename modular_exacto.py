@@ -0,0 +1,367 @@
+"""
+Eliminacion multimodular
+Rango y solucion exactos de sistemas enteros reduciendo modulo varios primos de
+31 bits con int64 vectorizado, y reconstruyendo el resultado con el Teorema
+Chino del Resto y reconstruccion racional
+"""
+
+import math
+import numpy as np
+from fractions import Fraction
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from eliminacion_exacta import matriz_entera
+
+# Primos menores que 2^31: el producto de dos residuos cabe en int64
+_LIMITE_PRIMOS = 2**31
+
+
+def _es_primo(n: int) -> bool:
+    """Miller-Rabin determinista para n < 2^32 (bases 2, 7 y 61)."""
+    if n < 2:
+        return False
+    for p in (2, 3, 5, 7, 11, 13):
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in (2, 7, 61):
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def primo_modular(indice: int) -> int:
+    """Devuelve el indice-esimo primo (de mayor a menor) por debajo de 2^31."""
+    candidato = _LIMITE_PRIMOS - 1 if indice == 0 else primo_modular(indice - 1) - 2
+    while not _es_primo(candidato):
+        candidato -= 2
+    return candidato
+
+
+def _enteros_compactos(enteros: np.ndarray) -> np.ndarray:
+    """Pasa la matriz de enteros de Python a int64 si sus valores caben (residuos mas rapidos)."""
+    if enteros.size == 0 or max(abs(int(v)) for v in enteros.flat) < 2**62:
+        return enteros.astype(np.int64)
+    return enteros
+
+
+def reducir_modulo(enteros: np.ndarray, primos: List[int]) -> np.ndarray:
+    """Residuos (en [0, p)) de una matriz de enteros para cada primo: arreglo int64 (k, m, c)."""
+    if enteros.dtype == object:
+        return np.stack([(enteros % p).astype(np.int64) for p in primos])
+    return np.mod(enteros[None], np.array(primos, dtype=np.int64)[:, None, None])
+
+
+def forma_escalonada_modular(A: np.ndarray, primos: List[int], n: int,
+                             determinantes: Optional[np.ndarray] = None) -> Tuple[np.ndarray, List[int], np.ndarray]:
+    """
+    Forma escalonada (pivotes normalizados a 1) modulo varios primos a la vez,
+    recorriendo las n primeras columnas en orden; en cada primo el pivote es la
+    primera fila con residuo no nulo.
+
+    Todos los primos del lote se eliminan juntos con operaciones int64 vectorizadas.
+    Si en una columna algunos primos tienen pivote y otros no, los que no lo tienen
+    son desafortunados (un primo solo puede perder pivotes respecto de los
+    racionales) y se descartan del lote.
+
+    Args:
+        A: Residuos int64 de forma (k, m, c), uno por primo (se modifica en el lugar)
+        primos: Los k primos, menores que 2^31
+        n: Numero de columnas de coeficientes
+        determinantes: Si se indica, arreglo int64 (k) iniciado en 1 que recibe el
+                       determinante de las n primeras columnas modulo cada primo
+                       (producto de los pivotes por el signo de los intercambios;
+                       0 si la matriz no es cuadrada de rango n modulo ese primo)
+
+    Returns:
+        Tupla con las matrices escalonadas de los primos conservados, las columnas
+        pivote (comunes) y los indices de los primos conservados
+    """
+    P = np.array(primos, dtype=np.int64)[:, None]
+    conservados = np.arange(len(primos))
+    m = A.shape[1]
+    fila = 0
+    columnas_pivote = []
+    for col in range(n):
+        if fila >= m:
+            break
+        # Solo la columna en curso se reduce: el resto se acumula sin reducir
+        A[:, fila:, col] %= P
+        no_nulos = A[:, fila:, col] != 0
+        con_pivote = no_nulos.any(axis=1)
+        if not con_pivote.any():
+            continue
+        if not con_pivote.all():
+            if determinantes is not None:
+                determinantes[conservados[~con_pivote]] = 0
+            A, P, conservados, no_nulos = A[con_pivote], P[con_pivote], conservados[con_pivote], no_nulos[con_pivote]
+
+        filas_pivote = fila + np.argmax(no_nulos, axis=1)
+        lotes = np.flatnonzero(filas_pivote != fila)
+        if len(lotes) > 0:
+            origen = filas_pivote[lotes]
+            temporal = A[lotes, origen, col:].copy()
+            A[lotes, origen, col:] = A[lotes, fila, col:]
+            A[lotes, fila, col:] = temporal
+            if determinantes is not None:
+                determinantes[conservados[lotes]] = -determinantes[conservados[lotes]] % P[lotes, 0]
+
+        if determinantes is not None:
+            determinantes[conservados] = determinantes[conservados] * A[:, fila, col] % P[:, 0]
+        inversos = np.array([pow(int(a), int(p) - 2, int(p)) for a, p in zip(A[:, fila, col], P[:, 0])],
+                            dtype=np.int64)
+        A[:, fila, col:] = A[:, fila, col:] % P * inversos[:, None] % P
+        if fila + 1 < m:
+            # Factores y fila pivote reducidos: cada producto es menor que p^2 < 2^62
+            # y cada paso resta menos de p, asi que los elementos no se desbordan
+            A[:, fila + 1:, col + 1:] -= A[:, fila + 1:, col:col + 1] * A[:, fila:fila + 1, col + 1:] % P[:, :, None]
+            A[:, fila + 1:, col] = 0
+
+        columnas_pivote.append(col)
+        fila += 1
+    A[:, fila:, n:] %= P[:, :, None]
+    if determinantes is not None and (fila < n or m != n):
+        determinantes[conservados] = 0
+    return A, columnas_pivote, conservados
+
+
+def sustitucion_modular(escalonadas: np.ndarray, columnas_pivote: List[int], primos: np.ndarray,
+                        n: int) -> np.ndarray:
+    """Soluciones modulo cada primo de las formas escalonadas (variables libres = 0): arreglo (k, n)."""
+    P = np.asarray(primos, dtype=np.int64)[:, None]
+    x = np.zeros((escalonadas.shape[0], n), dtype=np.int64)
+    for i in range(len(columnas_pivote) - 1, -1, -1):
+        col = columnas_pivote[i]
+        # Reducir cada producto antes de sumar evita el desbordamiento
+        suma = np.sum(escalonadas[:, i, col + 1:n] * x[:, col + 1:n] % P, axis=1)
+        x[:, col] = (escalonadas[:, i, n] - suma) % P[:, 0]
+    return x
+
+
+def _mejor_firma(columnas: List[int], referencia: List[int]) -> bool:
+    """
+    Indica si las columnas pivote obtenidas con un primo son mejores que las de
+    referencia. Un primo "desafortunado" solo puede perder pivotes o retrasarlos,
+    asi que gana el mayor rango y, a igual rango, la secuencia lexicograficamente menor.
+    """
+    if len(columnas) != len(referencia):
+        return len(columnas) > len(referencia)
+    return columnas < referencia
+
+
+def rango_modular(matriz: np.ndarray, primos_coincidentes: int = 2) -> int:
+    """
+    Rango exacto de una matriz entera (o racional).
+
+    El rango modulo p nunca supera al rango sobre los racionales y coincide con el
+    salvo para un numero finito de primos. Se eliminan lotes de primos a la vez y
+    se termina en cuanto se alcanza el rango maximo posible (resultado
+    certificado) o cuando todos los primos de un lote coinciden.
+
+    Args:
+        matriz: Matriz de enteros, Fraction o floats con valores exactos
+        primos_coincidentes: Primos por lote que deben coincidir
+
+    Returns:
+        Rango de la matriz
+    """
+    enteros = matriz_entera(matriz)
+    m, n = enteros.shape
+    compactos = _enteros_compactos(enteros)
+    maximo = min(m, n)
+    mejor = 0
+    indice = 0
+    while True:
+        primos = [primo_modular(indice + i) for i in range(primos_coincidentes)]
+        indice += primos_coincidentes
+        _, columnas, conservados = forma_escalonada_modular(reducir_modulo(compactos, primos), primos, n)
+        mejor = max(mejor, len(columnas))
+        if mejor == maximo or len(conservados) == len(primos):
+            return mejor
+
+
+def analisis_modular(matriz: np.ndarray, determinante: bool = False,
+                     primos_coincidentes: int = 2) -> Tuple[int, List[int], Optional[int]]:
+    """
+    Rango, columnas pivote y (opcionalmente) determinante exactos de una matriz
+    entera con una sola eliminacion multimodular.
+
+    Cada lote de primos se elimina a la vez; gana la mejor firma de columnas
+    pivote (ver _mejor_firma) y se termina cuando todos los primos de un lote
+    coinciden o todas las columnas son pivote. El determinante de cada primo es
+    el producto de sus pivotes por el signo de sus intercambios (0 si es singular
+    modulo ese primo, que es su residuo correcto); los residuos se combinan por
+    CRT hasta superar el doble de la cota de Hadamard.
+
+    Args:
+        matriz: Matriz de enteros, Fraction o floats con valores exactos (m x n)
+        determinante: Calcular tambien el determinante (solo si m == n)
+        primos_coincidentes: Primos por lote que deben coincidir
+
+    Returns:
+        Tupla con el rango, las columnas pivote y el determinante (int, o None si
+        no se pidio o la matriz no es cuadrada)
+    """
+    enteros = matriz_entera(matriz)
+    m, n = enteros.shape
+    compactos = _enteros_compactos(enteros)
+    cuadrada = determinante and m == n
+    bits_necesarios = _bits_hadamard(enteros) + 1 if cuadrada else 0
+
+    firma = None
+    rango_listo = False
+    residuo, modulo = 0, 1
+    indice = 0
+    while not rango_listo or cuadrada and math.log2(modulo) <= bits_necesarios:
+        primos = [primo_modular(indice + i) for i in range(primos_coincidentes)]
+        indice += primos_coincidentes
+        residuos = np.ones(len(primos), dtype=np.int64) if cuadrada else None
+        _, columnas, conservados = forma_escalonada_modular(reducir_modulo(compactos, primos), primos, n,
+                                                            residuos)
+        if not rango_listo:
+            if firma is None or _mejor_firma(columnas, firma):
+                firma = columnas
+            rango_listo = len(firma) == n or len(conservados) == len(primos)
+        if cuadrada:
+            for p, r in zip(primos, residuos):
+                residuo += modulo * ((int(r) - residuo) * pow(modulo % p, p - 2, p) % p)
+                modulo *= p
+        if cuadrada and rango_listo and len(firma) < n:
+            return len(firma), firma, 0
+
+    if not cuadrada:
+        return len(firma), firma, None
+    return len(firma), firma, residuo if residuo <= modulo // 2 else residuo - modulo
+
+
+def reconstruccion_racional(a: int, M: int) -> Optional[Fraction]:
+    """
+    Fraccion n/d con |n|, d <= sqrt(M/2) tal que n = a*d (mod M), o None si no existe.
+    """
+    cota = math.isqrt(M // 2)
+    r0, r1 = M, a % M
+    s0, s1 = 0, 1
+    while r1 > cota:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        s0, s1 = s1, s0 - q * s1
+    if s1 == 0 or abs(s1) > cota or math.gcd(r1, abs(s1)) != 1:
+        return None
+    return Fraction(r1, s1)
+
+
+def _reconstruir_vector(residuos: np.ndarray, M: int) -> Optional[Tuple[np.ndarray, int]]:
+    """
+    Reconstruye un vector racional a partir de sus residuos modulo M.
+
+    Returns:
+        Tupla (y, D) con x = y / D y D el denominador comun, o None si alguna
+        componente no tiene reconstruccion
+    """
+    fracciones = []
+    for r in residuos:
+        fraccion = reconstruccion_racional(int(r), M)
+        if fraccion is None:
+            return None
+        fracciones.append(fraccion)
+    D = math.lcm(*(f.denominator for f in fracciones)) if fracciones else 1
+    numeradores = np.empty(len(fracciones), dtype=object)
+    numeradores[:] = [f.numerator * (D // f.denominator) for f in fracciones]
+    return numeradores, D
+
+
+def _bits_hadamard(enteros: np.ndarray) -> float:
+    """log2 de la cota de Hadamard de los menores de la matriz (producto de normas de filas)."""
+    normas = sorted((math.log2(math.isqrt(sum(int(v) * int(v) for v in fila)) + 1) for fila in enteros),
+                    reverse=True)
+    return sum(normas[:min(enteros.shape)])
+
+
+def resolver_modular(matriz: np.ndarray, vector: np.ndarray,
+                     tam_lote: int = 8) -> Tuple[Optional[np.ndarray], List[int], int, int]:
+    """
+    Resuelve exactamente Ax = b con coeficientes enteros o racionales.
+
+    Cada lote de primos se elimina a la vez y da una forma escalonada por primo
+    con columnas pivote comunes (la "firma"). Los primos con la mejor firma se
+    combinan por CRT; los desafortunados se descartan. Tras cada primo se
+    reconstruye un valor testigo (una combinacion fija de las componentes);
+    cuando dos primos seguidos dan el mismo testigo se reconstruye todo el vector
+    y se verifica A y = D b con aritmetica entera. La cota de Hadamard limita
+    cuantos primos pueden hacer falta.
+
+    Args:
+        matriz: Matriz de coeficientes A (m x n)
+        vector: Vector independiente b (m)
+        tam_lote: Primos eliminados a la vez (el primer lote es de dos)
+
+    Returns:
+        Tupla con la solucion (arreglo de Fraction con variables libres = 0, o None
+        si es inconsistente), columnas pivote, rango de A y rango de [A | b]
+    """
+    enteros = matriz_entera(matriz, vector)
+    m, columnas = enteros.shape
+    n = columnas - 1
+    # Numerador y denominador de cada componente estan acotados por la cota de Hadamard
+    bits_necesarios = 2 * _bits_hadamard(enteros) + 2
+    compactos = _enteros_compactos(enteros)
+
+    firma = None
+    residuos = None
+    modulo = 1
+    testigo_anterior = None
+    pesos = np.arange(1, n + 1, dtype=object)
+    indice = 0
+
+    while True:
+        cantidad = 2 if indice == 0 else tam_lote
+        primos = [primo_modular(indice + i) for i in range(cantidad)]
+        indice += cantidad
+        escalonadas, pivotes, conservados = forma_escalonada_modular(reducir_modulo(compactos, primos), primos, n)
+        primos = [primos[i] for i in conservados]
+        rango = len(pivotes)
+
+        if firma is None or _mejor_firma(pivotes, firma):
+            firma, modulo, testigo_anterior = pivotes, 1, None
+            residuos = np.zeros(n, dtype=object)
+        elif pivotes != firma:
+            continue  # Lote de primos desafortunados
+
+        if np.any(escalonadas[:, rango:, n]):
+            # Con el rango correcto, la inconsistencia modulo p implica inconsistencia
+            # sobre Q; basta con que la confirmen dos primos
+            inconsistentes = np.any(escalonadas[:, rango:, n] != 0, axis=1)
+            if np.count_nonzero(inconsistentes) >= 2:
+                return None, firma, rango, rango + 1
+            continue
+
+        # Soluciones particulares modulo cada primo (variables libres = 0)
+        soluciones = sustitucion_modular(escalonadas, pivotes, primos, n)
+        for p, nuevos in zip(primos, soluciones):
+            inverso = pow(modulo % p, p - 2, p)
+            residuos = residuos + modulo * (((nuevos.astype(object) - residuos % p) * inverso) % p)
+            modulo *= p
+
+            testigo = reconstruccion_racional(int(np.dot(pesos, residuos)) % modulo, modulo)
+            if testigo is not None and testigo == testigo_anterior or math.log2(modulo) > bits_necesarios:
+                resultado = _reconstruir_vector(residuos, modulo)
+                if resultado is not None:
+                    y, D = resultado
+                    if all(np.dot(fila[:n], y) == D * fila[n] for fila in enteros):
+                        solucion = np.empty(n, dtype=object)
+                        solucion[:] = [Fraction(int(v), D) for v in y]
+                        return solucion, firma, rango, rango
+                if math.log2(modulo) > bits_necesarios + 64:
+                    raise RuntimeError("La reconstruccion multimodular no convergio")
+            testigo_anterior = testigo
@@ -0,0 +1,164 @@
+"""
+Registro de pasos de los solucionadores
+Define los niveles de detalle con que se guarda el proceso de eliminación
+y la estructura compacta donde se almacenan los pasos
+"""
+
+import numpy as np
+from collections.abc import Sequence
+from typing import Iterator, List, Optional, Tuple
+
+# Niveles de registro
+REGISTRO_NINGUNO = "ninguno"            # Sin matrices ni descripciones (procesos por lotes)
+REGISTRO_OPERACIONES = "operaciones"    # Solo la descripción de cada operación
+REGISTRO_COMPLETO = "completo"          # Descripción y copia de la matriz en cada paso (interfaces)
+
+NIVELES_REGISTRO = (REGISTRO_NINGUNO, REGISTRO_OPERACIONES, REGISTRO_COMPLETO)
+
+
+def validar_nivel_registro(nivel: str) -> str:
+    """
+    Verifica que el nivel de registro sea uno de los soportados.
+
+    Args:
+        nivel: Nivel de registro solicitado
+
+    Returns:
+        El mismo nivel si es válido
+    """
+    if nivel not in NIVELES_REGISTRO:
+        raise ValueError(
+            f"Nivel de registro desconocido: {nivel!r}. Opciones: {', '.join(NIVELES_REGISTRO)}"
+        )
+    return nivel
+
+
+# Cada cuántas operaciones se guarda una copia completa de la matriz
+INTERVALO_CONTROL = 16
+
+
+class RegistroPasos(Sequence):
+    """
+    Registro compacto de los pasos de una eliminación.
+
+    En lugar de copiar la matriz tras cada operación, guarda la operación
+    elemental realizada (intercambio, división de fila, resta de un múltiplo)
+    y una copia completa cada `intervalo_control` pasos. La matriz del paso i
+    se reconstruye bajo demanda a partir de la copia anterior más cercana, de
+    modo que la memoria crece con el número de operaciones y no con
+    operaciones × tamaño de la matriz.
+
+    Se comporta como una secuencia de solo lectura de matrices: admite len(),
+    índices (incluidos negativos), recorte e iteración.
+    """
+
+    def __init__(self, intervalo_control: int = INTERVALO_CONTROL):
+        if intervalo_control < 1:
+            raise ValueError("El intervalo de control debe ser al menos 1")
+        self.intervalo_control = intervalo_control
+        self._operaciones = []  # Operación elemental de cada paso
+        self._controles = {}  # Índice de paso -> copia completa de la matriz
+
+    def agregar(self, matriz: np.ndarray, operacion: Tuple, orden: Optional[np.ndarray] = None):
+        """
+        Registra un paso.
+
+        Args:
+            matriz: Matriz tal como quedó después de la operación
+            operacion: Tupla con la operación elemental aplicada:
+                       ('inicial',) o ('instantanea',) - copia completa
+                       ('intercambio', i, j)           - F_i <-> F_j
+                       ('dividir', i, divisor)         - F_i = F_i / divisor
+                       ('restar', i, j, factor)        - F_i = F_i - factor * F_j
+                       ('rango1', j, filas, factores)  - F_filas -= factores ⊗ F_j
+            orden: Si el solucionador pivotea con un vector de permutación, fila
+                   física de cada fila lógica (los índices de la operación son
+                   lógicos y las copias se guardan en orden lógico)
+        """
+        indice = len(self._operaciones)
+        self._operaciones.append(operacion)
+        if operacion[0] in ('inicial', 'instantanea') or indice % self.intervalo_control == 0:
+            self._controles[indice] = matriz.copy() if orden is None else matriz[orden]
+
+    def __len__(self) -> int:
+        return len(self._operaciones)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+
+        total = len(self)
+        if indice < 0:
+            indice += total
+        if not 0 <= indice < total:
+            raise IndexError("Índice de paso fuera de rango")
+
+        control = max(c for c in self._controles if c <= indice)
+        matriz = self._controles[control].copy()
+        for operacion in self._operaciones[control + 1:indice + 1]:
+            self._aplicar(matriz, operacion)
+        return matriz
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        matriz = None
+        for indice, operacion in enumerate(self._operaciones):
+            if indice in self._controles:
+                matriz = self._controles[indice].copy()
+            else:
+                self._aplicar(matriz, operacion)
+            yield matriz.copy()
+
+    def memoria_bytes(self) -> int:
+        """Bytes ocupados por las copias completas y los factores guardados."""
+        total = sum(control.nbytes for control in self._controles.values())
+        for operacion in self._operaciones:
+            if operacion[0] == 'rango1':
+                total += operacion[2].nbytes + operacion[3].nbytes
+        return total
+
+    @staticmethod
+    def _aplicar(matriz: np.ndarray, operacion: Tuple):
+        """Reaplica una operación elemental exactamente como la hizo el solucionador."""
+        tipo = operacion[0]
+        if tipo == 'intercambio':
+            _, i, j = operacion
+            matriz[[i, j]] = matriz[[j, i]]
+        elif tipo == 'dividir':
+            _, i, divisor = operacion
+            matriz[i] = matriz[i] / divisor
+        elif tipo == 'restar':
+            _, i, j, factor = operacion
+            matriz[i] = matriz[i] - factor * matriz[j]
+        elif tipo == 'rango1':
+            _, j, filas, factores = operacion
+            matriz[filas] -= np.outer(factores, matriz[j])
+        else:
+            raise ValueError(f"Operación de registro desconocida: {tipo!r}")
+
+
+class SecuenciaPasos(Sequence):
+    """
+    Secuencia perezosa de pares (matriz, descripción) para los visores de pasos.
+
+    Empareja un RegistroPasos con la lista de descripciones igual que lo hacía
+    zip(), pero sin reconstruir ninguna matriz hasta que se solicita.
+    """
+
+    def __init__(self, matrices: Sequence, descripciones: List[str]):
+        self._matrices = matrices
+        self._descripciones = descripciones
+
+    def __len__(self) -> int:
+        return min(len(self._matrices), len(self._descripciones))
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de paso fuera de rango")
+        return self._matrices[indice], self._descripciones[indice]
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, str]]:
+        return zip(self._matrices, self._descripciones)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la cache de eliminaciones
+"""
+
+import numpy as np
+from fractions import Fraction
+from cache_eliminaciones import CacheEliminaciones
+from registro_pasos import REGISTRO_NINGUNO
+from gauss_jordan import GaussJordan, METODO_EXACTO, METODO_MODULAR
+from independencia_lineal import IndependenciaLineal
+
+
+def test_resolver_con_cache():
+    """Un acierto devuelve el mismo resultado y análisis sin recalcular"""
+    matriz = np.array([[1, 2, 3], [2, 1, 1]], dtype=float)
+    vector = np.array([6, 4], dtype=float)
+    cache = CacheEliminaciones()
+
+    referencia = GaussJordan()
+    solucion_ref, _, mensaje_ref = referencia.resolver(matriz, vector)
+
+    solver = GaussJordan(cache=cache)
+    solver.resolver(matriz, vector)
+    solucion, es_unica, mensaje = solver.resolver(matriz.copy(), vector.copy())
+
+    assert cache.estadisticas()['aciertos'] == 1 and cache.estadisticas()['fallos'] == 1
+    assert mensaje == mensaje_ref and not es_unica
+    assert np.array_equal(solucion, solucion_ref)
+    assert solver.obtener_informacion_detallada() == referencia.obtener_informacion_detallada()
+    assert np.array_equal(solver.matriz_reducida, referencia.matriz_reducida)
+    assert np.array_equal(solver.pasos[-1], referencia.pasos[-1])
+
+    # Modificar el resultado devuelto no altera la entrada guardada
+    solucion[:] = 0
+    otra, _, _ = GaussJordan(cache=cache).resolver(matriz, vector)
+    assert np.array_equal(otra, solucion_ref)
+
+    # Otra tolerancia es otra entrada
+    GaussJordan(tolerancia=1e-6, cache=cache).resolver(matriz, vector)
+    assert len(cache) == 2
+
+    # Con y sin la ruta para matrices con estructura tampoco se comparten
+    diagonal = np.diag([2.0, 4.0, 8.0])
+    rapido = GaussJordan(REGISTRO_NINGUNO, cache=cache)
+    rapido.resolver(diagonal, np.ones(3))
+    general = GaussJordan(REGISTRO_NINGUNO, cache=cache, usar_estructura=False)
+    general.resolver(diagonal, np.ones(3))
+    assert rapido.ruta_resolucion != general.ruta_resolucion and len(cache) == 4
+
+
+def test_clave_exacta_distingue_valores_iguales_en_float():
+    """Dos sistemas que solo difieren por debajo de la precisión de float64 no comparten entrada"""
+    vector = np.array([1, 0])
+    for metodo in (METODO_EXACTO, METODO_MODULAR):
+        cache = CacheEliminaciones()
+        for escala in (10**17, 10**17 + 1):
+            solucion, es_unica, _ = GaussJordan(cache=cache, metodo=metodo).resolver(
+                np.array([[escala, 1], [1, 1]]), vector)
+            assert es_unica and solucion[0] == Fraction(1, escala - 1)
+
+        fracciones = [np.array([[Fraction(1, 3) + Fraction(e, 10**20), 1], [1, 1]], dtype=object) for e in (0, 1)]
+        soluciones = [GaussJordan(cache=cache, metodo=metodo).resolver(f, vector)[0] for f in fracciones]
+        assert soluciones[0][0] != soluciones[1][0] and len(cache) == 4
+
+def test_desalojo_por_entradas_y_bytes():
+    """Se descartan primero las entradas usadas hace más tiempo"""
+    cache = CacheEliminaciones(max_entradas=2)
+    cache.guardar('a', np.zeros(4))
+    cache.guardar('b', np.zeros(4))
+    cache.obtener('a')
+    cache.guardar('c', np.zeros(4))
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+
+    cache = CacheEliminaciones(max_bytes=100)
+    cache.guardar('a', np.zeros(8))
+    cache.guardar('b', np.zeros(8))
+    assert len(cache) == 1 and 'b' in cache and cache.bytes_usados == 64
+    cache.guardar('grande', np.zeros(100))
+    assert 'grande' not in cache
+
+
+def test_independencia_con_cache():
+    """El análisis de independencia se reutiliza entre instancias"""
+    vectores = np.array([[1, 2], [2, 4], [0, 1]], dtype=float)
+    cache = CacheEliminaciones()
+
+    primero = IndependenciaLineal(cache=cache).analizar_vectores(vectores)
+    segundo = IndependenciaLineal(cache=cache).analizar_vectores(vectores.copy())
+
+    assert cache.aciertos >= 1
+    assert segundo['rango'] == primero['rango'] and segundo['conclusion'] == primero['conclusion']
+    assert segundo['explicacion_detallada'] is not primero['explicacion_detallada']
+
+    # Enteros iguales como float64 pero distintos: cada uno con su análisis exacto
+    for escala, rango in ((2**60, 1), (2**60 + 1, 2)):
+        enteros = np.array([[escala, 2**60], [1, 1]])
+        assert IndependenciaLineal(cache=cache).analizar_vectores(enteros)['rango'] == rango
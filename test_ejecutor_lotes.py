@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Pruebas del ejecutor de lotes heterogeneos
+"""
+
+import os
+import numpy as np
+import pytest
+from ejecutor_lotes import EjecutorLotes, SOLUCIONADOR_GAUSS, VARIABLES_HILOS_BLAS
+from gauss_jordan import GaussJordan
+from registro_pasos import REGISTRO_NINGUNO
+
+
+def _sistemas_mezclados():
+    generador = np.random.default_rng(11)
+    sistemas = []
+    for k in range(40):
+        m, n = [(2, 2), (3, 4), (12, 12), (9, 7)][k % 4]
+        matriz = generador.integers(-3, 4, size=(m, n)).astype(float)
+        if k % 3 == 0:
+            matriz[:, -1] = matriz[:, 0]
+        sistemas.append((matriz, generador.integers(-3, 4, size=m).astype(float)))
+    return sistemas
+
+
+def test_resultados_en_orden_y_correctos():
+    """Los resultados llegan en el orden de entrada y coinciden con GaussJordan"""
+    sistemas = _sistemas_mezclados()
+    ejecutor = EjecutorLotes(num_procesos=2, max_lote=4)
+    resultados = ejecutor.resolver_todos(sistemas)
+
+    assert len(resultados) == len(sistemas)
+    assert ejecutor.estadisticas['en_lotes'] == 20 and ejecutor.estadisticas['en_procesos'] == 20
+
+    solver = GaussJordan(REGISTRO_NINGUNO)
+    for (matriz, vector), (solucion, es_unica, tipo) in zip(sistemas, resultados):
+        referencia, unica_ref, _ = solver.resolver(matriz, vector)
+        assert tipo == solver.tipo_sistema and es_unica == unica_ref
+        if referencia is None:
+            assert solucion is None
+        else:
+            assert np.allclose(solucion, referencia)
+
+
+def test_solucionador_gauss():
+    """Los sistemas grandes tambien pueden resolverse con GaussEliminationMejorado"""
+    sistemas = _sistemas_mezclados()
+    resultados = EjecutorLotes(num_procesos=2, max_lote=4, solucionador=SOLUCIONADOR_GAUSS).resolver_todos(sistemas)
+
+    solver = GaussJordan(REGISTRO_NINGUNO)
+    for (matriz, vector), (solucion, es_unica, tipo) in zip(sistemas, resultados):
+        solver.resolver(matriz, vector)
+        assert tipo == solver.tipo_sistema
+        if tipo == "unico":
+            assert np.allclose(matriz @ solucion, vector)
+
+    # Su umbral de pivote es fijo: otra tolerancia no puede ignorarse en silencio
+    with pytest.raises(ValueError):
+        EjecutorLotes(solucionador=SOLUCIONADOR_GAUSS, tolerancia=1e-6)
+
+
+def test_errores_por_sistema():
+    """Un sistema mal formado da su tupla de error sin tumbar su grupo ni el resto"""
+    sistemas = _sistemas_mezclados()
+    sistemas[4] = (sistemas[4][0], np.ones(3))  # 2 x 2 con un vector de longitud 3 (en lote)
+    sistemas[6] = (sistemas[6][0], np.ones(5))  # 12 x 12 con un vector de longitud 5 (en un proceso)
+    resultados = EjecutorLotes(num_procesos=1, max_lote=4).resolver_todos(sistemas)
+
+    assert len(resultados) == len(sistemas)
+    for indice in (4, 6):
+        solucion, es_unica, mensaje = resultados[indice]
+        assert solucion is None and not es_unica and mensaje
+    solver = GaussJordan(REGISTRO_NINGUNO)
+    for indice in (0, 8, 2, 10):  # Mismo grupo 2 x 2 que el erroneo, y otros 12 x 12
+        solver.resolver(*sistemas[indice])
+        assert resultados[indice][2] == solver.tipo_sistema
+
+
+def test_entrega_antes_de_resolver_todos_los_grupos():
+    """El primer resultado llega sin haber resuelto los grupos pequenos posteriores"""
+    sistemas = _sistemas_mezclados()
+    ejecutor = EjecutorLotes(num_procesos=1, max_lote=4)
+    resueltos = []
+    original = ejecutor._resolver_grupo
+    ejecutor._resolver_grupo = lambda sistemas, indices: resueltos.append(indices) or original(sistemas, indices)
+
+    resultados = ejecutor.ejecutar(sistemas)
+    next(resultados)
+    assert len(resueltos) == 1  # Solo el grupo del primer sistema (2 x 2)
+    assert len(list(resultados)) == len(sistemas) - 1 and len(resueltos) == 2
+
+
+def test_entorno_blas_restaurado_mientras_se_itera():
+    """Las variables de hilos de BLAS solo cambian mientras se crean los procesos"""
+    antes = {variable: os.environ.get(variable) for variable in VARIABLES_HILOS_BLAS}
+    resultados = EjecutorLotes(num_procesos=2, max_lote=4, hilos_blas=1).ejecutar(_sistemas_mezclados())
+    next(resultados)
+    assert {variable: os.environ.get(variable) for variable in VARIABLES_HILOS_BLAS} == antes
+    resultados.close()  # El llamador deja de iterar antes de terminar
+    assert {variable: os.environ.get(variable) for variable in VARIABLES_HILOS_BLAS} == antes
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Pruebas del espacio de trabajo reutilizable y la resolución sobre la entrada
+"""
+
+import tracemalloc
+import numpy as np
+from espacio_trabajo import EspacioTrabajo, vista_aumentada
+from gauss_elimination_mejorado import GaussEliminationMejorado
+from gauss_jordan import GaussJordan
+from registro_pasos import REGISTRO_NINGUNO
+
+
+def _sistema(n: int, semilla: int = 61):
+    generador = np.random.default_rng(semilla)
+    return generador.standard_normal((n, n)), generador.standard_normal(n)
+
+
+def _memoria_maxima(funcion) -> int:
+    """Bytes máximos reservados durante la llamada (según tracemalloc)."""
+    tracemalloc.start()
+    try:
+        funcion()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_mismo_resultado_con_espacio():
+    """Con y sin espacio de trabajo se obtienen la misma solución y el mismo análisis"""
+    espacio = EspacioTrabajo()
+    for semilla in range(5):
+        matriz, vector = _sistema(12, semilla)
+        matriz[:, 3] = matriz[:, 1] - matriz[:, 2]
+        esperado = GaussJordan(REGISTRO_NINGUNO, usar_estructura=False)
+        solucion_esperada, _, _ = esperado.resolver(matriz, matriz @ vector)
+
+        solver = GaussJordan(REGISTRO_NINGUNO, usar_estructura=False)
+        solucion, _, _ = solver.resolver(matriz, matriz @ vector, espacio_trabajo=espacio)
+        assert solucion is espacio.solucion and solver.matriz_reducida is espacio.aumentada
+        assert np.array_equal(solucion, solucion_esperada)
+        assert np.array_equal(solver.matriz_reducida, esperado.matriz_reducida)
+        assert solver.obtener_informacion_detallada() == esperado.obtener_informacion_detallada()
+        # La permutacion lleva cada fila reducida a su fila original
+        assert sorted(solver.permutacion_filas) == list(range(12))
+
+        gem = GaussEliminationMejorado(REGISTRO_NINGUNO)
+        assert np.allclose(gem.solve(matriz, matriz @ vector, workspace=espacio)[0], solucion_esperada)
+    assert espacio.reservas == 1
+
+
+def test_sin_reservas_en_resoluciones_repetidas():
+    """La segunda resolución de la misma forma no reserva memoria del tamaño de la matriz"""
+    matriz, vector = _sistema(500)
+    espacio = EspacioTrabajo()
+    gauss_jordan = GaussJordan(REGISTRO_NINGUNO)  # Constructor por defecto: con deteccion de estructura
+    gem = GaussEliminationMejorado(REGISTRO_NINGUNO)
+
+    for resolver in (lambda: gauss_jordan.resolver(matriz, vector, espacio_trabajo=espacio),
+                     lambda: gem.solve(matriz, vector, workspace=espacio)):
+        resolver()
+        assert _memoria_maxima(resolver) < matriz.nbytes / 6
+    assert _memoria_maxima(lambda: gauss_jordan.resolver(matriz, vector)) > matriz.nbytes
+
+
+def test_sobrescribir_entrada():
+    """Con la entrada escrita en el espacio se elimina en el lugar, sin copiar"""
+    matriz, vector = _sistema(30)
+    espacio = EspacioTrabajo()
+    A, b = espacio.entrada(30, 30)
+    A[:] = matriz
+    b[:] = vector
+    assert vista_aumentada(A, b, np.dtype(np.float64)) is espacio.aumentada
+    assert vista_aumentada(matriz, vector, np.dtype(np.float64)) is None
+
+    solver = GaussJordan(REGISTRO_NINGUNO, usar_estructura=False)
+    solucion, es_unica, _ = solver.resolver(A, b, espacio_trabajo=espacio, sobrescribir_entrada=True)
+    assert es_unica and np.allclose(matriz @ solucion, vector)
+    assert np.allclose(A, np.eye(30))  # La entrada quedó con la forma reducida
+
+    # Sin permiso para sobrescribir la entrada no se toca
+    aumentada = np.column_stack((matriz, vector))
+    copia = aumentada.copy()
+    GaussEliminationMejorado(REGISTRO_NINGUNO).solve(aumentada[:, :30], aumentada[:, 30])
+    assert np.array_equal(aumentada, copia)
+    solucion, _, _ = GaussEliminationMejorado(REGISTRO_NINGUNO).solve(aumentada[:, :30], aumentada[:, 30],
+                                                                     overwrite_input=True)
+    assert np.allclose(matriz @ solucion, vector)
+    assert np.allclose(np.tril(aumentada[:, :30], -1), 0)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la detección de estructura y las rutas especializadas
+"""
+
+import numpy as np
+from estructura_matriz import (detectar_estructura, ESTRUCTURA_GENERAL, ESTRUCTURA_DIAGONAL,
+                               ESTRUCTURA_TRIANGULAR_SUPERIOR, ESTRUCTURA_TRIANGULAR_INFERIOR,
+                               ESTRUCTURA_DIAGONAL_POR_BLOQUES, ESTRUCTURA_BANDA, ESTRUCTURA_CHOLESKY)
+from gauss_elimination import GaussElimination
+from gauss_jordan import GaussJordan
+from registro_pasos import REGISTRO_NINGUNO
+
+
+def _matrices_con_estructura(n: int = 12):
+    generador = np.random.default_rng(17)
+    general = generador.standard_normal((n, n))
+    tridiagonal = np.diag(np.full(n, 4.0)) + np.diag(np.ones(n - 1), 1) - np.diag(np.ones(n - 1), -1)
+    bloques = np.zeros((n, n))
+    bloques[:5, :5] = generador.standard_normal((5, 5))
+    bloques[5:, 5:] = tridiagonal[5:, 5:]
+    return {
+        ESTRUCTURA_DIAGONAL: np.diag(generador.uniform(1, 2, n)),
+        ESTRUCTURA_TRIANGULAR_SUPERIOR: np.triu(general) + 3 * np.eye(n),
+        ESTRUCTURA_TRIANGULAR_INFERIOR: np.tril(general) + 3 * np.eye(n),
+        ESTRUCTURA_DIAGONAL_POR_BLOQUES: bloques,
+        ESTRUCTURA_BANDA: tridiagonal,
+        ESTRUCTURA_CHOLESKY: general @ general.T + n * np.eye(n),
+        ESTRUCTURA_GENERAL: general,
+    }
+
+
+def test_deteccion():
+    """Cada matriz se reconoce con su estructura"""
+    for estructura, matriz in _matrices_con_estructura().items():
+        assert detectar_estructura(matriz)[0] == estructura
+    assert detectar_estructura(np.ones((3, 4)))[0] == ESTRUCTURA_GENERAL
+
+
+def test_rutas_igual_a_eliminacion_general():
+    """Las rutas especializadas dan la misma solución y análisis que la eliminación general"""
+    generador = np.random.default_rng(19)
+    for estructura, matriz in _matrices_con_estructura().items():
+        vector = generador.standard_normal(len(matriz))
+
+        general = GaussJordan(REGISTRO_NINGUNO, usar_estructura=False)
+        referencia, _, mensaje_ref = general.resolver(matriz, vector)
+        solver = GaussJordan(REGISTRO_NINGUNO)
+        solucion, es_unica, mensaje = solver.resolver(matriz, vector)
+
+        assert solver.ruta_resolucion == estructura
+        assert es_unica and mensaje == mensaje_ref
+        assert np.allclose(solucion, referencia)
+
+        lados = generador.standard_normal((len(matriz), 3))
+        soluciones, son_unicas, _ = solver.resolver(matriz, lados)
+        assert son_unicas.all() and np.allclose(matriz @ soluciones, lados)
+
+        eliminacion = GaussElimination(REGISTRO_NINGUNO)
+        solucion, es_unica, _ = eliminacion.solve(matriz, vector)
+        assert es_unica and np.allclose(solucion, referencia)
+        assert eliminacion.solve_path == estructura  # Bloques generales incluidos
+
+
+def test_singular_y_pasos_completos_usan_ruta_general():
+    """Una triangular singular se clasifica con el algoritmo general; con pasos completos no hay atajo"""
+    matriz = np.array([[1, 2, 3], [0, 0, 1], [0, 0, 2]], dtype=float)
+    solver = GaussJordan(REGISTRO_NINGUNO)
+    solver.resolver(matriz, np.array([1, 2, 4], dtype=float))
+    assert solver.ruta_resolucion == ESTRUCTURA_GENERAL
+    assert solver.tipo_sistema == "infinito"
+
+    completo = GaussJordan()
+    completo.resolver(np.eye(3), np.ones(3))
+    assert completo.ruta_resolucion == ESTRUCTURA_GENERAL and len(completo.pasos) > 0
+
+
+def test_deteccion_sin_temporales_cuadraticos():
+    """La detección recorre la matriz por trozos de filas y corta en cuanto sabe que es general"""
+    import tracemalloc
+    import estructura_matriz
+
+    generador = np.random.default_rng(11)
+    n = 1500
+    general = generador.standard_normal((n, n))
+    tracemalloc.start()
+    assert detectar_estructura(general)[0] == ESTRUCTURA_GENERAL
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert pico < general.nbytes / 4  # Antes: unas tres veces la matriz en índices y máscaras
+
+    # Con trozos de una fila: un bloque mayor que n/2 no se confunde con una matriz general
+    original = estructura_matriz.ELEMENTOS_POR_TROZO
+    estructura_matriz.ELEMENTOS_POR_TROZO = 1
+    try:
+        bloques = np.zeros((10, 10))
+        bloques[:8, :8] = generador.standard_normal((8, 8))
+        bloques[8:, 8:] = np.eye(2)
+        estructura, info = detectar_estructura(bloques)
+        assert estructura == ESTRUCTURA_DIAGONAL_POR_BLOQUES and info['bloques'] == [(0, 8), (8, 9), (9, 10)]
+        assert detectar_estructura(generador.standard_normal((10, 10)))[0] == ESTRUCTURA_GENERAL
+    finally:
+        estructura_matriz.ELEMENTOS_POR_TROZO = original
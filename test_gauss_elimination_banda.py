@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la eliminación de Gauss para matrices de banda
+"""
+
+import numpy as np
+from gauss_elimination import GaussElimination
+from gauss_elimination_banda import BandedMatrix, GaussEliminationBanda
+from registro_pasos import REGISTRO_NINGUNO
+
+
+def test_formato_de_banda():
+    """Conversión densa <-> diagonales y producto matriz-vector"""
+    generador = np.random.default_rng(23)
+    densa = np.triu(np.tril(generador.standard_normal((7, 7)), 2), -1)
+    banda = BandedMatrix.from_dense(densa)
+    x = generador.standard_normal(7)
+
+    assert (banda.lower, banda.upper) == (1, 2)
+    assert np.array_equal(banda.to_dense(), densa)
+    assert np.allclose(banda.matvec(x), densa @ x)
+
+
+def test_igual_que_la_eliminacion_densa():
+    """Misma solución que GaussElimination, con y sin pivoteo"""
+    generador = np.random.default_rng(29)
+    for lower, upper in [(1, 1), (2, 1), (1, 3), (3, 3)]:
+        for _ in range(10):
+            n = int(generador.integers(5, 15))
+            densa = np.triu(np.tril(generador.integers(-5, 6, size=(n, n)), upper), -lower).astype(float)
+            vector = generador.integers(-5, 6, size=n).astype(float)
+
+            referencia, unica_ref, _ = GaussElimination(REGISTRO_NINGUNO).solve(densa, vector)
+            solver = GaussEliminationBanda()
+            solucion, es_unica, _ = solver.solve(BandedMatrix.from_dense(densa, lower, upper), vector)
+
+            assert es_unica == unica_ref
+            if unica_ref:
+                assert np.allclose(solucion, referencia)
+
+
+def test_thomas_gran_tamano():
+    """Sistema tridiagonal de 100000 incógnitas sin formar la matriz densa"""
+    n = 100000
+    banda = BandedMatrix.tridiagonal(-np.ones(n - 1), np.full(n, 2.5), -np.ones(n - 1))
+    x = np.sin(np.linspace(0, 10, n))
+
+    solver = GaussEliminationBanda()
+    solucion, es_unica, _ = solver.solve(banda, banda.matvec(x))
+
+    assert es_unica and solver.method == "thomas"
+    assert np.allclose(solucion, x)
+
+
+def test_singular():
+    """Una matriz de banda singular se informa como en la eliminación densa"""
+    banda = BandedMatrix.tridiagonal(np.ones(3), np.ones(4), np.ones(3))
+    densa = banda.to_dense()
+    densa[3] = densa[2]
+    solucion, es_unica, mensaje = GaussEliminationBanda().solve(BandedMatrix.from_dense(densa), np.ones(4))
+    assert solucion is None and not es_unica
+    assert mensaje == "Sistema sin solución única (matriz singular)"
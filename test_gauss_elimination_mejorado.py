@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Pruebas del método de Gauss para matrices rectangulares
+"""
+
+import numpy as np
+from gauss_elimination_mejorado import GaussEliminationMejorado, PRECISION_DOUBLE, PRECISION_MIXED
+from registro_pasos import REGISTRO_NINGUNO
+
+
+def test_multiples_lados_derechos():
+    """Resolver un bloque B equivale a resolver cada columna por separado"""
+    generador = np.random.default_rng(7)
+    for m, n in [(4, 4), (6, 4), (5, 5)]:
+        matriz = generador.integers(-3, 4, size=(m, n)).astype(float)
+        matriz[:, 1] = 2 * matriz[:, 0]
+        lados = np.column_stack([matriz @ generador.integers(-2, 3, size=n),
+                                 generador.integers(-3, 4, size=m)]).astype(float)
+
+        solver = GaussEliminationMejorado()
+        soluciones, unicas, _ = solver.solve(matriz, lados)
+
+        for j in range(lados.shape[1]):
+            solucion, es_unica, _ = GaussEliminationMejorado().solve(matriz, lados[:, j])
+            assert unicas[j] == es_unica
+            if solucion is None:
+                assert solver.solution_types[j] == "inconsistente"
+                assert np.isnan(soluciones[:, j]).all()
+            else:
+                assert np.allclose(soluciones[:, j], solucion)
+
+
+def test_matriz_ancha_con_columna_sin_pivote():
+    """En una matriz ancha los pivotes pueden estar más allá de la columna min(m, n)"""
+    matriz = np.array([[0.0, 1.0, 2.0, 3.0],
+                       [0.0, 2.0, 4.0, 7.0]])  # Pivotes en las columnas 1 y 3
+    vector = np.array([1.0, 3.0])
+
+    solucion, es_unica, mensaje = GaussEliminationMejorado().solve(matriz, vector)
+    assert solucion is not None and not es_unica, mensaje
+    assert np.allclose(matriz @ solucion, vector)
+
+    factorizacion = GaussEliminationMejorado().factorizar(matriz)
+    assert factorizacion.rango == 2 and list(factorizacion.columnas_pivote) == [1, 3]
+
+
+def test_factorizacion_reutilizable():
+    """La factorización resuelve nuevos vectores igual que solve"""
+    generador = np.random.default_rng(11)
+    for m, n in [(5, 5), (7, 4), (4, 6)]:
+        matriz = generador.integers(-4, 5, size=(m, n)).astype(float)
+        matriz[:, -1] = matriz[:, 0] - matriz[:, 1]
+
+        solver = GaussEliminationMejorado()
+        factorizacion = solver.factorizar(matriz)
+        assert solver._active_level == solver.record_level  # factorizar no cambia el nivel activo
+
+        L = np.eye(m)
+        L[:, :factorizacion.rango] += factorizacion.L  # Diagonal unitaria implícita
+        assert np.allclose(matriz[factorizacion.permutacion], L @ factorizacion.U)
+
+        for _ in range(3):
+            vector = generador.integers(-4, 5, size=m).astype(float)
+            if _ == 0:
+                vector = matriz @ generador.integers(-2, 3, size=n)
+            esperado = GaussEliminationMejorado().solve(matriz, vector)
+            obtenido = factorizacion.resolver(vector)
+            assert obtenido[1:] == esperado[1:]
+            if esperado[0] is None:
+                assert obtenido[0] is None
+            else:
+                assert np.allclose(obtenido[0], esperado[0])
+
+
+def test_precision_mixta():
+    """Factores float32 con refinamiento: precisión de float64, y respaldo si no converge"""
+    generador = np.random.default_rng(59)
+    n = 120
+    matriz = generador.standard_normal((n, n)) + np.sqrt(n) * np.eye(n)
+    x = generador.standard_normal(n)
+    vector = matriz @ x
+
+    solver = GaussEliminationMejorado(REGISTRO_NINGUNO)
+    solucion, es_unica, _ = solver.solve_mixed_precision(matriz, vector)
+    esperada, _, _ = solver.solve(matriz, vector)
+
+    assert es_unica and solver.precision_used == PRECISION_MIXED
+    assert 1 <= solver.refinement_iterations <= 5
+    assert solver.refinement_residual <= np.sqrt(n) * np.finfo(float).eps
+    assert np.max(np.abs(solucion - x)) <= 10 * np.max(np.abs(esperada - x)) + 1e-13
+
+    # Hilbert 8x8: float32 no alcanza y se resuelve en float64
+    hilbert = 1 / (np.arange(8)[:, None] + np.arange(8) + 1)
+    resultado = solver.solve_mixed_precision(hilbert, hilbert @ np.ones(8))
+    assert solver.precision_used == PRECISION_DOUBLE
+    assert resultado[1:] == solver.solve(hilbert, hilbert @ np.ones(8))[1:]
+
+    # Singular: misma clasificación que solve
+    singular = np.ones((3, 3))
+    assert solver.solve_mixed_precision(singular, np.ones(3))[1:] == solver.solve(singular, np.ones(3))[1:]
+    assert solver.precision_used == PRECISION_DOUBLE
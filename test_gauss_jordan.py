@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Pruebas del método Gauss-Jordan
+"""
+
+import math
+import numpy as np
+from fractions import Fraction
+from gauss_jordan import GaussJordan, METODO_BLOQUES, METODO_EXACTO
+from registro_pasos import REGISTRO_NINGUNO, REGISTRO_OPERACIONES
+
+
+def _eliminacion_fila_a_fila(matriz: np.ndarray, vector: np.ndarray) -> np.ndarray:
+    """Reducción de referencia con el bucle original de Gauss-Jordan (una resta por fila)."""
+    m, n = matriz.shape
+    aumentada = np.column_stack((matriz.astype(float), vector.astype(float)))
+
+    fila_actual = 0
+    for col in range(n):
+        max_val = 0
+        fila_pivote = -1
+        for i in range(fila_actual, m):
+            if abs(aumentada[i, col]) > max_val:
+                max_val = abs(aumentada[i, col])
+                fila_pivote = i
+        if max_val <= 1e-10:
+            continue
+
+        if fila_pivote != fila_actual:
+            aumentada[[fila_actual, fila_pivote]] = aumentada[[fila_pivote, fila_actual]]
+
+        pivote = aumentada[fila_actual, col]
+        if abs(pivote - 1.0) > 1e-10:
+            aumentada[fila_actual] = aumentada[fila_actual] / pivote
+
+        for i in range(m):
+            if i != fila_actual and abs(aumentada[i, col]) > 1e-10:
+                factor = aumentada[i, col]
+                aumentada[i] = aumentada[i] - factor * aumentada[fila_actual]
+
+        fila_actual += 1
+        if fila_actual >= m:
+            break
+
+    return aumentada
+
+
+def test_solucion_unica():
+    """Sistema 3x3 con solución única"""
+    matriz = np.array([[2, 1, -1], [1, -1, 2], [3, 2, 1]], dtype=float)
+    vector = np.array([8, 0, 11], dtype=float)
+
+    solver = GaussJordan()
+    solucion, es_unica, _ = solver.resolver(matriz, vector)
+
+    assert es_unica
+    assert np.allclose(matriz @ solucion, vector)
+    assert solver.columnas_pivote == [0, 1, 2]
+    assert solver.variables_libres == []
+
+
+def test_infinitas_e_inconsistente():
+    """Clasificación de sistemas subdeterminados e inconsistentes"""
+    solver = GaussJordan()
+    solucion, es_unica, _ = solver.resolver(np.array([[1, 2, 3], [2, 1, 1]], dtype=float),
+                                            np.array([6, 4], dtype=float))
+    assert solver.tipo_sistema == "infinito"
+    assert not es_unica
+    assert solver.columnas_pivote == [0, 1]
+    assert solver.variables_libres == [2]
+
+    solucion, es_unica, _ = solver.resolver(np.array([[1, 2], [2, 4], [1, 2]], dtype=float),
+                                            np.array([3, 6, 5], dtype=float))
+    assert solver.tipo_sistema == "inconsistente"
+    assert solucion is None
+
+
+def test_rango_1_igual_a_bucle_fila_a_fila():
+    """La actualización vectorizada reproduce exactamente la eliminación original"""
+    generador = np.random.default_rng(1)
+    for m, n in [(6, 6), (8, 5), (5, 9)]:
+        matriz = generador.integers(-4, 5, size=(m, n)).astype(float)
+        matriz[:, -1] = matriz[:, 0] + matriz[:, 1]  # Forzar una columna dependiente
+        vector = generador.integers(-4, 5, size=m).astype(float)
+
+        solver = GaussJordan()
+        solver.resolver(matriz, vector)
+
+        assert np.array_equal(solver.pasos[-1], _eliminacion_fila_a_fila(matriz, vector))
+
+
+def test_niveles_de_registro():
+    """Los niveles de registro no alteran la solución"""
+    matriz = np.array([[2, 1, -1], [1, -1, 2], [3, 2, 1]], dtype=float)
+    vector = np.array([8, 0, 11], dtype=float)
+
+    completo = GaussJordan()
+    referencia, _, _ = completo.resolver(matriz, vector)
+
+    solver = GaussJordan(REGISTRO_NINGUNO)
+    solucion, es_unica, _ = solver.resolver(matriz, vector)
+    assert np.array_equal(solucion, referencia)
+    assert len(solver.pasos) == 0 and len(solver.operaciones) == 0
+
+    solver.resolver(matriz, vector, nivel_registro=REGISTRO_OPERACIONES)
+    assert len(solver.pasos) == 0
+    assert solver.operaciones == completo.operaciones
+
+
+def test_metodo_por_bloques_igual_al_estandar():
+    """El método por bloques da el mismo rango, pivotes y variables libres"""
+    generador = np.random.default_rng(3)
+    for prueba in range(60):
+        m, n = generador.integers(1, 14, size=2)
+        matriz = generador.integers(-3, 4, size=(m, n)).astype(float)
+        if n > 2:
+            matriz[:, generador.integers(n)] = 2 * matriz[:, 0] - matriz[:, 1]
+        vector = generador.integers(-3, 4, size=m).astype(float)
+        if prueba % 3 == 0:
+            vector = matriz @ generador.integers(-2, 3, size=n)
+
+        estandar = GaussJordan()
+        solucion_1, unica_1, mensaje_1 = estandar.resolver(matriz, vector)
+        bloques = GaussJordan(metodo=METODO_BLOQUES, tam_bloque=int(generador.integers(1, 5)))
+        solucion_2, unica_2, mensaje_2 = bloques.resolver(matriz, vector)
+
+        assert mensaje_1 == mensaje_2
+        assert estandar.obtener_informacion_detallada() == bloques.obtener_informacion_detallada()
+        if solucion_1 is not None:
+            assert np.allclose(solucion_1, solucion_2)
+
+
+def test_multiples_lados_derechos():
+    """Cada columna de B se clasifica igual que resolviéndola por separado"""
+    generador = np.random.default_rng(5)
+    matriz = generador.integers(-3, 4, size=(5, 4)).astype(float)
+    matriz[:, 2] = matriz[:, 0] + matriz[:, 1]
+    lados = np.column_stack([matriz @ np.array([1, 2, 0, -1]), generador.integers(-3, 4, size=5)]).astype(float)
+
+    solver = GaussJordan()
+    soluciones, son_unicas, _ = solver.resolver(matriz, lados)
+
+    assert soluciones.shape == (4, 2)
+    for j in range(lados.shape[1]):
+        individual = GaussJordan()
+        solucion, es_unica, _ = individual.resolver(matriz, lados[:, j])
+        assert solver.tipos_sistema[j] == individual.tipo_sistema
+        assert son_unicas[j] == es_unica
+        if solucion is None:
+            assert np.isnan(soluciones[:, j]).all()
+        else:
+            assert np.allclose(soluciones[:, j], solucion)
+
+
+def test_metodo_exacto():
+    """Bareiss: clasificación igual a la de punto flotante en casos bien condicionados y solución racional exacta"""
+    generador = np.random.default_rng(31)
+    for prueba in range(60):
+        m, n = generador.integers(1, 9, size=2)
+        matriz = generador.integers(-4, 5, size=(m, n))
+        if n > 2:
+            matriz[:, -1] = matriz[:, 0] + 3 * matriz[:, 1]
+        vector = generador.integers(-4, 5, size=m)
+        if prueba % 2 == 0:
+            vector = matriz @ generador.integers(-2, 3, size=n)
+
+        flotante = GaussJordan(REGISTRO_NINGUNO)
+        flotante.resolver(matriz.astype(float), vector.astype(float))
+        exacto = GaussJordan(REGISTRO_NINGUNO, metodo=METODO_EXACTO)
+        solucion, _, _ = exacto.resolver(matriz, vector)
+
+        assert exacto.obtener_informacion_detallada() == flotante.obtener_informacion_detallada()
+        if solucion is not None:
+            assert all(sum(Fraction(int(a)) * x for a, x in zip(fila, solucion)) == b
+                       for fila, b in zip(matriz, vector))
+
+
+def test_metodo_exacto_mal_condicionado():
+    """Hilbert escalada 12x12 y enteros grandes: resultado exacto sin tolerancias"""
+    n = 12
+    escala = math.lcm(*range(1, 2 * n))
+    hilbert = np.array([[escala // (i + j + 1) for j in range(n)] for i in range(n)], dtype=object)
+    vector = hilbert.dot(np.ones(n, dtype=object))
+
+    solucion, es_unica, _ = GaussJordan(metodo=METODO_EXACTO).resolver(hilbert, vector)
+    assert es_unica and all(x == 1 for x in solucion)
+
+    # Determinante 1 con elementos de 10^12: fuera del alcance de int64 en Bareiss
+    grande = np.array([[10**12, 10**12 + 1], [10**12 - 1, 10**12]], dtype=object)
+    solucion, es_unica, _ = GaussJordan(metodo=METODO_EXACTO).resolver(grande, np.array([1, 0], dtype=object))
+    assert es_unica and list(solucion) == [10**12, 1 - 10**12]
+
+    solver = GaussJordan(metodo=METODO_EXACTO)
+    solver.resolver(np.array([[3, 6], [Fraction(1, 2), 1]], dtype=object), np.array([3, Fraction(1, 2)], dtype=object))
+    assert solver.tipo_sistema == "infinito" and solver.variables_libres == [1]
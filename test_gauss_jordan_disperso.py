@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Pruebas de Gauss-Jordan para matrices dispersas
+"""
+
+import numpy as np
+from gauss_jordan import GaussJordan
+from gauss_jordan_disperso import GaussJordanDisperso, MatrizCSR
+from registro_pasos import REGISTRO_NINGUNO
+
+
+def test_formato_csr():
+    """Conversión COO -> CSR con duplicados y vuelta a densa"""
+    matriz = MatrizCSR.desde_coo([0, 2, 0, 2], [1, 0, 1, 3], [1.0, 5.0, 2.0, -1.0], (3, 4))
+    esperada = np.array([[0, 3, 0, 0], [0, 0, 0, 0], [5, 0, 0, -1]], dtype=float)
+    assert matriz.nnz == 3
+    assert np.array_equal(matriz.a_densa(), esperada)
+    assert np.array_equal(MatrizCSR.desde_densa(esperada).a_densa(), esperada)
+
+
+def test_mismo_analisis_que_denso():
+    """Rango, pivotes, variables libres y solución coinciden con GaussJordan"""
+    generador = np.random.default_rng(13)
+    for prueba in range(80):
+        m, n = generador.integers(1, 12, size=2)
+        matriz = generador.integers(-3, 4, size=(m, n)) * (generador.random((m, n)) < 0.3)
+        matriz = matriz.astype(float)
+        if n > 2 and prueba % 2 == 0:
+            matriz[:, -1] = matriz[:, 0] - 2 * matriz[:, 1]
+        vector = generador.integers(-3, 4, size=m).astype(float)
+        if prueba % 3 == 0:
+            vector = matriz @ generador.integers(-2, 3, size=n)
+
+        denso = GaussJordan(REGISTRO_NINGUNO)
+        solucion_1, unica_1, mensaje_1 = denso.resolver(matriz, vector)
+        disperso = GaussJordanDisperso()
+        solucion_2, unica_2, mensaje_2 = disperso.resolver(MatrizCSR.desde_densa(matriz), vector)
+
+        assert mensaje_1 == mensaje_2
+        info_denso = denso.obtener_informacion_detallada()
+        info_disperso = disperso.obtener_informacion_detallada()
+        assert info_disperso.pop('ruta_resolucion') == "dispersa"
+        info_denso.pop('ruta_resolucion')
+        assert info_denso == info_disperso
+        assert denso.variables_libres == disperso.variables_libres
+        if solucion_1 is not None:
+            assert np.allclose(matriz @ solucion_2, vector)
+            if unica_1:
+                assert np.allclose(solucion_1, solucion_2)
+
+
+def test_red_grande_sin_densificar():
+    """Sistema tipo red de 3000 nodos: el relleno se mantiene acotado"""
+    n = 3000
+    generador = np.random.default_rng(2)
+    filas = np.concatenate([np.arange(n), np.arange(n - 1), np.arange(1, n)])
+    columnas = np.concatenate([np.arange(n), np.arange(1, n), np.arange(n - 1)])
+    valores = np.concatenate([np.full(n, 4.0), np.full(2 * (n - 1), -1.0)])
+    extra = generador.integers(0, n, size=(2, 200))  # Conexiones lejanas
+    matriz = MatrizCSR.desde_coo(np.concatenate([filas, extra[0]]), np.concatenate([columnas, extra[1]]),
+                                 np.concatenate([valores, np.full(200, -0.01)]), (n, n))
+    x = generador.standard_normal(n)
+    densa = matriz.a_densa()
+
+    solver = GaussJordanDisperso()
+    solucion, es_unica, _ = solver.resolver(matriz, densa @ x)
+
+    assert es_unica
+    assert np.allclose(solucion, x)
+    assert solver.relleno < 50 * n
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Pruebas de Gauss-Jordan sobre GF(2) con filas empaquetadas
+"""
+
+import numpy as np
+from gauss_jordan_gf2 import GaussJordanGF2, RUTA_GF2, desempaquetar_bits, empaquetar_bits
+
+
+def forma_reducida_gf2(matriz: np.ndarray, vector: np.ndarray):
+    """Referencia: forma escalonada reducida módulo 2 fila a fila"""
+    aumentada = np.column_stack((matriz, vector)).astype(np.uint8) % 2
+    m, n = matriz.shape
+    fila, columnas_pivote = 0, []
+    for col in range(n):
+        candidatas = np.flatnonzero(aumentada[fila:, col]) if fila < m else []
+        if len(candidatas) == 0:
+            continue
+        pivote = fila + candidatas[0]
+        aumentada[[fila, pivote]] = aumentada[[pivote, fila]]
+        for i in range(m):
+            if i != fila and aumentada[i, col]:
+                aumentada[i] ^= aumentada[fila]
+        columnas_pivote.append(col)
+        fila += 1
+    return aumentada, columnas_pivote
+
+
+def test_empaquetado():
+    """Ida y vuelta bits <-> palabras uint64, con columnas que cruzan palabras"""
+    generador = np.random.default_rng(43)
+    bits = generador.integers(0, 2, size=(5, 130))
+    palabras = empaquetar_bits(bits)
+
+    assert palabras.dtype == np.uint64 and palabras.shape == (5, 3)
+    assert np.array_equal(desempaquetar_bits(palabras, 130), bits)
+    assert int(palabras[0, 0]) & 1 == bits[0, 0]
+
+    # Enteros cualesquiera (también negativos) y el vector como columna extra
+    matriz = generador.integers(-9, 10, size=(5, 64))
+    vector = generador.integers(-9, 10, size=5)
+    palabras = empaquetar_bits(matriz, vector)
+    assert palabras.shape == (5, 2)
+    assert np.array_equal(desempaquetar_bits(palabras, 65), np.column_stack((matriz, vector)) % 2)
+
+
+def test_igual_que_la_reduccion_fila_a_fila():
+    """Misma forma reducida, columnas pivote, variables libres y clasificación"""
+    generador = np.random.default_rng(47)
+    for _ in range(60):
+        m, n = generador.integers(1, 40, size=2)
+        matriz = generador.integers(0, 2, size=(m, n))
+        if n > 3:
+            matriz[:, 2] = matriz[:, 0] ^ matriz[:, 1]
+        vector = generador.integers(0, 2, size=m)
+
+        solver = GaussJordanGF2()
+        solucion, es_unica, _ = solver.resolver(matriz, vector)
+        esperada, columnas_pivote = forma_reducida_gf2(matriz, vector)
+        rango = len(columnas_pivote)
+
+        assert solver.columnas_pivote == columnas_pivote
+        assert solver.variables_libres == [c for c in range(n) if c not in columnas_pivote]
+        assert np.array_equal(desempaquetar_bits(solver.matriz_reducida, n + 1), esperada)
+        assert solver.ruta_resolucion == RUTA_GF2
+        assert es_unica == (solver.tipo_sistema == "unico")
+        assert (solucion is None) == bool(esperada[rango:, n].any())
+        if solucion is not None:
+            assert np.array_equal(matriz @ solucion % 2, vector)
+
+
+def test_sistema_grande_empaquetado():
+    """Sistema de 600 variables resuelto directamente desde las palabras"""
+    generador = np.random.default_rng(53)
+    n = 600
+    matriz = generador.integers(0, 2, size=(n + 20, n), dtype=np.uint8)
+    x = generador.integers(0, 2, size=n, dtype=np.uint8)
+    vector = matriz.astype(np.int64) @ x % 2
+
+    solver = GaussJordanGF2()
+    solucion, _, mensaje = solver.resolver_empaquetado(empaquetar_bits(matriz, vector), n)
+
+    assert solver.tipo_sistema in ("unico", "infinito"), mensaje
+    assert np.array_equal(matriz.astype(np.int64) @ solucion % 2, vector)
+    assert solver.rango_aumentada == solver.rango_matriz
+
+    # Una ecuacion suma de las dos primeras con el termino independiente cambiado
+    matriz = np.vstack((matriz, matriz[0] ^ matriz[1]))
+    vector = np.append(vector, vector[0] ^ vector[1] ^ 1)
+    solucion, es_unica, _ = solver.resolver(matriz, vector)
+    assert solucion is None and not es_unica
+    assert solver.tipo_sistema == "inconsistente"
+    assert solver.rango_aumentada == solver.rango_matriz + 1
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la sesion incremental de Gauss-Jordan
+"""
+
+import numpy as np
+from gauss_jordan import GaussJordan
+from gauss_jordan_incremental import SesionGaussJordan
+from registro_pasos import REGISTRO_NINGUNO, REGISTRO_OPERACIONES
+
+
+def _comparar_con_resolver(sesion: SesionGaussJordan, matriz: np.ndarray, vector: np.ndarray, resultado):
+    """La sesion coincide con resolver desde cero el sistema acumulado"""
+    completo = GaussJordan(REGISTRO_NINGUNO, usar_estructura=False)
+    solucion, es_unica, mensaje = completo.resolver(matriz, vector)
+    assert resultado[1] == es_unica and resultado[2] == mensaje
+    assert sesion.tipo_sistema == completo.tipo_sistema
+    assert sesion.columnas_pivote == completo.columnas_pivote
+    assert sesion.variables_libres == sorted(completo.variables_libres)
+    assert (sesion.rango_matriz, sesion.rango_aumentada) == (completo.rango_matriz, completo.rango_aumentada)
+    if solucion is None:
+        assert resultado[0] is None
+    else:
+        assert np.allclose(resultado[0], solucion)
+        assert np.allclose(sesion.matriz_reducida, completo.matriz_reducida[:sesion.rango_matriz])
+
+
+def test_igual_que_resolver_desde_cero():
+    """Tras cada ecuacion la clasificacion es la del sistema completo"""
+    generador = np.random.default_rng(20)
+    base = generador.integers(-4, 5, size=(4, 7)).astype(float)
+    matriz = generador.integers(-2, 3, size=(9, 4)) @ base  # Rango 4: muchas ecuaciones redundantes
+    x = generador.standard_normal(7)
+    vector = matriz @ x
+
+    sesion = SesionGaussJordan(7)
+    for k in range(len(matriz)):
+        resultado = sesion.agregar_ecuacion(matriz[k], vector[k])
+        _comparar_con_resolver(sesion, matriz[:k + 1], vector[:k + 1], resultado)
+    assert sesion.rango_matriz == 4 and len(sesion.ecuaciones_redundantes) == 5
+
+    # Completar hasta solucion unica
+    for k in range(7):
+        resultado = sesion.agregar_ecuacion(np.eye(7)[k], x[k])
+    assert sesion.tipo_sistema == "unico" and np.allclose(resultado[0], x)
+
+
+def test_inconsistencia_permanente():
+    """Una ecuacion 0 = c deja el sistema inconsistente aunque se agreguen pivotes"""
+    sesion = SesionGaussJordan(3, nivel_registro=REGISTRO_OPERACIONES)
+    sesion.agregar_ecuacion([1, 1, 0], 2)
+    solucion, es_unica, _ = sesion.agregar_ecuacion([2, 2, 0], 5)
+    assert solucion is None and not es_unica and sesion.tipo_sistema == "inconsistente"
+    assert "inconsistente" in sesion.operaciones[-1]
+
+    sesion.agregar_ecuacion([0, 0, 1], 1)
+    matriz = np.array([[1, 1, 0], [2, 2, 0], [0, 0, 1]], dtype=float)
+    _comparar_con_resolver(sesion, matriz, np.array([2, 5, 1.0]),
+                           (None, False, sesion._mensaje_sistema()))
+
+
+def test_continuar_desde_resolver():
+    """Se puede partir de un sistema resuelto de una vez y seguir agregando ecuaciones"""
+    generador = np.random.default_rng(21)
+    matriz = generador.standard_normal((6, 8))
+    vector = generador.standard_normal(6)
+    extra = generador.standard_normal((2, 8))
+    extra_b = generador.standard_normal(2)
+
+    sesion = SesionGaussJordan(8)
+    sesion.resolver(matriz, vector)
+    assert sesion.numero_ecuaciones == 6 and sesion.rango_matriz == 6
+    for fila, b in zip(extra, extra_b):
+        resultado = sesion.agregar_ecuacion(fila, b)
+    _comparar_con_resolver(sesion, np.vstack((matriz, extra)), np.r_[vector, extra_b], resultado)
+
+    assert sesion.agregar_ecuacion(np.ones(3), 1.0)[2].startswith("Dimensiones incompatibles")
+    assert sesion.numero_ecuaciones == 8
+
+
+def test_conserva_el_tipo_de_la_sesion():
+    """Filas float64 y terminos de Python no promueven una sesion float32"""
+    generador = np.random.default_rng(22)
+    matriz = generador.standard_normal((4, 4))
+    vector = generador.standard_normal(4)
+
+    sesion = SesionGaussJordan(4, dtype=np.float32)
+    for fila, b in zip(matriz, vector):
+        solucion, es_unica, _ = sesion.agregar_ecuacion(fila, float(b))
+    assert es_unica and solucion.dtype == np.float32 and sesion.matriz_reducida.dtype == np.float32
+    assert np.allclose(solucion, np.linalg.solve(matriz, vector), atol=1e-4)
+
+    # Un dato complejo si cambia la sesion, al complejo de la misma precision
+    sesion = SesionGaussJordan(2, dtype=np.float32)
+    sesion.agregar_ecuacion(np.array([1.0, 0.0]), 1j)
+    solucion, _, _ = sesion.agregar_ecuacion(np.array([0.0, 1.0]), 2.0)
+    assert solucion.dtype == np.complex64 and np.allclose(solucion, [1j, 2])
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Pruebas de Gauss-Jordan por lotes
+"""
+
+import numpy as np
+import pytest
+from gauss_jordan import GaussJordan
+from gauss_jordan_lotes import GaussJordanLotes
+from registro_pasos import REGISTRO_NINGUNO
+
+
+def test_lote_igual_a_resolver_uno_por_uno():
+    """Cada sistema del lote se clasifica y resuelve igual que con GaussJordan"""
+    generador = np.random.default_rng(7)
+    for m, n in [(3, 3), (4, 6), (6, 4), (8, 8)]:
+        N = 200
+        matrices = generador.integers(-3, 4, size=(N, m, n)).astype(float)
+        matrices[::3, :, -1] = matrices[::3, :, 0] - matrices[::3, :, 1]  # Columnas dependientes
+        vectores = generador.integers(-3, 4, size=(N, m)).astype(float)
+        vectores[::2] = np.einsum('kij,kj->ki', matrices[::2], generador.integers(-2, 3, size=(N, n))[::2])
+
+        lotes = GaussJordanLotes()
+        soluciones, tipos, rangos = lotes.resolver(matrices, vectores)
+
+        solver = GaussJordan(REGISTRO_NINGUNO)
+        for k in range(N):
+            solucion, _, _ = solver.resolver(matrices[k], vectores[k])
+            assert tipos[k] == solver.tipo_sistema
+            assert rangos[k] == solver.rango_matriz
+            assert list(np.flatnonzero(lotes.es_pivote[k])) == solver.columnas_pivote
+            if solucion is None:
+                assert np.isnan(soluciones[k]).all()
+            else:
+                assert np.allclose(soluciones[k], solucion)
+
+
+def test_dimensiones_incompatibles():
+    """Formas que no corresponden a un lote de sistemas"""
+    with pytest.raises(ValueError):
+        GaussJordanLotes().resolver(np.zeros((5, 3, 3)), np.zeros((5, 4)))
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Pruebas del análisis de independencia lineal
+"""
+
+import math
+from fractions import Fraction
+import numpy as np
+from independencia_lineal import IndependenciaIncremental, IndependenciaLineal, IndependenciaLotes
+from registro_pasos import REGISTRO_COMPLETO, REGISTRO_NINGUNO
+
+
+def _vectores_con_dependencias(n: int = 6, m: int = 5, semilla: int = 21) -> np.ndarray:
+    """Columnas v1..vm en R^n donde v3 = v1 + v2 y v5 = 2·v4"""
+    generador = np.random.default_rng(semilla)
+    vectores = generador.standard_normal((n, m))
+    vectores[:, 2] = vectores[:, 0] + vectores[:, 1]
+    vectores[:, 4] = 2 * vectores[:, 3]
+    return vectores
+
+
+def test_incremental_acepta_y_rechaza():
+    """Cada vector se decide al llegar; el rango acumulado coincide con matrix_rank"""
+    vectores = _vectores_con_dependencias()
+    analizador = IndependenciaIncremental(6)
+    decisiones = []
+    for j in range(vectores.shape[1]):
+        decisiones.append(analizador.agregar_vector(vectores[:, j]))
+        assert analizador.rango == np.linalg.matrix_rank(vectores[:, :j + 1])
+
+    assert decisiones == [True, True, False, True, False]
+    assert analizador.indices_dependientes == [2, 4] and analizador.indices_independientes == [0, 1, 3]
+    assert not analizador.es_independiente and analizador.num_vectores == 5
+
+    # La base reducida genera el mismo subespacio que los vectores aceptados
+    base = analizador.base_reducida
+    assert base.shape == (3, 6)
+    assert np.linalg.matrix_rank(np.vstack((base, vectores.T))) == 3
+
+    otro = IndependenciaIncremental(6)
+    assert otro.agregar_vectores(vectores) == decisiones
+    assert IndependenciaLineal().analizar_vectores(vectores)['rango'] == otro.rango
+
+
+def test_una_sola_eliminacion():
+    """Rango, determinante, log-det, pivotes y dependientes salen de la misma eliminación"""
+    generador = np.random.default_rng(22)
+    cuadrada = generador.standard_normal((6, 6))
+    resultado = IndependenciaLineal().analizar_vectores(cuadrada)
+    signo, log_det = np.linalg.slogdet(cuadrada)
+    assert resultado['es_independiente'] and resultado['rango'] == 6
+    assert np.isclose(resultado['determinante'], np.linalg.det(cuadrada))
+    assert resultado['signo_determinante'] == signo and np.isclose(resultado['log_determinante'], log_det)
+    assert resultado['columnas_pivote'] == [1, 2, 3, 4, 5, 6]
+
+    vectores = _vectores_con_dependencias()
+    resultado = IndependenciaLineal(nivel_registro=REGISTRO_NINGUNO).analizar_vectores(vectores)
+    assert resultado['rango'] == 3 and resultado['vectores_combinacion_lineal'] == [3, 5]
+    assert resultado['columnas_pivote'] == [1, 2, 4] and resultado['pasos_reduccion'] == []
+    assert len(IndependenciaLineal().analizar_vectores(vectores)['pasos_reduccion']) > 0
+
+    # Singular aunque |det| calculado no sea pequeño: lo decide |R_jj|, no el determinante
+    singular = generador.standard_normal((50, 50))
+    singular[:, 30] = singular[:, 4] - 2 * singular[:, 17]
+    resultado = IndependenciaLineal(nivel_registro=REGISTRO_NINGUNO).analizar_vectores(singular)
+    assert resultado['rango'] == 49 and resultado['vectores_combinacion_lineal'] == [31]
+    
+    # Sin desbordamiento en el logaritmo aunque el determinante sí se desborde
+    grande = 100 * np.eye(200) + generador.standard_normal((200, 200))
+    resultado = IndependenciaLineal().analizar_vectores(grande)
+    assert resultado['determinante'] == np.inf and resultado['es_independiente']
+    assert np.isclose(resultado['log_determinante'], np.linalg.slogdet(grande)[1])
+
+
+def test_determinante_entero_exacto():
+    """Con vectores enteros el determinante es exacto (eliminación modular)"""
+    vectores = np.array([[2, -1, 0], [-1, 2, -1], [0, -1, 2]], dtype=float)
+    resultado = IndependenciaLineal().analizar_vectores(vectores)
+    assert resultado['determinante'] == 4.0 and resultado['signo_determinante'] == 1
+    assert np.isclose(resultado['log_determinante'], np.log(4))
+
+    vectores[:, 2] = vectores[:, 0] + 3 * vectores[:, 1]
+    resultado = IndependenciaLineal().analizar_vectores(vectores)
+    assert resultado['determinante'] == 0 and not resultado['es_independiente']
+    assert resultado['vectores_combinacion_lineal'] == [3]
+
+    escala = 10**20  # El determinante no cabe en un float exacto
+    vectores = np.array([[escala, 1], [1, escala]], dtype=object)
+    resultado = IndependenciaLineal().analizar_vectores(vectores)
+    assert resultado['rango'] == 2 and resultado['signo_determinante'] == 1
+    assert resultado['log_determinante'] == math.log(escala**2 - 1)
+
+
+def test_lotes_igual_a_cada_conjunto():
+    """El análisis por lotes coincide con analizar cada conjunto por separado"""
+    generador = np.random.default_rng(23)
+    for forma in ((40, 4, 4), (40, 6, 3), (40, 3, 5)):
+        vectores = generador.standard_normal(forma)
+        vectores[::3, :, -1] = vectores[::3, :, 0] - vectores[::3, :, 1]  # Un tercio dependientes
+        lotes = IndependenciaLotes()
+        rangos, independientes, determinantes = lotes.analizar(vectores)
+        for k in range(forma[0]):
+            resultado = IndependenciaLineal(nivel_registro=REGISTRO_NINGUNO).analizar_vectores(vectores[k])
+            assert rangos[k] == resultado['rango']
+            assert independientes[k] == resultado['es_independiente']
+            assert list(np.flatnonzero(lotes.es_pivote[k]) + 1) == resultado['columnas_pivote']
+            if forma[1] == forma[2]:
+                assert np.isclose(determinantes[k], resultado['determinante'], atol=1e-12)
+            else:
+                assert np.isnan(determinantes[k])
+        if forma == (40, 4, 4):
+            reportes = lotes.obtener_reportes([0, 1])
+            assert "LINEALMENTE DEPENDIENTES" in reportes[0] and "LINEALMENTE INDEPENDIENTES" in reportes[1]
+        # La tolerancia es relativa a cada conjunto: escalar la pila no cambia los rangos
+        for escala in (1e-12, 1e8):
+            assert np.array_equal(IndependenciaLotes().analizar(escala * vectores)[0], rangos)
+
+
+def test_indice_generado():
+    """El índice decide la pertenencia y da coeficientes que reconstruyen el vector"""
+    vectores = _vectores_con_dependencias()
+    analizador = IndependenciaLineal()
+    analizador.analizar_vectores(vectores)
+    indice = analizador.crear_indice_generado()
+    assert indice.columnas == [1, 2, 4] and indice.rango == 3
+
+    generador = np.random.default_rng(24)
+    dentro = indice.base @ generador.standard_normal((3, 50))
+    fuera = generador.standard_normal((6, 50))
+    pertenece, coeficientes = indice.consultar(np.column_stack((dentro, fuera)))
+    assert pertenece[:50].all() and not pertenece[50:].any()
+    assert np.allclose(indice.base @ coeficientes[:, :50], dentro)
+
+    coeficientes = indice.coeficientes(vectores[:, 4])  # v5 es combinación de v1, v2 y v4
+    assert coeficientes is not None and np.allclose(indice.base @ coeficientes, vectores[:, 4])
+    assert indice.coeficientes(fuera[:, 0]) is None and indice.pertenece(np.zeros(6))
+
+
+def test_prefiltro_de_dependencias_triviales():
+    """Nulos, repetidos y múltiplos se apartan antes de eliminar sin cambiar el resultado"""
+    generador = np.random.default_rng(25)
+    base = generador.standard_normal((5, 3))
+    vectores = np.column_stack((base[:, 0], -2.5 * base[:, 0], base[:, 1], np.zeros(5),
+                                base[:, 2], base[:, 1]))
+    resultado = IndependenciaLineal(nivel_registro=REGISTRO_NINGUNO).analizar_vectores(vectores)
+    triviales = resultado['dependencias_triviales']
+    assert [(j, k) for j, k, _ in triviales] == [(2, 1), (4, None), (6, 3)]
+    assert np.isclose(triviales[0][2], -2.5) and triviales[2][2] == 1.0
+    assert resultado['columnas_pivote'] == [1, 3, 5] and resultado['vectores_combinacion_lineal'] == [2, 4, 6]
+    assert "v4 es el vector cero." in resultado['explicacion_detallada']
+
+    enteros = np.array([[2, 3, 1], [4, 1, 2], [6, 5, 3]])  # v3 = v1 / 2
+    resultado = IndependenciaLineal().analizar_vectores(enteros)
+    assert resultado['dependencias_triviales'] == [(3, 1, Fraction(1, 2))]
+    assert resultado['determinante'] == 0 and resultado['rango'] == 2
+
+
+def test_rango_independiente_de_la_escala():
+    """Multiplicar los vectores por una constante no cambia el rango ni los pivotes"""
+    generador = np.random.default_rng(26)
+    vectores = generador.standard_normal((6, 4)) @ generador.standard_normal((4, 6))  # Rango 4
+    muchos = generador.standard_normal((30, 2)) @ generador.standard_normal((2, 25))  # Deflación insuficiente
+    con_triviales = np.column_stack((vectores[:, :4], 3 * vectores[:, 0], np.zeros(6)))
+    for escala in (1e-12, 1.0, 1e8):
+        for nivel in (REGISTRO_NINGUNO, REGISTRO_COMPLETO):
+            resultado = IndependenciaLineal(nivel_registro=nivel).analizar_vectores(escala * vectores)
+            assert resultado['rango'] == 4 and not resultado['es_independiente']
+            assert resultado['columnas_pivote'] == [1, 2, 3, 4]
+            # Menos vectores que dimensiones: con pasos guardados el rango no sale de la reducción
+            alto = escala * np.vstack((vectores, vectores))[:, :5]
+            assert IndependenciaLineal(nivel_registro=nivel).analizar_vectores(alto)['rango'] == 4
+        assert IndependenciaLineal(nivel_registro=REGISTRO_NINGUNO).analizar_vectores(escala * muchos)['rango'] == 2
+        resultado = IndependenciaLineal(nivel_registro=REGISTRO_NINGUNO).analizar_vectores(escala * con_triviales)
+        assert [(j, k) for j, k, _ in resultado['dependencias_triviales']] == [(5, 1), (6, None)]
+        assert resultado['rango'] == 4
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la eliminación multimodular con reconstrucción CRT
+"""
+
+import numpy as np
+from fractions import Fraction
+from gauss_jordan import GaussJordan, METODO_EXACTO, METODO_MODULAR
+from independencia_lineal import IndependenciaLineal
+from modular_exacto import primo_modular, rango_modular, reconstruccion_racional, resolver_modular
+from registro_pasos import REGISTRO_NINGUNO
+
+
+def test_primos_y_reconstruccion():
+    """Primos de 31 bits distintos y reconstrucción racional desde el residuo"""
+    primos = [primo_modular(i) for i in range(5)]
+    assert primos[0] == 2**31 - 1
+    assert len(set(primos)) == 5 and all(p < 2**31 for p in primos)
+
+    M = primos[0] * primos[1]
+    for fraccion in (Fraction(-37, 91), Fraction(5), Fraction(12345, 678)):
+        residuo = fraccion.numerator * pow(fraccion.denominator, -1, M) % M
+        assert reconstruccion_racional(residuo, M) == fraccion
+
+
+def test_igual_que_bareiss():
+    """Mismo rango, columnas pivote y solución que el método exacto"""
+    generador = np.random.default_rng(37)
+    for prueba in range(40):
+        m, n = generador.integers(1, 9, size=2)
+        matriz = generador.integers(-4, 5, size=(m, n))
+        if n > 2:
+            matriz[:, -1] = matriz[:, 0] + 3 * matriz[:, 1]
+        vector = generador.integers(-4, 5, size=m)
+        if prueba % 2 == 0:
+            vector = matriz @ generador.integers(-2, 3, size=n)
+
+        exacto = GaussJordan(REGISTRO_NINGUNO, metodo=METODO_EXACTO)
+        esperada, _, _ = exacto.resolver(matriz, vector)
+        modular = GaussJordan(REGISTRO_NINGUNO, metodo=METODO_MODULAR)
+        solucion, _, _ = modular.resolver(matriz, vector)
+
+        assert modular.obtener_informacion_detallada() == exacto.obtener_informacion_detallada()
+        assert (solucion is None) == (esperada is None)
+        if solucion is not None:
+            assert list(solucion) == list(esperada)
+        assert rango_modular(matriz) == exacto.rango_matriz
+
+
+def test_enteros_grandes():
+    """Elementos mayores que int64 y soluciones con numeradores grandes"""
+    generador = np.random.default_rng(41)
+    n = 12
+    matriz = np.empty((n, n), dtype=object)
+    matriz[:] = [[int(v) * 10**20 + 1 for v in fila] for fila in generador.integers(-9, 10, size=(n, n))]
+    vector = np.array([Fraction(int(v), 3) for v in generador.integers(-9, 10, size=n)], dtype=object)
+
+    solucion, columnas_pivote, rango, rango_aumentada = resolver_modular(matriz, vector)
+
+    assert (rango, rango_aumentada, columnas_pivote) == (n, n, list(range(n)))
+    assert all(sum(a * x for a, x in zip(fila, solucion)) == b for fila, b in zip(matriz, vector))
+
+
+def test_rango_exacto_en_independencia():
+    """Rango de vectores enteros sin tolerancia: la SVD pierde el vector de escala 2^52"""
+    base = np.array([[1, 0], [0, 1], [1, 1]], dtype=float)
+    vectores = np.column_stack((base, base[:, 0] + base[:, 1]))
+    assert IndependenciaLineal().analizar_vectores(vectores)['rango'] == 2
+
+    escala = 2.0**52
+    vectores = np.array([[escala, escala], [1, 2], [0, 0]])
+    assert np.linalg.matrix_rank(vectores) == 1
+    assert IndependenciaLineal().analizar_vectores(vectores)['rango'] == 2
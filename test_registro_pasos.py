@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Pruebas del registro compacto de pasos
+"""
+
+import numpy as np
+from registro_pasos import RegistroPasos
+from gauss_elimination_mejorado import GaussEliminationMejorado
+from gauss_jordan import GaussJordan
+
+
+def test_reconstruccion_igual_a_copias():
+    """Cada paso reconstruido coincide con la copia completa que se habría guardado"""
+    generador = np.random.default_rng(0)
+    matriz = generador.standard_normal((5, 6))
+    registro = RegistroPasos(intervalo_control=3)
+    copias = []
+
+    registro.agregar(matriz, ('inicial',))
+    copias.append(matriz.copy())
+    for k in range(12):
+        i, j = generador.choice(5, size=2, replace=False)
+        if k % 3 == 0:
+            matriz[[i, j]] = matriz[[j, i]]
+            registro.agregar(matriz, ('intercambio', i, j))
+        elif k % 3 == 1:
+            divisor = matriz[i, 0]
+            matriz[i] = matriz[i] / divisor
+            registro.agregar(matriz, ('dividir', i, divisor))
+        else:
+            factor = matriz[i, 1]
+            matriz[i] = matriz[i] - factor * matriz[j]
+            registro.agregar(matriz, ('restar', i, j, factor))
+        copias.append(matriz.copy())
+
+    assert len(registro) == len(copias)
+    for reconstruida, copia in zip(registro, copias):
+        assert np.array_equal(reconstruida, copia)
+    for i in range(-len(copias), len(copias)):
+        assert np.array_equal(registro[i], copias[i])
+
+
+def test_pasos_del_solucionador():
+    """Los pares (matriz, operación) siguen disponibles desde get_steps"""
+    matriz = np.array([[2, 1, -1], [1, -1, 2], [3, 2, 1]], dtype=float)
+    vector = np.array([8, 0, 11], dtype=float)
+
+    solver = GaussEliminationMejorado()
+    solver.solve(matriz, vector)
+    pasos = solver.get_steps()
+
+    assert len(pasos) == min(len(solver.steps), len(solver.operations))
+    assert np.array_equal(pasos[0][0], np.column_stack((matriz, vector)))
+    assert [operacion for _, operacion in pasos] == solver.operations[:len(pasos)]
+    assert np.allclose(np.tril(pasos[-1][0][:, :3], -1), 0)
+
+
+def test_pivoteo_por_permutacion():
+    """Los intercambios solo mueven índices, pero los pasos se ven como con filas intercambiadas"""
+    generador = np.random.default_rng(19)
+    matriz = generador.standard_normal((7, 7))
+    vector = generador.standard_normal(7)
+    aumentada = np.column_stack((matriz, vector))
+
+    solver = GaussJordan()
+    solver.resolver(matriz, vector)
+    assert any(op.startswith("Intercambiar fila") for op in solver.operaciones)
+    assert len(solver.pasos) > 16  # Incluye copias de control tomadas tras intercambios
+    assert np.array_equal(solver.pasos[-1], solver.matriz_reducida)
+    assert sorted(solver.permutacion_filas) == list(range(7))
+
+    solver = GaussEliminationMejorado()
+    solver.solve(matriz, vector)
+    assert "Intercambiar fila 1 con fila" in solver.operations[2]
+    assert np.allclose(np.tril(solver.steps[-1][:, :7], -1), 0)
+    # El paso del primer intercambio muestra las filas ya intercambiadas
+    intercambiada = aumentada.copy()
+    intercambiada[[0, solver.row_permutation[0]]] = aumentada[[solver.row_permutation[0], 0]]
+    assert np.array_equal(solver.steps[1], intercambiada)
+
+    factorizacion = GaussEliminationMejorado().factorizar(matriz)
+    L = np.eye(7)
+    L[:, :factorizacion.rango] += np.tril(factorizacion.L, -1)
+    assert np.allclose(L @ factorizacion.U, matriz[factorizacion.permutacion])
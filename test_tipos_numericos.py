@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Pruebas del tipo de trabajo: float32 y complejos se conservan en todos los solucionadores
+"""
+
+import numpy as np
+from cache_eliminaciones import CacheEliminaciones
+from estructura_matriz import ESTRUCTURA_CHOLESKY, detectar_estructura
+from gauss_elimination import GaussElimination
+from gauss_elimination_banda import GaussEliminationBanda
+from gauss_elimination_mejorado import GaussEliminationMejorado, PRECISION_MIXED
+from gauss_jordan import GaussJordan, METODO_BLOQUES
+from gauss_jordan_disperso import GaussJordanDisperso
+from gauss_jordan_lotes import GaussJordanLotes
+from registro_pasos import REGISTRO_NINGUNO, REGISTRO_COMPLETO
+from tipos_numericos import matriz_aumentada, tipo_de_trabajo
+
+
+def _circuito_ac(n: int = 8, frecuencia: float = 50.0):
+    """Analisis nodal de una escalera RLC: admitancias complejas Y v = i"""
+    omega = 2 * np.pi * frecuencia
+    serie = 1 / (10.0 + 1j * omega * 0.01)  # Resistencia y bobina entre nodos
+    derivacion = 1j * omega * 1e-4 + 1 / 100.0  # Condensador y resistencia a tierra
+    Y = np.zeros((n, n), dtype=complex)
+    for k in range(n):
+        Y[k, k] += derivacion + serie * (2 if k < n - 1 else 1)
+        if k < n - 1:
+            Y[k, k + 1] = Y[k + 1, k] = -serie
+    corrientes = np.zeros(n, dtype=complex)
+    corrientes[0] = 1.0
+    return Y, corrientes
+
+
+def test_tipo_de_trabajo():
+    """Reglas de promocion y matriz aumentada con el tipo de trabajo"""
+    assert tipo_de_trabajo(np.ones(2, np.float32), np.ones(2, np.float32)) == np.float32
+    assert tipo_de_trabajo(np.ones(2, np.float32), np.ones(2, np.complex64)) == np.complex64
+    assert tipo_de_trabajo(np.ones(2, np.float32), np.ones(2)) == np.float64
+    assert tipo_de_trabajo(np.ones(2, int), np.ones(2, bool)) == np.float64
+    assert tipo_de_trabajo(np.ones(2, np.float16)) == np.float32
+    assert tipo_de_trabajo(np.ones(2, np.clongdouble)) == np.complex128
+
+    matriz = np.arange(6, dtype=np.float32).reshape(2, 3)
+    aumentada = matriz_aumentada(matriz, np.array([1, 2], dtype=np.float32))
+    assert aumentada.dtype == np.float32 and aumentada.flags.c_contiguous
+    assert np.array_equal(aumentada, [[0, 1, 2, 1], [3, 4, 5, 2]])
+
+
+def test_sistema_complejo_en_todos_los_solucionadores():
+    """Sistema de un circuito de corriente alterna resuelto en complex128"""
+    Y, corrientes = _circuito_ac()
+    esperada = np.linalg.solve(Y, corrientes)
+
+    soluciones = [
+        GaussJordan(REGISTRO_NINGUNO).resolver(Y, corrientes)[0],
+        GaussJordan(REGISTRO_COMPLETO).resolver(Y, corrientes)[0],
+        GaussJordan(REGISTRO_NINGUNO, metodo=METODO_BLOQUES, tam_bloque=3, usar_estructura=False).resolver(Y, corrientes)[0],
+        GaussElimination(REGISTRO_COMPLETO).solve(Y, corrientes)[0],
+        GaussEliminationMejorado(REGISTRO_NINGUNO).solve(Y, corrientes)[0],
+        GaussEliminationMejorado(REGISTRO_NINGUNO).factorizar(Y).resolver(corrientes)[0],
+        GaussEliminationBanda().solve(Y, corrientes)[0],
+        GaussJordanDisperso().resolver(Y, corrientes)[0],
+        GaussJordanLotes().resolver(Y[None], corrientes[None])[0][0],
+    ]
+    for solucion in soluciones:
+        assert solucion.dtype == np.complex128
+        assert np.allclose(solucion, esperada)
+
+    solver = GaussEliminationMejorado(REGISTRO_NINGUNO)
+    solucion, es_unica, _ = solver.solve_mixed_precision(Y, corrientes)
+    assert es_unica and solver.precision_used == PRECISION_MIXED
+    assert np.allclose(solucion, esperada, rtol=1e-12)
+
+
+def test_pivoteo_complejo_por_modulo():
+    """El pivote es el de mayor modulo aunque su parte real sea nula"""
+    matriz = np.array([[1, 1], [5j, 1]])
+    solver = GaussJordan(REGISTRO_COMPLETO)
+    solucion, es_unica, _ = solver.resolver(matriz, np.array([2, 1 + 5j]))
+    assert es_unica and np.allclose(solucion, [1, 1])
+    assert solver.operaciones[1] == "Intercambiar fila 1 con fila 2"
+
+    # Matriz hermitica definida positiva: ruta de Cholesky con L^H
+    hermitica = np.array([[4, 1 - 2j, 0], [1 + 2j, 6, 1j], [0, -1j, 5]])
+    assert detectar_estructura(hermitica)[0] == ESTRUCTURA_CHOLESKY
+    solver = GaussJordan(REGISTRO_NINGUNO)
+    solucion, _, _ = solver.resolver(hermitica, np.array([1, 2j, 3]))
+    assert solver.ruta_resolucion == ESTRUCTURA_CHOLESKY
+    assert np.allclose(hermitica @ solucion, [1, 2j, 3])
+
+
+def test_float32_se_conserva():
+    """Entradas float32 dan soluciones y matrices reducidas float32"""
+    generador = np.random.default_rng(59)
+    matriz = (generador.standard_normal((20, 20)) + 20 * np.eye(20)).astype(np.float32)
+    vector = matriz @ np.ones(20, dtype=np.float32)
+
+    solver = GaussJordan(REGISTRO_NINGUNO, usar_estructura=False)
+    solucion, _, _ = solver.resolver(matriz, vector)
+    assert solucion.dtype == np.float32 and solver.matriz_reducida.dtype == np.float32
+    assert np.allclose(solucion, 1, atol=1e-4)
+    assert GaussEliminationMejorado(REGISTRO_NINGUNO).solve(matriz, vector)[0].dtype == np.float32
+    assert GaussElimination(REGISTRO_NINGUNO).solve(matriz, vector)[0].dtype == np.float32
+
+    # La cache distingue el tipo: el mismo contenido en float64 es otra entrada
+    cache = CacheEliminaciones()
+    solver = GaussJordan(REGISTRO_NINGUNO, cache=cache)
+    solver.resolver(matriz, vector)
+    assert solver.resolver(matriz.astype(np.float64), vector.astype(np.float64))[0].dtype == np.float64
+    assert cache.estadisticas()['entradas'] == 2
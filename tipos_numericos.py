@@ -0,0 +1,65 @@
+"""
+Tipos numericos de trabajo
+Eleccion del dtype en que operan los solucionadores y construccion de la matriz
+aumentada con una sola copia
+"""
+
+import numpy as np
+from typing import Optional
+
+# Tipos que se conservan tal cual; el resto se promueve (ver tipo_de_trabajo)
+TIPOS_CONSERVADOS = (np.dtype(np.float32), np.dtype(np.float64),
+                     np.dtype(np.complex64), np.dtype(np.complex128))
+
+
+def tipo_de_trabajo(*arreglos) -> np.dtype:
+    """
+    Tipo en que se resuelve un sistema con estos datos.
+
+    float32, float64, complex64 y complex128 se conservan (se combinan con las
+    reglas de promocion de NumPy: float32 con complex64 da complex64, float32 con
+    float64 da float64). Enteros, booleanos y objetos pasan a float64; float16 a
+    float32; los tipos extendidos (longdouble) al tipo de 64/128 bits que LAPACK
+    admite.
+
+    Args:
+        arreglos: Matrices, vectores o escalares de entrada
+
+    Returns:
+        dtype de trabajo
+    """
+    tipos = [np.asarray(a).dtype for a in arreglos]
+    tipo = np.result_type(*tipos) if tipos else np.dtype(np.float64)
+    if tipo in TIPOS_CONSERVADOS:
+        return tipo
+    if tipo.kind == 'c':
+        return np.dtype(np.complex128)
+    if tipo.kind == 'f' and tipo.itemsize < 4:
+        return np.dtype(np.float32)
+    return np.dtype(np.float64)
+
+
+def matriz_aumentada(matriz: np.ndarray, lados: np.ndarray, dtype: Optional[np.dtype] = None,
+                     destino: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Construye [A | B] en el tipo de trabajo con una sola copia de los datos
+    (column_stack seguido de astype hace dos).
+
+    Args:
+        matriz: Matriz de coeficientes A (m x n)
+        lados: Vector b (m) o bloque B (m x k)
+        dtype: Tipo del resultado (None usa tipo_de_trabajo(matriz, lados))
+        destino: Arreglo (m x (n + k)) ya reservado donde escribir el resultado
+
+    Returns:
+        Matriz aumentada (destino, o una nueva contigua por filas)
+    """
+    matriz = np.asarray(matriz)
+    lados = np.asarray(lados)
+    tipo = tipo_de_trabajo(matriz, lados) if dtype is None else np.dtype(dtype)
+    m, n = matriz.shape
+    lados = lados.reshape(m, -1)
+    aumentada = np.empty((m, n + lados.shape[1]), dtype=tipo) if destino is None else destino
+    aumentada[:, :n] = matriz
+    aumentada[:, n:] = lados
+    return aumentada